@@ -0,0 +1,117 @@
+"""
+Banderas (códigos de condición) de la máquina virtual con evaluación perezosa.
+
+Las instrucciones aritméticas y de comparación solo registran la operación, sus
+operandos y el resultado. Cada bandera se calcula la primera vez que alguien la lee
+(un salto condicional, CMP o la interfaz) y queda en caché hasta la siguiente operación.
+
+Semántica común (palabras con signo de 21 bits, rango [-2^20, 2^20 - 1]):
+
+    Z (cero)            resultado == 0. En CMP y saltos: a == b.
+    N (negativo)        resultado < 0.  En CMP y saltos: a < b.
+    C (acarreo)         ADD, MUL: el resultado no cabe en 21 bits.
+                        SUB, CMP y saltos: hubo préstamo (a < b).
+                        DIV: 0.
+    V (desbordamiento)  el resultado está fuera del rango con signo de 21 bits.
+                        DIV: división entre cero.
+
+CMP y los saltos condicionales (BEQ, BNE, BLT, JLE) registran la comparación
+a - b, por lo que dejan las banderas igual que CMP.
+"""
+
+MAX_VALOR = 2**20 - 1  # 1048575
+MIN_VALOR = -2**20     # -1048576
+
+# Operaciones que se registran como comparación de sus operandos
+OPERACIONES_COMPARACION = ("CMP", "SUB")
+
+
+def _es_numero(valor):
+    return isinstance(valor, (int, float))
+
+
+def _fuera_de_rango(valor):
+    return _es_numero(valor) and (valor > MAX_VALOR or valor < MIN_VALOR)
+
+
+class Banderas:
+    """
+    Registro de la última operación de la ALU y cálculo perezoso de Z, N, C y V.
+    """
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Deja todas las banderas en 0."""
+        self.operacion = None
+        self.a = 0
+        self.b = 0
+        self.resultado = 0
+        self.cache = {"zero": 0, "negative": 0, "carry": 0, "desbordamiento": 0}
+
+    def registrar(self, operacion, a, b, resultado=None):
+        """
+        Registra la última operación; no calcula ninguna bandera.
+
+        @param operacion: Nombre de la instrucción (ADD, SUB, MUL, DIV, CMP)
+        @param a: Primer operando
+        @param b: Segundo operando
+        @param resultado: Resultado de la operación (en CMP se omite)
+        """
+        self.operacion = operacion
+        self.a = a
+        self.b = b
+        self.resultado = resultado
+        self.cache = {}
+
+    def _comparacion(self):
+        return self.operacion == "CMP" or self.resultado is None
+
+    def _calcular(self, nombre):
+        operacion, a, b, resultado = self.operacion, self.a, self.b, self.resultado
+        comparacion = self._comparacion()
+        if nombre == "zero":
+            return int(a == b) if comparacion else int(resultado == 0)
+        if nombre == "negative":
+            if comparacion:
+                return int(a < b)
+            return int(_es_numero(resultado) and resultado < 0)
+        if nombre == "carry":
+            if comparacion or operacion in OPERACIONES_COMPARACION:
+                return int(a < b)
+            if operacion == "DIV":
+                return 0
+            return int(_fuera_de_rango(resultado))
+        # desbordamiento
+        if operacion == "DIV":
+            return int(b == 0)
+        if comparacion:
+            return int(_es_numero(a) and _es_numero(b) and _fuera_de_rango(a - b))
+        return int(_fuera_de_rango(resultado))
+
+    def _leer(self, nombre):
+        valor = self.cache.get(nombre)
+        if valor is None:
+            valor = self._calcular(nombre)
+            self.cache[nombre] = valor
+        return valor
+
+    @property
+    def zero(self):
+        return self._leer("zero")
+
+    @property
+    def negative(self):
+        return self._leer("negative")
+
+    @property
+    def carry(self):
+        return self._leer("carry")
+
+    @property
+    def desbordamiento(self):
+        return self._leer("desbordamiento")
+
+    def valores(self):
+        """Materializa las cuatro banderas: (carry, zero, negative, desbordamiento)."""
+        return self.carry, self.zero, self.negative, self.desbordamiento
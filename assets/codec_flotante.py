@@ -0,0 +1,173 @@
+"""
+Codec rápido para el formato flotante de 21 bits de la máquina virtual:
+1 bit de signo, 10 bits de numerador y 10 bits de denominador.
+
+La codificación equivale bit a bit a
+`Fraction(abs(valor)).limit_denominator(1023)` (con el numerador truncado a 10 bits),
+pero sin construir objetos `Fraction`: la parte fraccionaria se ubica en una tabla
+precalculada de la sucesión de Farey de orden 1023 y los empates se resuelven con
+el mismo algoritmo de fracciones continuas que usa `limit_denominator`.
+
+Rendimiento: la meta de 20x sobre la versión con `Fraction` solo se cumple con
+aciertos de la caché LRU (unos 0.17us por valor), el caso común en ciclos que
+convergen como sqrt. Un valor que no está en la caché cuesta unos 1.7us frente a
+unos 10us de `Fraction`, cerca de 6x: el costo restante es el del intérprete
+(llamadas, aritmética con objetos float e índices en la tabla), y ni un índice por
+cubetas en lugar de la bisección ni escribir todo en una sola función lo reducen de
+forma apreciable.
+"""
+import math
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
+
+MAX_DENOMINADOR = 1023  # Máximo denominador representable en 10 bits
+MASCARA_10 = 0x3FF
+# Margen bajo el cual una distancia calculada con doubles no es concluyente.
+# Los vecinos de Farey de orden 1023 distan al menos 1/(1023*1022) ~ 1e-6.
+_EPSILON = 1e-12
+
+# Tabla de Farey (valores, numeradores, denominadores), construida en el primer uso
+_farey = None
+
+
+def _construir_farey(n=MAX_DENOMINADOR):
+    """
+    Genera la sucesión de Farey de orden `n` en [0, 1] en orden ascendente.
+
+    @return: Tupla (valores como double, numeradores, denominadores)
+    """
+    valores = array('d', [0.0])
+    numeradores = array('H', [0])
+    denominadores = array('H', [1])
+    a, b, c, d = 0, 1, 1, n
+    while c <= n:
+        k = (n + b) // d
+        a, b, c, d = c, d, k * c - a, k * d - b
+        valores.append(a / b)
+        numeradores.append(a)
+        denominadores.append(b)
+    return valores, numeradores, denominadores
+
+
+def _tabla_farey():
+    global _farey
+    if _farey is None:
+        _farey = _construir_farey()
+    return _farey
+
+
+def _limitar_denominador(num, den, maximo=MAX_DENOMINADOR):
+    """
+    Réplica con enteros de `Fraction(num, den).limit_denominator(maximo)`.
+    Solo se usa para desempatar cuando el valor está justo entre dos vecinos de Farey.
+
+    @return: Tupla (numerador, denominador)
+    """
+    if den <= maximo:
+        return num, den
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = num, den
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > maximo:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    k = (maximo - q0) // q1
+    if 2 * d * (q0 + k * q1) <= den:
+        return p1, q1
+    return p0 + k * p1, q0 + k * q1
+
+
+def mejor_racional(valor):
+    """
+    Obtiene la fracción más cercana a `valor` (no negativo) con denominador <= 1023.
+
+    Se busca la parte fraccionaria en la tabla de Farey y se elige el vecino más
+    cercano; si el valor queda demasiado cerca de un vecino o del punto medio entre
+    ambos para decidir con doubles, se resuelve con aritmética entera exacta.
+
+    @param valor: Flotante no negativo
+    @return: Tupla (numerador, denominador) igual a la de `limit_denominator(1023)`
+    """
+    entero = int(valor)
+    fraccion = valor - entero  # Exacto para cualquier double finito
+    if fraccion == 0.0:
+        return entero, 1
+
+    valores, numeradores, denominadores = _tabla_farey()
+    i = bisect_left(valores, fraccion)
+    izquierda = fraccion - valores[i - 1]
+    derecha = valores[i] - fraccion
+    if izquierda > _EPSILON and derecha > _EPSILON and abs(izquierda - derecha) > _EPSILON:
+        j = i - 1 if izquierda < derecha else i
+        q = denominadores[j]
+        return entero * q + numeradores[j], q
+    return _mejor_racional_exacto(valor, entero, fraccion, i)
+
+
+def _mejor_racional_exacto(valor, entero, fraccion, i):
+    """
+    Variante de `mejor_racional` con comparaciones exactas sobre enteros.
+
+    @param i: Índice aproximado de la tabla de Farey obtenido por bisección
+    """
+    fn, fd = fraccion.as_integer_ratio()
+    if fd <= MAX_DENOMINADOR:
+        # El valor ya es representable (0.5, 0.25, ...)
+        return entero * fd + fn, fd
+
+    valores, numeradores, denominadores = _tabla_farey()
+    # Ajustar para que numeradores[i-1]/denominadores[i-1] < fraccion < numeradores[i]/denominadores[i]
+    while numeradores[i] * fd < fn * denominadores[i]:
+        i += 1
+    while numeradores[i - 1] * fd > fn * denominadores[i - 1]:
+        i -= 1
+    a, b = numeradores[i - 1], denominadores[i - 1]
+    c, d = numeradores[i], denominadores[i]
+
+    izquierda = (fn * b - a * fd) * d
+    derecha = (c * fd - fn * d) * b
+    if izquierda < derecha:
+        p, q = a, b
+    elif derecha < izquierda:
+        p, q = c, d
+    else:
+        num, den = valor.as_integer_ratio()
+        return _limitar_denominador(num, den)
+    return entero * q + p, q
+
+
+@lru_cache(maxsize=4096)
+def codificar_flotante(valor):
+    """
+    Codifica un flotante en el entero de 21 bits del formato racional.
+
+    @param valor: Flotante a codificar
+    @return: Entero con signo (bit 20), numerador (bits 19-10) y denominador (bits 9-0)
+    @raises ValueError: Si el valor es infinito o NaN
+    """
+    signo = 0 if valor >= 0 else 1
+    if isinstance(valor, int):
+        numerador, denominador = abs(valor), 1
+    elif not math.isfinite(valor):
+        raise ValueError(f"No se puede representar {valor} como fracción")
+    else:
+        numerador, denominador = mejor_racional(abs(valor))
+    return (signo << 20) | ((numerador & MASCARA_10) << 10) | (denominador & MASCARA_10)
+
+
+def decodificar_flotante(carga):
+    """
+    Decodifica el entero de 21 bits del formato racional en un flotante.
+    Un denominador 0 se interpreta como 1, igual que en la versión con cadenas.
+
+    @param carga: Entero de 21 bits
+    @return: Flotante equivalente
+    """
+    numerador = (carga >> 10) & MASCARA_10
+    denominador = (carga & MASCARA_10) or 1
+    valor = numerador / denominador
+    return -valor if carga >> 20 else valor
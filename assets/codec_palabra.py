@@ -0,0 +1,182 @@
+"""
+Codec de palabras de 32 bits de la máquina virtual usando aritmética entera.
+
+Una palabra de dato tiene la forma
+    [5 bits de prefijo/opcode][6 bits de tipo][21 bits de carga]
+y se maneja siempre como `int`; las cadenas de '0'/'1' solo se generan para
+mostrarlas en la interfaz (`palabra_a_texto`).
+"""
+from assets.codec_flotante import codificar_flotante, decodificar_flotante
+
+BITS_PALABRA = 32
+BITS_PREFIJO = 5
+BITS_TIPO = 6
+BITS_CARGA = 21
+
+DESPLAZAMIENTO_PREFIJO = BITS_TIPO + BITS_CARGA  # 27
+DESPLAZAMIENTO_TIPO = BITS_CARGA  # 21
+
+MASCARA_PREFIJO = (1 << BITS_PREFIJO) - 1
+MASCARA_TIPO = (1 << BITS_TIPO) - 1
+MASCARA_CARGA = (1 << BITS_CARGA) - 1
+MASCARA_RESTO = (1 << DESPLAZAMIENTO_PREFIJO) - 1  # 27 bits tras el prefijo
+
+# Etiquetas de tipo (6 bits)
+TIPO_BOOLEANO = 1
+TIPO_NATURAL = 2
+TIPO_ENTERO = 3
+TIPO_FLOTANTE = 4
+TIPO_CARACTER = 5
+
+BIT_SIGNO_CARGA = 1 << (BITS_CARGA - 1)
+
+
+def empaquetar(tipo, carga, prefijo=0):
+    """
+    Construye una palabra a partir de sus tres campos.
+
+    @param tipo: Etiqueta de tipo (6 bits)
+    @param carga: Carga útil (21 bits)
+    @param prefijo: Opcode o prefijo (5 bits), 0 para datos
+    @return: Palabra de 32 bits como entero
+    """
+    return (((prefijo & MASCARA_PREFIJO) << DESPLAZAMIENTO_PREFIJO)
+            | ((tipo & MASCARA_TIPO) << DESPLAZAMIENTO_TIPO)
+            | (carga & MASCARA_CARGA))
+
+
+def desempaquetar(palabra):
+    """
+    Separa una palabra en sus campos.
+
+    @param palabra: Palabra de 32 bits como entero
+    @return: Tupla (prefijo, tipo, carga)
+    """
+    return (palabra >> DESPLAZAMIENTO_PREFIJO,
+            (palabra >> DESPLAZAMIENTO_TIPO) & MASCARA_TIPO,
+            palabra & MASCARA_CARGA)
+
+
+# --- Codificación ---
+
+def _codificar_booleano(dato):
+    return (TIPO_BOOLEANO << DESPLAZAMIENTO_TIPO) | (1 if dato else 0)
+
+
+def _codificar_entero(dato):
+    if dato >= 0:
+        return (TIPO_NATURAL << DESPLAZAMIENTO_TIPO) | (dato & MASCARA_CARGA)
+    # Complemento a dos en 21 bits para los negativos
+    return (TIPO_ENTERO << DESPLAZAMIENTO_TIPO) | (dato & MASCARA_CARGA)
+
+
+def _codificar_flotante(dato):
+    return (TIPO_FLOTANTE << DESPLAZAMIENTO_TIPO) | codificar_flotante(dato)
+
+
+def _codificar_caracter(dato):
+    if len(dato) != 1:
+        raise ValueError("Tipo de dato no soportado o formato incorrecto.")
+    return (TIPO_CARACTER << DESPLAZAMIENTO_TIPO) | (ord(dato) & MASCARA_CARGA)
+
+
+# Despacho por tipo exacto; evita la cadena de isinstance en el caso común
+_CODIFICADORES = {
+    bool: _codificar_booleano,
+    int: _codificar_entero,
+    float: _codificar_flotante,
+    str: _codificar_caracter,
+}
+
+
+def codificar_dato(dato):
+    """
+    Codifica un valor de Python en una palabra de dato (prefijo 00000).
+    Equivale a `ConvertirDatoBinario`, pero devuelve un entero.
+
+    @param dato: bool, int, float o str de un carácter
+    @return: Palabra de 32 bits como entero
+    """
+    codificador = _CODIFICADORES.get(type(dato))
+    if codificador is None:
+        # Subclases (p. ej. tipos numéricos de otras bibliotecas)
+        for clase in (bool, int, float, str):
+            if isinstance(dato, clase):
+                codificador = _CODIFICADORES[clase]
+                break
+        else:
+            raise ValueError("Tipo de dato no soportado o formato incorrecto.")
+    return codificador(dato)
+
+
+def codificar_lote(datos):
+    """Codifica una secuencia de valores; devuelve la lista de palabras."""
+    codificadores = _CODIFICADORES
+    return [codificadores[type(dato)](dato) if type(dato) in codificadores else codificar_dato(dato)
+            for dato in datos]
+
+
+# --- Decodificación ---
+
+def decodificar_booleano(carga):
+    return carga == 1
+
+
+def decodificar_natural(carga):
+    return carga
+
+
+def decodificar_entero(carga):
+    """Interpreta la carga como entero con signo en complemento a dos de 21 bits."""
+    return carga - (1 << BITS_CARGA) if carga & BIT_SIGNO_CARGA else carga
+
+
+def decodificar_caracter(carga):
+    if carga <= 0x10FFFF:
+        return chr(carga)
+    raise ValueError("El valor binario está fuera del rango UTF-16 válido.")
+
+
+DECODIFICADORES = {
+    TIPO_BOOLEANO: decodificar_booleano,
+    TIPO_NATURAL: decodificar_natural,
+    TIPO_ENTERO: decodificar_entero,
+    TIPO_FLOTANTE: decodificar_flotante,
+    TIPO_CARACTER: decodificar_caracter,
+}
+
+
+def decodificar_dato(palabra):
+    """
+    Decodifica una palabra de dato según su etiqueta de tipo.
+
+    @param palabra: Palabra de 32 bits como entero (se ignora el prefijo)
+    @return: Valor de Python correspondiente
+    @raises ValueError: Si la etiqueta de tipo no es válida
+    """
+    decodificador = DECODIFICADORES.get((palabra >> DESPLAZAMIENTO_TIPO) & MASCARA_TIPO)
+    if decodificador is None:
+        raise ValueError("Tipo de dato desconocido en la palabra.")
+    return decodificador(palabra & MASCARA_CARGA)
+
+
+def decodificar_lote(palabras):
+    """Decodifica una secuencia de palabras de dato; devuelve la lista de valores."""
+    return [decodificar_dato(palabra) for palabra in palabras]
+
+
+# --- Conversión para mostrar ---
+
+def palabra_a_texto(palabra):
+    """Representación de 32 caracteres '0'/'1' de una palabra (solo para mostrar)."""
+    return format(palabra & 0xFFFFFFFF, '032b')
+
+
+def texto_a_palabra(valor):
+    """
+    Normaliza el contenido de una celda de memoria a entero. Acepta palabras ya
+    enteras o el texto binario que producen el ensamblador y el enlazador.
+    """
+    if type(valor) is int:
+        return valor
+    return int(str(valor).strip() or "0", 2)
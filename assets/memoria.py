@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import QTableWidgetItem
 from PyQt5.QtGui import QColor
+from assets.codec_palabra import palabra_a_texto
 
 
 class Memoria:
@@ -9,6 +10,7 @@ class Memoria:
         self.cp = 0  # Inicializamos el Contador de Programa
         self.stack_size = 100  # Los últimos 30 registros son parte de la pila
         self.stack_start = len(self.memoria) - self.stack_size
+        self.imagen = range(0)  # Celdas del último programa cargado con load_image
 
         # Configurar la tabla en la UI
         self.ui.table_memoria.setColumnCount(1)
@@ -32,8 +34,7 @@ class Memoria:
         self.ui.table_memoria.setRowCount(len(self.memoria))
 
         for fila, (direccion, valor) in enumerate(sorted(self.memoria.items())):
-            self.ui.table_memoria.setItem(fila, 0, QTableWidgetItem(str(valor)))
-            item = QTableWidgetItem(str(valor))
+            item = QTableWidgetItem(self.texto_celda(direccion, valor))
             # Resaltar la fila si es la dirección de `cp`
             if direccion == self.cp:
                 item.setBackground(QColor(255, 255, 0))  # Amarillo
@@ -52,6 +53,12 @@ class Memoria:
             self.ui.table_pila.setItem(i, 0, item)
 
 
+    def texto_celda(self, direccion, valor):
+        """Texto a mostrar para una celda; las palabras enteras se muestran en binario."""
+        if type(valor) is int and valor != 0 and direccion < self.stack_start:
+            return palabra_a_texto(valor)
+        return str(valor)
+
     def escribir_memoria(self, direccion, valor):
         """Escribe un valor en la memoria, no puede escribir en la pila."""
         if 0 <= direccion < self.stack_start:  # Si no es parte de la pila
@@ -63,6 +70,50 @@ class Memoria:
         else:
             print(f"Error: No se puede escribir en la pila en la dirección {direccion}")
 
+    def load_image(self, base, words):
+        """
+        Carga un programa completo (una palabra por celda desde `base`) y refresca
+        la tabla una sola vez. Un elemento con `tamano` y `valor` (src/enlazador.Reserva)
+        ocupa `tamano` celdas, que se llenan todas con `valor` sin recorrer la imagen.
+        Devuelve cuántas celdas se escribieron; no escribe en la pila ni fuera de la memoria.
+        Las celdas cargadas quedan en `imagen` (ver `fin_de_programa`).
+        """
+        escritas = 0
+        limite = len(self.memoria)
+        direccion = base
+        for valor in words:
+            if direccion >= limite:
+                break
+            tamano = getattr(valor, "tamano", None)
+            if tamano is not None:
+                fin = min(direccion + tamano, self.stack_start)
+                if fin < direccion + tamano:
+                    print(f"Error: No se puede escribir en la pila en la dirección {max(fin, direccion)}")
+                if direccion < fin:
+                    self.memoria.update(dict.fromkeys(range(max(direccion, 0), fin), valor.valor))
+                    escritas += fin - max(direccion, 0)
+                direccion += tamano
+                continue
+            if not 0 <= direccion < self.stack_start:
+                print(f"Error: No se puede escribir en la pila en la dirección {direccion}")
+            elif valor == 0:
+                self.memoria.pop(direccion, None)  # Igual que escribir_memoria: 0 no se guarda
+                escritas += 1
+            else:
+                self.memoria[direccion] = valor
+                escritas += 1
+            direccion += 1
+        self.imagen = range(base, min(direccion, self.stack_start))
+        self.actualizar_memoria_ui()
+        return escritas
+
+    def fin_de_programa(self, direccion):
+        """
+        Si la ejecución continua termina en `direccion`: una celda en 0 fuera del
+        programa cargado. Dentro del programa la palabra 0 es un NOP y se ejecuta.
+        """
+        return direccion not in self.imagen and self.memoria.get(direccion, 0) == 0
+
     def leer_memoria(self, direccion):
         """Lee un valor de la memoria."""
         return self.memoria.get(direccion, 0)  # Devuelve 0 si no está guardado
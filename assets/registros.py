@@ -0,0 +1,92 @@
+from assets.codec_palabra import (TIPO_BOOLEANO, TIPO_NATURAL, TIPO_ENTERO,
+                                  TIPO_FLOTANTE, TIPO_CARACTER)
+from assets.IdentificarDato import int_to_bin16, float_to_bin16
+
+TIPO_DESCONOCIDO = 0
+
+
+def etiqueta_de(valor):
+    """
+    Obtiene la etiqueta de tipo (la misma de las palabras de dato) de un valor de registro.
+    Se consulta primero el tipo exacto y solo se recurre a isinstance para subclases.
+    """
+    clase = type(valor)
+    if clase is int:
+        return TIPO_NATURAL if valor >= 0 else TIPO_ENTERO
+    if clase is float:
+        return TIPO_FLOTANTE
+    if clase is bool:
+        return TIPO_BOOLEANO
+    if clase is str:
+        return TIPO_CARACTER if len(valor) == 1 else TIPO_DESCONOCIDO
+    if isinstance(valor, bool):
+        return TIPO_BOOLEANO
+    if isinstance(valor, int):
+        return TIPO_NATURAL if valor >= 0 else TIPO_ENTERO
+    if isinstance(valor, float):
+        return TIPO_FLOTANTE
+    return TIPO_DESCONOCIDO
+
+
+# Representación binaria de 16 bits que muestra la interfaz, según la etiqueta
+_RENDERIZADORES = {
+    TIPO_BOOLEANO: lambda valor: int_to_bin16(int(valor)),
+    TIPO_NATURAL: int_to_bin16,
+    TIPO_ENTERO: int_to_bin16,
+    TIPO_FLOTANTE: float_to_bin16,
+    TIPO_CARACTER: lambda valor: int_to_bin16(ord(valor)),
+}
+
+
+class BancoRegistros:
+    """
+    Banco de registros de propósito general de la máquina virtual.
+
+    Cada registro guarda el par (etiqueta de tipo, valor); la etiqueta se calcula una
+    sola vez al escribir. El valor es el de Python y no la carga de 21 bits de la
+    palabra: las operaciones de la máquina y las banderas lo usan tal cual, y un
+    registro conserva la precisión que pierde un flotante al guardarse en memoria. Solo se marca como pendiente de mostrar el registro que
+    cambió, y su representación binaria se calcula cuando la vista la pide.
+    """
+    def __init__(self, cantidad=4):
+        self.tipos = [TIPO_NATURAL] * cantidad
+        self.valores = [0] * cantidad
+        self.binarios = [None] * cantidad  # Caché de la representación binaria
+        self.sucios = set(range(cantidad))  # Registros pendientes de mostrar
+
+    def __len__(self):
+        return len(self.valores)
+
+    def __getitem__(self, indice):
+        return self.valores[indice]
+
+    def __setitem__(self, indice, valor):
+        self.escribir(indice, valor)
+
+    def __iter__(self):
+        return iter(self.valores)
+
+    def escribir(self, indice, valor):
+        """Escribe un valor en un registro y lo marca como pendiente de mostrar."""
+        self.tipos[indice] = etiqueta_de(valor)
+        self.valores[indice] = valor
+        self.binarios[indice] = None
+        self.sucios.add(indice)
+
+    def tipo(self, indice):
+        return self.tipos[indice]
+
+    def binario(self, indice):
+        """Representación binaria de 16 bits del registro, calculada solo si hace falta."""
+        binario = self.binarios[indice]
+        if binario is None:
+            renderizador = _RENDERIZADORES.get(self.tipos[indice])
+            binario = renderizador(self.valores[indice]) if renderizador else "ERROR"
+            self.binarios[indice] = binario
+        return binario
+
+    def tomar_sucios(self):
+        """Devuelve (en orden) los registros modificados desde la última consulta."""
+        sucios = sorted(self.sucios)
+        self.sucios.clear()
+        return sucios
@@ -0,0 +1,90 @@
+class SalidaConsola:
+    """
+    Sumidero que agrega los valores a un widget de texto de la interfaz (QTextEdit).
+    Cada lote se agrega con una sola llamada para no redibujar el widget por valor.
+    """
+    def __init__(self, widget):
+        self.widget = widget
+
+    def escribir_lote(self, valores):
+        self.widget.append("\n".join(str(valor) for valor in valores))
+
+
+class SalidaArchivo:
+    """
+    Sumidero que escribe cada valor en una línea de un archivo de texto.
+    """
+    def __init__(self, ruta, modo="a"):
+        self.ruta = ruta
+        if modo == "w":
+            # Truncar una sola vez; los lotes siguientes se agregan al final
+            open(self.ruta, "w", encoding="utf-8").close()
+
+    def escribir_lote(self, valores):
+        with open(self.ruta, "a", encoding="utf-8") as archivo:
+            archivo.write("".join(f"{valor}\n" for valor in valores))
+
+
+class SalidaLista:
+    """
+    Sumidero en memoria; conserva los valores con su tipo original (útil para pruebas).
+    """
+    def __init__(self):
+        self.valores = []
+
+    def escribir_lote(self, valores):
+        self.valores.extend(valores)
+
+
+class SalidaCallback:
+    """
+    Sumidero que entrega cada lote (lista de valores) a una función arbitraria.
+    """
+    def __init__(self, funcion):
+        self.funcion = funcion
+
+    def escribir_lote(self, valores):
+        self.funcion(list(valores))
+
+
+class CanalSalida:
+    """
+    Canal de salida de la máquina virtual para la instrucción OUT.
+
+    Los valores se acumulan en un buffer con su tipo (int, float, bool, str) y se
+    entregan por lotes a todos los sumideros configurados, ya sea cuando el buffer
+    alcanza `tamano_lote` o cuando se llama explícitamente a `vaciar()`.
+    """
+    def __init__(self, sumideros=None, tamano_lote=256):
+        self.sumideros = list(sumideros) if sumideros else []
+        self.tamano_lote = tamano_lote
+        self.buffer = []
+
+    def agregar_sumidero(self, sumidero):
+        self.sumideros.append(sumidero)
+
+    def quitar_sumidero(self, sumidero):
+        if sumidero in self.sumideros:
+            self.sumideros.remove(sumidero)
+
+    def escribir(self, valor):
+        """Agrega un valor al buffer y lo vacía si se llenó el lote."""
+        self.buffer.append(valor)
+        if len(self.buffer) >= self.tamano_lote:
+            self.vaciar()
+
+    def vaciar(self):
+        """Entrega los valores pendientes a todos los sumideros."""
+        if not self.buffer:
+            return
+        lote = self.buffer
+        self.buffer = []
+        for sumidero in self.sumideros:
+            sumidero.escribir_lote(lote)
+
+    def descartar(self):
+        """Elimina los valores pendientes sin entregarlos."""
+        self.buffer = []
+
+    def __len__(self):
+        return len(self.buffer)
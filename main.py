@@ -1,16 +1,28 @@
 import sys
-import struct
-import time
-import tempfile
 from assets.memoria import Memoria
-from assets.IdentificarDato import GetEntero, GetFloat, GetNatural, GetBooleano, GetCaracterUtf16, int_to_bin16, float_to_bin16, ConvertirDatoBinario
+from assets.salida import CanalSalida, SalidaConsola
+from assets.registros import BancoRegistros
+from assets.banderas import Banderas
+from src.TAC import tac_to_assembly, formatear_asm, version_traductor
+from src.optimizador import NIVEL_POR_DEFECTO, NIVELES
+from src.ensamblador import ensamblar_texto
+from src.enlazador import enlazar_texto, imagen_memoria
+from src.servidores import SupervisorHerramientas, ErrorHerramienta
+from src.bibliotecas import Bibliotecas, ErrorBiblioteca, importaciones
+from src.cache import CacheCompilacion, dependencias_preprocesador
+from src.tiempos import RegistroTiempos, tamano
+from assets.IdentificarDato import int_to_bin16
+from assets.codec_palabra import (codificar_dato, decodificar_dato, texto_a_palabra,
+                                  DESPLAZAMIENTO_PREFIJO, MASCARA_RESTO)
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QInputDialog
 from PyQt5.QtWidgets import QApplication, QMainWindow
 from vista.Diseno_GUI import *
 from vista.prueba import *
-import subprocess
-import os
+
+# Etapas de la cadena en el orden de los botones de la interfaz
+ETAPAS_INTERFAZ = ("preprocesado", "compilacion", "bibliotecas", "traduccion",
+                   "ensamblado", "enlace", "carga")
 
 class MainWindow(QMainWindow):
     """
@@ -28,19 +40,45 @@ class MainWindow(QMainWindow):
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.cp = 0  # Contador de programa
-        self.registro = [0] * 4  # Registros de propósito general (A, B, C, D)
-        self.carry = 0  # Bandera de acarreo
-        self.zero = 0  # Bandera de cero
-        self.negative = 0  # Bandera de negativo
-        self.desbordamiento = 0  # Bandera de desbordamiento
+        self.registro = BancoRegistros(4)  # Registros de propósito general (A, B, C, D)
+        # Widgets (decimal, binario) de cada registro
+        self.vista_registros = [
+            (self.ui.REG_A, self.ui.BIN_A),
+            (self.ui.REG_B, self.ui.BIN_B),
+            (self.ui.REG_C, self.ui.BIN_C),
+            (self.ui.REG_D, self.ui.BIN_D),
+        ]
+        # Banderas de acarreo, cero, negativo y desbordamiento (evaluación perezosa)
+        self.banderas = Banderas()
+        # Widgets (decimal, binario) de cada bandera, en el orden de Banderas.valores()
+        self.vista_banderas = [
+            (self.ui.REG_Carry, self.ui.BIN_Carry),
+            (self.ui.REG_Zero, self.ui.BIN_Zero),
+            (self.ui.REG_Neg, self.ui.BIN_Neg),
+            (self.ui.REG_Desb, self.ui.BIN_Desb),
+        ]
+        self.banderas_mostradas = None
         self.config_input = {"text": "", "reg_input": 0, "Exxecute_all": False}
         self.set_REG_Values([0,0,0,0])
-        self.setCarry(0)
-        self.setZero(0)
-        self.setNegative(0)
-        self.setDesb(0)
+        self.refrescar_banderas()
         self.ui.input_button.setDisabled(True)
         self.memoria = Memoria(self.ui)
+        # Canal de salida de OUT: acumula valores y los agrega a la consola por lotes
+        self.salida = CanalSalida([SalidaConsola(self.ui.Output)])
+        # Resultados de cada etapa guardados por contenido (entrada, versión y opciones)
+        self.cache = CacheCompilacion()
+        # Procesos persistentes del preprocesador y del compilador (el ensamblador y
+        # el enlazador se ejecutan en el mismo proceso)
+        self.herramientas = SupervisorHerramientas("./compilados", cache=self.cache)
+        # Objetos precompilados de las bibliotecas de `#import`
+        self.bibliotecas = Bibliotecas(self.herramientas, cache=self.cache)
+        # Nivel de optimización del TAC antes de traducirlo (ver src/optimizador.py),
+        # elegido en la lista junto al botón del compilador
+        self.nivel_optimizacion = NIVEL_POR_DEFECTO
+        self.ui.nivel_optimizacion_box.setCurrentIndex(NIVELES.index(NIVEL_POR_DEFECTO))
+        self.ui.nivel_optimizacion_box.currentIndexChanged.connect(self.cambiarNivelOptimizacion)
+        # Mediciones de la última ejecución de cada etapa, mostradas en la barra de estado
+        self.tiempos = RegistroTiempos()
         self.ui.preprocesar_button.clicked.connect(self.Preprocesado)
         
         self.ui.Compilar_button.clicked.connect(self.Compilador)
@@ -107,6 +145,7 @@ class MainWindow(QMainWindow):
         """
         valor = self.ui.Input.toPlainText()
         self.guardar_en_registro(self.config_input["reg_input"], float(valor))
+        self.refrescar_registros()
         Llama_all = self.config_input['Exxecute_all']
         self.config_input = {"text": "", "reg_input": 0, "Exxecute_all": False}
         self.ui.Read_Next_Instruction.setDisabled(False)
@@ -177,154 +216,109 @@ class MainWindow(QMainWindow):
  
     def guardar_en_registro(self, indice, value):
         """
-        Almacena un valor en el registro especificado y actualiza la 
-        visualización de los registros en la interfaz.
+        Almacena un valor en el registro especificado. Solo ese registro queda
+        marcado para actualizarse en la interfaz (ver refrescar_registros).
         
         Args:
             indice (int): Índice del registro (0-3 para A, B, C, D)
             value: Valor a almacenar en el registro
         """
-        temp_reg = self.registro
-        temp_reg[indice] = value
-        self.set_REG_Values(temp_reg)
+        self.registro.escribir(indice, value)
         
     def set_REG_Values(self,arreglo):
         """
         Actualiza todos los registros con los valores proporcionados en el arreglo
-        y actualiza sus representaciones tanto en formato decimal como binario en la interfaz.
+        y refresca su visualización en la interfaz.
         
         Args:
             arreglo (list): Lista de 4 valores para los registros A, B, C y D
         """
-        self.registro[0] = arreglo[0]
-        self.registro[1] = arreglo[1]
-        self.registro[2] = arreglo[2]
-        self.registro[3] = arreglo[3]
-        self.ui.REG_A.setText(str(arreglo[0]))
-        self.ui.REG_B.setText(str(arreglo[1]))
-        self.ui.REG_C.setText(str(arreglo[2]))
-        self.ui.REG_D.setText(str(arreglo[3]))
-        
-        def convertir_a_binario(valor):
-            """
-            Convierte un valor a su representación binaria de 16 bits dependiendo de su tipo.
-            
-            Args:
-                valor: Valor a convertir (int, float, str, bool)
-            
-            Returns:
-                str: Representación binaria del valor en 16 bits
-            """
-            if isinstance(valor, int):
-                return int_to_bin16(valor)
-            elif isinstance(valor, float):
-                return float_to_bin16(valor)
-            elif isinstance(valor, str):
-                return float_to_bin16(bin(ord(valor))[2:].zfill(16))
-            elif isinstance(valor, bool):
-                if(valor):
-                    return int_to_bin16(1)
-                else:
-                    return int_to_bin16(0)
-            else:
-                return "ERROR"  # Manejo de error en caso de tipo desconocido
-        self.ui.BIN_A.setText(convertir_a_binario(arreglo[0]))
-        self.ui.BIN_B.setText(convertir_a_binario(arreglo[1]))
-        self.ui.BIN_C.setText(convertir_a_binario(arreglo[2]))
-        self.ui.BIN_D.setText(convertir_a_binario(arreglo[3]))
-      
-    def setCarry(self,caryy):
+        for indice, valor in enumerate(arreglo):
+            self.registro.escribir(indice, valor)
+        self.refrescar_registros()
+
+    def refrescar_registros(self):
         """
-        Actualiza el valor de la bandera de acarreo y su visualización en la interfaz.
-        
-        Args:
-            caryy (int): Nuevo valor para la bandera de acarreo (0 o 1)
+        Muestra en la interfaz los registros modificados desde el último refresco.
+        La representación binaria se calcula aquí, solo para esos registros.
         """
-        self.carry = caryy
-        self.ui.REG_Carry.setText(str(caryy))
-        self.ui.BIN_Carry.setText(int_to_bin16(caryy))
+        for indice in self.registro.tomar_sucios():
+            reg_widget, bin_widget = self.vista_registros[indice]
+            reg_widget.setText(str(self.registro[indice]))
+            bin_widget.setText(self.registro.binario(indice))
       
-    def setZero(self,zero):
-        """
-        Actualiza el valor de la bandera de cero y su visualización en la interfaz.
-        
-        Args:
-            zero (int): Nuevo valor para la bandera de cero (0 o 1)
-        """
-        self.zero = zero
-        self.ui.REG_Zero.setText(str(zero))
-        self.ui.BIN_Zero.setText(int_to_bin16(zero))
-        
-    def setNegative(self,negative):
-        """
-        Actualiza el valor de la bandera de negativo y su visualización en la interfaz.
-        
-        Args:
-            negative (int): Nuevo valor para la bandera de negativo (0 o 1)
-        """
-        self.negative = negative
-        self.ui.REG_Neg.setText(str(negativo))
-        self.ui.BIN_Neg.setText(int_to_bin16(negativo))
-        
-    def setDesb(self,desbordamiento):
-        """
-        Actualiza el valor de la bandera de desbordamiento y su visualización en la interfaz.
-        
-        Args:
-            desbordamiento (int): Nuevo valor para la bandera de desbordamiento (0 o 1)
-        """
-        self.desbordamiento = desbordamiento
-        self.ui.REG_Desb.setText(str(desbordamiento))
-        self.ui.BIN_Desb.setText(int_to_bin16(desbordamiento))
+    def refrescar_banderas(self):
+        """
+        Materializa las banderas a partir de la última operación registrada y
+        actualiza en la interfaz solo las que cambiaron desde el último refresco.
+        """
+        valores = self.banderas.valores()
+        anteriores = self.banderas_mostradas or (None,) * len(valores)
+        for (reg_widget, bin_widget), valor, anterior in zip(self.vista_banderas, valores, anteriores):
+            if valor != anterior:
+                reg_widget.setText(str(valor))
+                bin_widget.setText(int_to_bin16(valor))
+        self.banderas_mostradas = valores
     
     def resetBanderas(self):
         """
         Reinicia todas las banderas (carry, zero, negative, desbordamiento) a 0.
         Útil después de ciertas operaciones para limpiar el estado de las banderas.
         """
-        self.setCarry(0)
-        self.setZero(0)
-        self.setNegative(0)
-        self.setDesb(0)
+        self.banderas.reiniciar()
+        self.refrescar_banderas()
         
-    def Preprocesado(self):
+    def medir_etapa(self, etapa, entrada=None):
         """
-        Realiza el preprocesamiento del código fuente utilizando un ejecutable externo (flex).
-        Lee el código fuente desde la interfaz, lo escribe en un archivo temporal,
-        ejecuta el preprocesador y muestra el resultado en la interfaz.
+        Mide una etapa de la cadena (ver src/tiempos.py). Repetir una etapa descarta
+        su medición anterior y las de las etapas que le siguen.
+
+        @param etapa: Nombre de la etapa (ver ETAPAS_INTERFAZ)
+        @param entrada: Lo que recibe la etapa
+        @return: Administrador de contexto que entrega el RegistroEtapa
         """
-        texto = self.ui.codigofuente_input.toPlainText()  # Obtener el texto del QTextEdit
+        self.tiempos.olvidar(*ETAPAS_INTERFAZ[ETAPAS_INTERFAZ.index(etapa):])
+        return self.tiempos.medir(etapa, entrada, self.cache)
 
-        # Crear un archivo temporal para pasar el contenido al analizador Flex
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as temp_file:
-            temp_file.write(texto.encode("utf-8"))
-            temp_file_path = temp_file.name
+    def mostrar_tiempos(self):
+        """Muestra en la barra de estado el tiempo de cada etapa medida."""
+        self.ui.statusbar.showMessage(self.tiempos.resumen())
+
+    def cambiarNivelOptimizacion(self, indice):
+        """
+        Cambia el nivel de optimización elegido en la lista (-O0, -O1, -O2).
+        Se aplica la próxima vez que se compile.
 
-        # Ejecutar el analizador léxico en Flex (asumiendo que ya compilaste el ejecutable)
-        flex_executable = "./compilados/preprocesador"  # Asegúrate de que `scanner` es el ejecutable de Flex generado con `gcc`
-        if os.name != 'posix':
-            flex_executable += ".exe"
+        @param indice: Posición elegida en la lista, que sigue el orden de NIVELES
+        """
+        self.nivel_optimizacion = NIVELES[indice]
+
+    def Preprocesado(self):
+        """
+        Realiza el preprocesamiento del código fuente utilizando el preprocesador (flex).
+        Envía el código fuente de la interfaz al proceso persistente del preprocesador
+        y muestra el resultado en la interfaz.
+        """
+        texto = self.ui.codigofuente_input.toPlainText()  # Obtener el texto del QTextEdit
         try:
-            result = subprocess.run(
-                [flex_executable, temp_file_path],  # Ejecuta el scanner con el archivo temporal
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            output = result.stdout  # Obtener la salida del scanner
+            with self.medir_etapa("preprocesado", texto) as medicion:
+                output = self.herramientas.solicitar(
+                    "preprocesador", texto, dependencias=dependencias_preprocesador(texto))
+                medicion.salida = tamano(output)
             self.ui.codigo_preprocesado_input.setPlainText(output)
         except Exception as e:
             self.ui.Output.setPlainText("[Error Preprocesado]: "+ str(e))
+        self.mostrar_tiempos()
         
     def Compilador(self):
         """
         Ejecuta el proceso de compilación del código preprocesado.
-        Utiliza un ejecutable externo para compilar el código y generar
-        un archivo de código TAC (Three-Address Code), que luego se convierte
-        a ensamblador mediante otro script Python.
+        El proceso persistente del compilador genera el código TAC (Three-Address Code),
+        que luego se optimiza (src/optimizador.py) y se traduce a ensamblador en el
+        mismo proceso, enlazando los objetos precompilados de las bibliotecas importadas;
+        el ensamblador pasa por la optimización de mirilla (src/mirilla.py).
         
-        Maneja archivos temporales para la entrada/salida y muestra el resultado
-        en la interfaz gráfica.
+        Muestra el resultado en la interfaz gráfica.
         """
         def log_debug(message):
             """ 
@@ -338,131 +332,66 @@ class MainWindow(QMainWindow):
                 debug_file.write(message + "\n")
         # Obtener el código preprocesado de la UI
         codigo = self.ui.codigo_preprocesado_input.toPlainText()
-
-        # Definir rutas absolutas para evitar problemas de ubicación
-        compiler_executable = os.path.abspath("./compilados/compiler")
-        if os.name != 'posix':
-            compiler_executable += ".exe"
-        output_file = "./archivos_salida/compilador.out"
-        output_file_tac = "./archivos_salida/compilador.tac"
-        output_file_asm = "./archivos_salida/compilador.asm"
-        tac_script = os.path.abspath("./src/TAC.py")
+        log_debug(f"🔹 Código fuente:\n{codigo}")
 
         try:
-            # Crear archivo temporal para la entrada
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".out", mode="w", encoding="utf-8") as temp_input:
-                temp_input.write(codigo)
-                temp_input.flush()  # Asegurar que se escribe antes de leer
-                temp_input_path = temp_input.name  # Guardar la ruta del archivo
-            
-            with open(temp_input_path, "r", encoding="utf-8") as source_file:
-                source_code = source_file.read()
-            log_debug(f"🔹 Código fuente escrito en {temp_input_path}:\n{source_code}")
-            
-            # Crear archivo temporal para la salida
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".tac", mode="w", encoding="utf-8") as temp_output:
-                temp_input_tac = temp_output.name  # Guardar la ruta del archivo
-                temp_output_path = temp_input_tac.replace(".tac", ".out")  
-                temp_asm_path = temp_input_tac.replace(".tac", ".asm")  
-
-            log_debug(f"🔹 Archivos temporales creados:\nOUT: {temp_output_path}\nASM: {temp_asm_path}")
+            with self.medir_etapa("compilacion", codigo) as medicion:
+                source_code = self.herramientas.solicitar("compilador", codigo)
+                medicion.salida = tamano(source_code)
+            # Las bibliotecas importadas se enlazan ya compiladas (solo se recompilan si cambian)
+            with self.medir_etapa("bibliotecas") as medicion:
+                objetos = self.bibliotecas.resolver(importaciones(codigo))
+                medicion.salida = sum(tamano(objeto.tac) for objeto in objetos)
+        except (ErrorHerramienta, ErrorBiblioteca) as e:
+            self.ui.Output.setPlainText(f"[Error]: El compilador no generó código TAC ({e})")
+            self.mostrar_tiempos()
+            return
+        log_debug(f"🔹 Código TAC:\n{source_code}")
 
-            # Ejecutar el compilador con archivos temporales
-            result = subprocess.run(
-                [compiler_executable, temp_input_path, temp_output_path],
-                capture_output=True,  # Captura salida para depuración
-                text=True
-            )
-
-
-            # Esperar a que se genere el archivo de salida (.tac)
-            timeout = 5  # Tiempo máximo de espera en segundos
-            start_time = time.time()
-
-            while not os.path.exists(temp_input_tac):
-                if time.time() - start_time > timeout:
-                    self.ui.Output.setPlainText("[Error]: Tiempo de espera agotado. El compilador no generó el archivo .tac")
-                    return
-                time.sleep(0.1)  # Esperar 100ms antes de volver a comprobar
-            
-            with open(temp_input_tac, "r", encoding="utf-8") as source_file:
-                source_code = source_file.read()
-            log_debug(f"🔹 Contenido de {temp_input_tac}:\n{source_code}")
-            
-            with open(temp_input_tac, "r", encoding="utf-8") as source_file:
-                source_code = source_file.read()
-            log_debug(f"🔹 Contenido de {temp_input_tac}:\n{source_code}")
-            
-            # # Ejecutar TAC.py con el archivo de salida del compilador
-            result_tac = subprocess.run(
-                ["python", tac_script, temp_input_tac],
-                capture_output=False,
-                text=False
-            )
-            
-            timeout = 5  # Tiempo máximo de espera en segundos
-            start_time = time.time()
-
-            while not os.path.exists(temp_asm_path):
-                if time.time() - start_time > timeout:
-                    self.ui.Output.setPlainText("[Error]: Tiempo de espera agotado. El compilador no generó el archivo .tac")
-                    return
-                time.sleep(0.1)  # Esperar 100ms antes de volver a comprobar
-
-            # # Verificar si la conversión TAC → ASM fue exitosa
-            if result_tac.returncode != 0:
-                self.ui.Output.setPlainText(f"[Error TAC]: {result_tac.stderr}")
-                return
-            
-            with open(temp_asm_path, "r", encoding="utf-8") as asm_file:
-                asm_code = asm_file.read()
-            log_debug(f"🔹 Contenido de {temp_asm_path}:\n{asm_code}")
-            self.ui.assembler_input.setPlainText(asm_code)
+        # Traducir TAC → ASM en el mismo proceso (o tomarlo de la caché). Solo se
+        # traducen las funciones cuyo TAC cambió; la mirilla se aplica al resultado.
+        def traducir():
+            data_section, code_section = tac_to_assembly(
+                source_code, [objeto.tac for objeto in objetos], self.nivel_optimizacion)
+            return formatear_asm(data_section, code_section)
+        try:
+            with self.medir_etapa("traduccion", source_code) as medicion:
+                asm_code, _ = self.cache.obtener_o_calcular(
+                    "tac", version_traductor(), source_code, traducir,
+                    opciones=[self.nivel_optimizacion, *(objeto.clave for objeto in objetos)])
+                medicion.salida = tamano(asm_code)
+        except Exception as e:
+            self.ui.Output.setPlainText(f"[Error TAC]: {e}")
+            self.mostrar_tiempos()
+            return
+        self.mostrar_tiempos()
 
-        finally:
-            # Limpiar archivo temporal de entrada si aún existe
-            if os.path.exists(temp_input_path):
-                try:
-                    os.remove(temp_input_path)
-                except Exception as e:
-                    print(f"Error al eliminar archivo temporal: {e}")
+        log_debug(f"🔹 Código ensamblador generado:\n{asm_code}")
+        self.ui.assembler_input.setPlainText(asm_code)
 
-        
     def Ensamblador(self):
         """
         Ejecuta el proceso de ensamblado del código en lenguaje ensamblador.
-        Toma el código ensamblador de la interfaz, lo escribe en un archivo temporal,
-        ejecuta el ensamblador externo y muestra el código binario resultante en la interfaz.
+        Ensambla en el mismo proceso (src/ensamblador.py, equivalente a la herramienta
+        flex) el código de la interfaz y muestra el código binario resultante.
         """
         texto = self.ui.assembler_input.toPlainText()  # Obtener el texto del QTextEdit
-
-        # Crear un archivo temporal para pasar el contenido al analizador Flex
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".txt") as temp_file:
-            temp_file.write(texto.encode("utf-8"))
-            temp_file_path = temp_file.name
-
-        # Ejecutar el analizador léxico en Flex (asumiendo que ya compilaste el ejecutable)
-        flex_executable = "./compilados/ensamblador"
-        if os.name != 'posix':
-            flex_executable += ".exe"
         try:
-            result = subprocess.run(
-                [flex_executable, temp_file_path],  # Ejecuta el scanner con el archivo temporal
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            output = result.stdout  # Obtener la salida del scanner
+            with self.medir_etapa("ensamblado", texto) as medicion:
+                output = ensamblar_texto(texto)
+                medicion.salida = tamano(output)
             self.ui.binary_input.setPlainText(output)
         except Exception as e:
             self.ui.Output.setPlainText("[Error Ensamblador]: "+ str(e))
+        self.mostrar_tiempos()
         
     def EnlazadorCargador(self):
         """
         Ejecuta el proceso de enlazado y carga del código binario en la memoria.
-        Toma la dirección de referencia y el código binario de la interfaz,
-        ejecuta el enlazador-cargador externo y carga el código resultante en la
-        memoria de la máquina virtual a partir de la dirección de referencia.
+        Toma la dirección de referencia y el código binario de la interfaz, reubica
+        en el mismo proceso las direcciones relativas (src/enlazador.py) y carga el
+        programa completo en la memoria de la máquina virtual a partir de la dirección
+        de referencia, refrescando la tabla una sola vez.
         
         También actualiza el contador de programa para apuntar a la dirección inicial del programa.
         """
@@ -471,62 +400,32 @@ class MainWindow(QMainWindow):
             direccion_referencia = int(direccion_referencia)
             # Lee el código reubicable desde la UI
             texto = self.ui.binary_input.toPlainText()
-            texto_modificado = texto
-
-            # Crear un archivo temporal para la entrada (similar a compilador.bin)
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".bin", mode="w", encoding="utf-8") as temp_in:
-                temp_in.write(texto_modificado)
-                temp_in_path = temp_in.name
-
-            # Crear un nombre de archivo temporal para la salida (similar a executable.bin)
-            temp_out_path = tempfile.mktemp(suffix=".bin")
+            with self.medir_etapa("enlace", texto) as medicion:
+                salida = enlazar_texto(texto, direccion_referencia).strip()
+                medicion.salida = tamano(salida)
 
-            # Definir el comando y agregar la extensión si es Windows
-            comando = "./compilados/linkerloader"
-            if os.name != 'posix':
-                comando += ".exe"
+            # Mostrar la salida en el campo de texto de la UI
+            self.ui.binary_input.setPlainText(salida)
 
-            # Ejecutar el linkerloader pasando los tres parámetros:
-            # 1. La dirección de referencia
-            # 2. El archivo de entrada generado temporalmente
-            # 3. El archivo de salida donde se almacenará el ejecutable
-            proceso = subprocess.run(
-                [comando, str(direccion_referencia), temp_in_path, temp_out_path],
-                capture_output=True,
-                text=True
-            )
+            # Escribir la salida en la memoria a partir de la dirección de referencia
+            with self.medir_etapa("carga", salida) as medicion:
+                medicion.salida = self.memoria.load_image(
+                    direccion_referencia, imagen_memoria(salida.splitlines()))
 
-            # Si hay errores en stderr, mostrarlos en la UI
-            if proceso.stderr:
-                self.ui.Output.append("[Error Linker]: " + proceso.stderr)
-
-            # Leer el contenido del archivo de salida generado
-            if os.path.exists(temp_out_path):
-                with open(temp_out_path, "r", encoding="utf-8") as out_file:
-                    salida = out_file.read().strip()
-                # Mostrar la salida en el campo de texto de la UI
-                self.ui.binary_input.setPlainText(salida)
-
-                # Escribir la salida en la memoria a partir de la dirección de referencia
-                for i, linea in enumerate(salida.splitlines()):
-                    direccion = direccion_referencia + i
-                    if direccion < len(self.memoria):
-                        self.memoria[direccion] = linea
-
-                # Actualizar el contador de programa
-                self.setCp(direccion_referencia)
-
-            # Limpiar el archivo temporal de entrada
-            if os.path.exists(temp_in_path):
-                os.remove(temp_in_path)
-            # Puedes optar por eliminar el archivo de salida si no lo necesitas después:
-            # if os.path.exists(temp_out_path):
-            #     os.remove(temp_out_path)
+            # Actualizar el contador de programa
+            self.setCp(direccion_referencia)
 
         except ValueError as e:
             self.ui.Output.setPlainText("[Error Enlazador]: " + str(e))
+        self.mostrar_tiempos()
+
+    def closeEvent(self, event):
+        """
+        Detiene los procesos persistentes de la cadena de herramientas al cerrar la ventana.
+        """
+        self.herramientas.detener()
+        super().closeEvent(event)
 
-        
     def LeerDato(self,direccion):
         """
         Lee un dato almacenado en la dirección de memoria especificada.
@@ -539,8 +438,15 @@ class MainWindow(QMainWindow):
             El valor almacenado en la dirección de memoria, procesado según 
             su tipo de dato (entero, float, booleano, etc.)
         """
-        instruccion = self.memoria.leer_memoria(direccion)
-        return self.EjecutarComando(instruccion)
+        palabra = texto_a_palabra(self.memoria.leer_memoria(direccion))
+        if palabra >> DESPLAZAMIENTO_PREFIJO:
+            # No es una palabra de dato: se ejecuta como instrucción
+            return self.EjecutarComando(palabra)
+        try:
+            return decodificar_dato(palabra)
+        except ValueError:
+            print("Error: La data debe ser un número entero.")
+            return "ERROR"
         
     def LeerInstruccion(self):
         """
@@ -549,18 +455,30 @@ class MainWindow(QMainWindow):
         
         Es utilizada para la ejecución paso a paso del programa cargado en memoria.
         """
+        self.PasoInstruccion()
+        self.salida.vaciar()
+        self.refrescar_registros()
+        self.refrescar_banderas()
+
+    def PasoInstruccion(self):
+        """
+        Ejecuta la instrucción ubicada en el CP y avanza el CP, sin vaciar
+        el canal de salida. Es el paso común de la ejecución individual y continua.
+        """
         instruccion = self.memoria.leer_memoria(self.cp)
         self.config_input = {"text":"","reg_input":reg,"Exxecute_all":False} 
         try:
             self.EjecutarComando(instruccion)
             self.setCp(self.cp+1)      
         except ValueError as e:
+            self.salida.vaciar()
             self.ui.Output.setPlainText("[Error Ejecutando]: "+ str(e))
             
     def LeerInstrucciones(self):
         """
         Lee y ejecuta instrucciones desde la dirección actual del CP hasta encontrar
-        una instrucción HALT, IN o un valor 0 en memoria.
+        una instrucción HALT, IN o un valor 0 en memoria fuera del programa cargado
+        (dentro de él, la palabra 0 es un NOP).
         
         Es utilizada para la ejecución continua del programa cargado en memoria.
         Si encuentra una instrucción IN, pausa la ejecución y espera la entrada del usuario.
@@ -568,8 +486,11 @@ class MainWindow(QMainWindow):
         instruccion = self.memoria.leer_memoria(self.cp)
         while(self.IdentificarComando(instruccion) != 'HALT' 
               and self.IdentificarComando(instruccion) != 'IN' 
-              and self.memoria.leer_memoria(self.cp) != 0 ):
-            self.LeerInstruccion()
+              and not self.memoria.fin_de_programa(self.cp)):
+            self.PasoInstruccion()
+        self.salida.vaciar()
+        self.refrescar_registros()
+        self.refrescar_banderas()
         if(self.IdentificarComando(instruccion) == 'IN'):
             self.config_input = {"text":"","reg_input":reg,"Exxecute_all":True} 
             try:
@@ -598,9 +519,9 @@ class MainWindow(QMainWindow):
             
         if funcion:
             try:
-                # Asegurar que la instrucción se maneje como cadena binaria y tenga 32 bits
-                binario = str(instruccion).zfill(32)  # Asegurar que tenga 32 bits, rellenando con ceros a la izquierda
-                resto_instruccion = binario[5:]  # Convertir los 27 bits restantes a entero
+                # Los 27 bits restantes se entregan como cadena a la implementación
+                palabra = texto_a_palabra(instruccion)
+                resto_instruccion = format(palabra & MASCARA_RESTO, '027b')
                 return funcion(resto_instruccion)
             except ValueError:
                 print("Error: La funcion debe ser un número entero.")
@@ -626,11 +547,8 @@ class MainWindow(QMainWindow):
         ]
         
         try:
-            binario = str(instruccion).zfill(32)  # Asegurar que tenga 32 bits, llenando con ceros a la izquierda
-            
-            # Extraer los primeros 5 bits del binario
-            opcode_binario = binario[:5]
-            opcode = int(opcode_binario, 2)  # Convertir los primeros 5 bits a entero
+            # Los primeros 5 bits de la palabra son el código de operación
+            opcode = texto_a_palabra(instruccion) >> DESPLAZAMIENTO_PREFIJO
 
             if 0 <= opcode < len(commandos):
                 return commandos[opcode]
@@ -653,23 +571,11 @@ class MainWindow(QMainWindow):
         Returns:
             El valor del dato según su tipo identificado
         """
-        type_dato = instruccion[:6]
         print("🚀 ~ instruccion:", instruccion)
-        tipo_dato = int(type_dato, 2)
-        print("🚀 ~ tipo_dato:", tipo_dato)
-        
         # Determinar el tipo de dato según el valor de los primeros 6 bits
-        if tipo_dato == 1:
-            return GetBooleano(instruccion[6:])
-        elif tipo_dato == 2:
-            return GetNatural(instruccion[6:])
-        elif tipo_dato == 3:
-            return GetEntero(instruccion[6:])
-        elif tipo_dato == 4:
-            return GetFloat(instruccion[6:])
-        elif tipo_dato == 5:
-            return GetCaracterUtf16(instruccion[6:])
-        else:
+        try:
+            return decodificar_dato(int(instruccion, 2))
+        except ValueError:
             print("Error: La data debe ser un número entero.")
             return "ERROR"
         
@@ -716,7 +622,7 @@ class MainWindow(QMainWindow):
         print(f"STORE: Register {reg_origen} value = {self.registro[reg_origen]}")
         
         # Store the value from the specified register to memory
-        self.memoria.escribir_memoria(dir_destino, ConvertirDatoBinario(self.registro[reg_origen]))
+        self.memoria.escribir_memoria(dir_destino, codificar_dato(self.registro[reg_origen]))
         return 0
         
     def MOVE(self,instruccion):
@@ -762,17 +668,17 @@ class MainWindow(QMainWindow):
         suma = self.registro[reg_1] + self.registro[reg_2]
         print(f"ADD: Sum result = {suma}, storing in Register {reg_destino}")
         
+        self.banderas.registrar("ADD", self.registro[reg_1], self.registro[reg_2], suma)
+        
         # Store result
         self.guardar_en_registro(reg_destino, suma)
         
-        # Set flags appropriately
-        
         return 0
         
     def SUB(self,instruccion):
         """
         Implementa la instrucción SUB que resta el valor del segundo registro del primero
-        y almacena el resultado en un tercero. También actualiza las banderas Zero y Negative.
+        y almacena el resultado en un tercero. Registra la operación para las banderas.
         
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros
@@ -785,18 +691,14 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         reg_destino = int(instruccion[4:6], 2)
         resta = self.registro[reg_1] - self.registro[reg_2]
-        if resta == 0:
-            self.setZero(1)
-        if resta < 0:
-            self.setNegative(1)
+        self.banderas.registrar("SUB", self.registro[reg_1], self.registro[reg_2], resta)
         self.guardar_en_registro(reg_destino,resta)
         return 0
         
     def MUL(self,instruccion):
         """
         Implementa la instrucción MUL que multiplica los valores de dos registros
-        y almacena el resultado en un tercero. Actualiza las banderas de Desbordamiento,
-        Carry y Zero según corresponda.
+        y almacena el resultado en un tercero. Registra la operación para las banderas.
         
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros
@@ -809,18 +711,14 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         reg_destino = int(instruccion[4:6], 2)
         multi = self.registro[reg_1] * self.registro[reg_2]
-        if multi > 2097151:
-            self.setDesb(1)
-            self.setCarry(1)
-        if multi == 0:
-            self.setZero(1)
+        self.banderas.registrar("MUL", self.registro[reg_1], self.registro[reg_2], multi)
         self.guardar_en_registro(reg_destino,multi)
         return 0
         
     def DIV(self,instruccion):
         """
         Implementa la instrucción DIV que divide el valor del primer registro entre el segundo
-        y almacena el resultado en un tercero. Actualiza la bandera Zero si el resultado es cero.
+        y almacena el resultado en un tercero. Registra la operación para las banderas.
         
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros
@@ -833,8 +731,7 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         reg_destino = int(instruccion[4:6], 2)
         div = self.registro[reg_1] / self.registro[reg_2]
-        if div == 0:
-            self.setZero(1)
+        self.banderas.registrar("DIV", self.registro[reg_1], self.registro[reg_2], div)
         self.guardar_en_registro(reg_destino,div)
         return 0
         
@@ -1006,6 +903,7 @@ class MainWindow(QMainWindow):
         """
         Implementa la instrucción BEQ (Branch if Equal) que realiza un salto condicional
         si los valores de los dos registros especificados son iguales.
+        Deja las banderas como CMP.
 
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros a comparar
@@ -1019,7 +917,8 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         dir_destino = int(instruccion[4:], 2)
         
-        if self.registro[reg_1] == self.registro[reg_2]:
+        self.banderas.registrar("CMP", self.registro[reg_1], self.registro[reg_2])
+        if self.banderas.zero:
             self.setCp(dir_destino)
         return 0
 
@@ -1027,7 +926,7 @@ class MainWindow(QMainWindow):
         """
         Implementa la instrucción BNE (Branch if Not Equal) que realiza un salto condicional
         si los valores de los dos registros especificados son diferentes.
-        También actualiza la bandera Negative.
+        Deja las banderas como CMP.
         
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros a comparar
@@ -1040,15 +939,15 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         dir_destino = int(instruccion[4:], 2)
         
-        if self.registro[reg_1] != self.registro[reg_2]:
-            self.setNegative(1)
+        self.banderas.registrar("CMP", self.registro[reg_1], self.registro[reg_2])
+        if not self.banderas.zero:
             self.setCp(dir_destino)
 
     def BLT(self, instruccion):
         """
         Implementa la instrucción BLT (Branch if Less Than) que realiza un salto condicional
         si el valor del primer registro es menor que el del segundo registro.
-        También actualiza la bandera Negative.
+        Deja las banderas como CMP.
         
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros a comparar
@@ -1061,15 +960,15 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         dir_destino = int(instruccion[4:], 2)
         
-        if self.registro[reg_1] < self.registro[reg_2]:
-            self.setNegative(1)
+        self.banderas.registrar("CMP", self.registro[reg_1], self.registro[reg_2])
+        if self.banderas.negative:
             self.setCp(dir_destino)
 
     def JLE(self, instruccion):
         """
         Implementa la instrucción JLE (Jump if Less or Equal) que realiza un salto condicional
         si el valor del primer registro es menor o igual que el del segundo registro.
-        Actualiza las banderas Negative y Zero según corresponda.
+        Deja las banderas como CMP.
         
         Args:
             instruccion (str): Bits de la instrucción que contienen los registros a comparar
@@ -1082,12 +981,8 @@ class MainWindow(QMainWindow):
         reg_2 = int(instruccion[2:4], 2)
         dir_destino = int(instruccion[4:], 2)
         
-        if self.registro[reg_1] < self.registro[reg_2]:
-            self.setNegative(1)            
-        if self.registro[reg_1] == self.registro[reg_2]:
-            self.setZero(1)
-        
-        if self.registro[reg_1] <= self.registro[reg_2]:
+        self.banderas.registrar("CMP", self.registro[reg_1], self.registro[reg_2])
+        if self.banderas.negative or self.banderas.zero:
             self.setCp(dir_destino)
 
     def PUSH(self,instruccion):
@@ -1168,14 +1063,16 @@ class MainWindow(QMainWindow):
         """
         print("IN", instruccion)
         reg = int(instruccion[:2], 2)  # Obtener el índice del registro
+        self.salida.vaciar()  # Mostrar la salida pendiente antes de esperar la entrada
         self.config_input = {"text":"","reg_input":reg,"Exxecute_all":self.config_input['Exxecute_all']}
         self.ui.input_button.setDisabled(False)
         self.ui.Read_Next_Instruction.setDisabled(True)
             
     def OUT(self,instruccion):
         """
-        Implementa la instrucción OUT que muestra el valor del registro especificado
-        en la salida de la interfaz gráfica.
+        Implementa la instrucción OUT que envía el valor del registro especificado
+        al canal de salida. Los valores se muestran en la interfaz por lotes, al
+        llenarse el buffer o al detenerse la ejecución (HALT, IN o fin del programa).
         
         Args:
             instruccion (str): Bits de la instrucción que contienen el registro origen
@@ -1184,13 +1081,13 @@ class MainWindow(QMainWindow):
             int: 0 para indicar éxito
         """
         reg_1 = int(instruccion[:2], 2)        
-        self.ui.Output.setPlainText(str(self.registro[reg_1]))
+        self.salida.escribir(self.registro[reg_1])
         return 0
 
     def CMP(self, instruccion):
         """
         Implementa la instrucción CMP que compara los valores de dos registros
-        y establece las banderas Zero y Negative según el resultado de la comparación.
+        y registra la comparación para las banderas (se calculan al leerlas).
         Esta instrucción es útil antes de ejecutar instrucciones de salto condicional.
         
         Args:
@@ -1205,23 +1102,12 @@ class MainWindow(QMainWindow):
         
         value1 = self.registro[reg_1]
         value2 = self.registro[reg_2]
-        result = value1 - value2
-
-        # Set the Zero flag: 1 if result is zero, else 0.
-        self.setZero(1 if result == 0 else 0)
-        
-        # Set the Negative flag: 1 if result is negative, else 0.
-        self.setNegative(1 if result < 0 else 0)
-
-        # Set the Carry flag: 1 if there is a carry, else 0.
-        self.setCarry(1 if result < 0 else 0)
 
-        # Set the Overflow flag: 1 if there is an overflow, else 0.
-        self.setDesb(1 if result > 32767 or result < -32768 else 0)
+        # Las banderas (Z, N, C, V) se calculan al leerlas; ver assets/banderas.py
+        self.banderas.registrar("CMP", value1, value2)
         
-        # (Optional: you could also set a carry flag if desired.)
         print(f"CMP: Comparing R{reg_1}({value1}) with R{reg_2}({value2}).")
-        print(f"CMP: Result = {result}. Zero flag set to {self.zero}, Negative flag set to {self.negative}.")
+        print(f"CMP: Zero flag = {self.banderas.zero}, Negative flag = {self.banderas.negative}.")
         
         return 0
 
@@ -1281,6 +1167,7 @@ class MainWindow(QMainWindow):
         Returns:
             int: 0 para indicar éxito
         """
+        self.salida.vaciar()
         return 0  
         
 if __name__ == '__main__':
@@ -0,0 +1,5 @@
+"""
+Pruebas de la máquina virtual y de la cadena de herramientas.
+
+    python -m unittest discover -s pruebas -t .
+"""
@@ -0,0 +1,148 @@
+"""
+Caché de compilación (src/cache.py): una solicitud repetida se resuelve con la
+caché y cualquier cambio en la versión de la herramienta, las opciones o las
+dependencias la vuelve a calcular.
+"""
+import os
+import sys
+import tempfile
+import unittest
+
+from pruebas.test_servidores import HERRAMIENTA_FALSA
+from src.cache import CacheCompilacion, dependencias_preprocesador, version_archivo
+from src.servidores import SupervisorHerramientas
+
+
+class PruebaCache(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.cache = CacheCompilacion(os.path.join(self.directorio.name, "cache"))
+        self.calculos = 0
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def calcular(self):
+        self.calculos += 1
+        return f"resultado {self.calculos}"
+
+    def solicitar(self, version="1", entrada="x = 1", opciones=()):
+        return self.cache.obtener_o_calcular("tac", version, entrada, self.calcular, opciones)
+
+    def test_solicitud_repetida(self):
+        self.assertEqual(self.solicitar(), ("resultado 1", False))
+        self.assertEqual(self.solicitar(), ("resultado 1", True))
+        self.assertEqual((self.cache.aciertos, self.cache.fallos), (1, 1))
+
+    def test_cambios_que_fallan(self):
+        self.solicitar()
+        for cambio in ({"version": "2"}, {"entrada": "x = 2"}, {"opciones": ("-O1",)}):
+            with self.subTest(**{clave: str(valor) for clave, valor in cambio.items()}):
+                _, acierto = self.solicitar(**cambio)
+                self.assertFalse(acierto)
+                self.assertTrue(self.solicitar(**cambio)[1])
+        self.assertEqual(self.calculos, 4)
+
+    def test_claves_sin_ambiguedad(self):
+        # Las partes se separan por su longitud: moverlas de lugar cambia la clave
+        self.assertNotEqual(CacheCompilacion.clave("tac", "1", "", ("ab", "c")),
+                            CacheCompilacion.clave("tac", "1", "", ("a", "bc")))
+        self.assertNotEqual(CacheCompilacion.clave("tac", "1", "x", ()),
+                            CacheCompilacion.clave("tac", "1x", "", ()))
+
+    def test_persiste_entre_instancias(self):
+        self.solicitar()
+        otra = CacheCompilacion(self.cache.directorio)
+        self.assertEqual(otra.obtener_o_calcular("tac", "1", "x = 1", self.calcular),
+                         ("resultado 1", True))
+
+    def test_desalojo_lru(self):
+        # Caben dos resultados; al guardar un tercero sale el usado hace más tiempo
+        self.cache.limite_bytes = 2 * len("resultado 1")
+        self.solicitar(entrada="a")
+        self.solicitar(entrada="b")
+        clave_a = self.cache.clave("tac", "1", "a")
+        self.cache.entradas[clave_a] = (self.cache.entradas[clave_a][0], 0)
+        self.solicitar(entrada="c")
+        self.assertNotIn(clave_a, self.cache.entradas)
+        self.assertFalse(os.path.exists(self.cache._ruta(clave_a)))
+        self.assertTrue(self.solicitar(entrada="b")[1])
+        self.assertTrue(self.solicitar(entrada="c")[1])
+
+    def test_no_guarda_si_falla(self):
+        def fallar():
+            raise RuntimeError("error de la etapa")
+        with self.assertRaises(RuntimeError):
+            self.cache.obtener_o_calcular("tac", "1", "x = 1", fallar)
+        self.assertEqual(self.cache.entradas, {})
+
+    def test_dependencias_preprocesador(self):
+        bibliotecas = os.path.join(self.directorio.name, "librerias")
+        os.makedirs(bibliotecas)
+        texto = "#import <math>\nFun main() {}\n"
+        antes = dependencias_preprocesador(texto, bibliotecas)
+        self.assertEqual(antes, "math:ausente")
+        open(os.path.join(bibliotecas, "math.lib"), "w").close()
+        self.assertEqual(dependencias_preprocesador(texto, bibliotecas), "math:presente")
+
+    def test_version_archivo(self):
+        ruta = os.path.join(self.directorio.name, "herramienta")
+        self.assertEqual(version_archivo(ruta), "ausente")
+        with open(ruta, "w") as archivo:
+            archivo.write("v1")
+        version = version_archivo(ruta)
+        with open(ruta, "w") as archivo:
+            archivo.write("v1.1")
+        self.assertNotEqual(version_archivo(ruta), version)
+
+
+@unittest.skipUnless(os.name == "posix", "la herramienta de prueba es un script ejecutable")
+class PruebaCacheHerramientas(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.cache = CacheCompilacion(os.path.join(self.directorio.name, "cache"))
+        self.herramientas = SupervisorHerramientas(self.directorio.name, self.cache)
+        self.escribir_herramienta()
+
+    def tearDown(self):
+        self.herramientas.detener()
+        self.directorio.cleanup()
+
+    def escribir_herramienta(self, comentario=""):
+        ruta = self.herramientas.ruta("preprocesador")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(HERRAMIENTA_FALSA.format(python=sys.executable) + comentario)
+        os.chmod(ruta, 0o755)
+
+    def solicitar(self, *argumentos, dependencias=""):
+        resultado = self.herramientas.solicitar("preprocesador", "hola", *argumentos,
+                                                dependencias=dependencias)
+        self.assertEqual(resultado, "HOLA")
+        return self.herramientas.ultimo_acierto
+
+    def test_solicitud_repetida(self):
+        self.assertFalse(self.solicitar())
+        self.assertTrue(self.solicitar())
+        self.assertEqual(self.cache.fallos, 1)
+
+    def test_version_de_la_herramienta(self):
+        self.solicitar()
+        self.escribir_herramienta("# recompilada\n")
+        self.assertFalse(self.solicitar())
+        self.assertTrue(self.solicitar())
+
+    def test_opciones(self):
+        self.solicitar()
+        self.assertFalse(self.solicitar("-O1"))
+        self.assertTrue(self.solicitar("-O1"))
+        self.assertTrue(self.solicitar())
+
+    def test_dependencias(self):
+        self.solicitar(dependencias="math:ausente")
+        self.assertFalse(self.solicitar(dependencias="math:presente"))
+        self.assertTrue(self.solicitar(dependencias="math:presente"))
+        self.assertTrue(self.solicitar(dependencias="math:ausente"))
+
+
+if __name__ == "__main__":
+    unittest.main()
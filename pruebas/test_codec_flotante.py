@@ -0,0 +1,76 @@
+"""
+El codec de assets/codec_flotante.py debe producir exactamente los mismos bits que
+la conversión original con `Fraction` (FloatToBinary21 y GetFloat).
+"""
+import math
+import random
+import unittest
+from fractions import Fraction
+
+from assets.codec_flotante import (MAX_DENOMINADOR, _construir_farey, codificar_flotante,
+                                   decodificar_flotante)
+
+
+def codificar_referencia(valor):
+    """FloatToBinary21 original, como entero de 21 bits."""
+    signo = 0 if valor >= 0 else 1
+    fraccion = Fraction(abs(valor)).limit_denominator(MAX_DENOMINADOR)
+    return (signo << 20) | ((fraccion.numerator & 0x3FF) << 10) | (fraccion.denominator & 0x3FF)
+
+
+def decodificar_referencia(carga):
+    """GetFloat original, sobre el entero de 21 bits."""
+    numerador = (carga >> 10) & 0x3FF
+    denominador = (carga & 0x3FF) or 1
+    valor = float(Fraction(numerador, denominador))
+    return -valor if carga >> 20 else valor
+
+
+class PruebaCodecFlotante(unittest.TestCase):
+    def setUp(self):
+        codificar_flotante.cache_clear()
+
+    def comparar(self, valores):
+        for valor in valores:
+            self.assertEqual(codificar_flotante(valor), codificar_referencia(valor), repr(valor))
+
+    def test_valores_aleatorios(self):
+        aleatorio = random.Random(2027)
+        self.comparar([aleatorio.uniform(-1, 1) for _ in range(100000)])
+        self.comparar([aleatorio.uniform(-1100, 1100) for _ in range(100000)])
+
+    def test_puntos_medios_entre_vecinos_de_farey(self):
+        # Los casos que los doubles no deciden: el punto medio entre dos vecinos y
+        # los doubles adyacentes a él y a cada vecino
+        valores, _, _ = _construir_farey()
+        aleatorio = random.Random(7)
+        casos = []
+        for i in aleatorio.sample(range(1, len(valores)), 20000):
+            medio = (valores[i - 1] + valores[i]) / 2
+            entero = aleatorio.randrange(4)
+            for centro in (medio, valores[i]):
+                casos += [entero + centro, entero + math.nextafter(centro, 0.0),
+                          entero + math.nextafter(centro, 2.0)]
+        self.comparar(casos)
+
+    def test_valores_exactos_y_enteros(self):
+        self.comparar([0.0, -0.0, 0.5, -0.25, 1.0, 3.0, 1023.0, 1024.5, 2.0 ** -30, 1e9])
+        self.comparar([numerador / denominador for denominador in range(1, 60)
+                       for numerador in range(0, 3 * denominador)])
+        self.comparar([0, 1, -7, 1023, 1024, 5000])
+
+    def test_no_finitos(self):
+        # Fraction lanza OverflowError con infinito; el codec siempre ValueError, que la
+        # interfaz atrapa
+        for valor in (math.inf, -math.inf, math.nan):
+            with self.assertRaises(ValueError, msg=repr(valor)):
+                codificar_flotante(valor)
+
+    def test_decodificacion(self):
+        aleatorio = random.Random(11)
+        for carga in [0, 1, 0x3FF, 1 << 20] + [aleatorio.getrandbits(21) for _ in range(50000)]:
+            self.assertEqual(decodificar_flotante(carga), decodificar_referencia(carga), carga)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Enlazado: el enlazador de texto (src/enlazador.py), el formato de objeto y el
+enlazador de módulos (src/objeto.py) y la carga en memoria (Memoria.load_image).
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.enlazador import Reserva, enlazar_texto, imagen_memoria
+from src.ensamblador import PALABRA_CERO, ensamblar_texto
+from src.objeto import (ErrorEnlace, ObjetoModulo, celdas, enlazar, objeto_de_tac,
+                        texto_enlazado)
+from src.TAC import formatear_asm, traducir_modulo
+
+try:
+    from assets.memoria import Memoria
+except ImportError:  # Sin PyQt5
+    Memoria = None
+
+PRINCIPAL = ["begin_func main", "x = 5", "t1 = call f, 0", "y = t1", "return y", "end_func"]
+BIBLIOTECA = ["begin_func f", "z = 7", "return z", "end_func"]
+
+
+class PruebaEnlazadorTexto(unittest.TestCase):
+    def test_reubica_con_la_base(self):
+        texto = "10111000000(4)\n00001000000(0)\n.reservar 2\n[Error ensamblador ]FOO\n"
+        self.assertEqual(enlazar_texto(texto, 40),
+                         f"10111000000{44:021b}\n00001000000{40:021b}\n"
+                         ".reservar 2\n[Error ensamblador ]FOO\n")
+
+    def test_imagen_memoria(self):
+        palabras = imagen_memoria(["00001000000000000000000000000001", ".reservar 3", "texto"])
+        self.assertEqual(palabras[0], 0b00001000000000000000000000000001)
+        self.assertIsInstance(palabras[1], Reserva)
+        self.assertEqual((palabras[1].tamano, palabras[1].valor), (3, PALABRA_CERO))
+        self.assertEqual(palabras[2], "texto")
+
+
+class PruebaObjeto(unittest.TestCase):
+    def setUp(self):
+        self.principal = objeto_de_tac("main", PRINCIPAL)
+        self.biblioteca = objeto_de_tac("lib", BIBLIOTECA, entrada=False)
+
+    def test_guardar_y_cargar(self):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "main.obj")
+            self.principal.guardar(ruta)
+            cargado = ObjetoModulo.cargar(ruta)
+        for campo in ("nombre", "datos", "codigo", "exporta", "importa", "reubicaciones"):
+            self.assertEqual(getattr(cargado, campo), getattr(self.principal, campo), campo)
+        self.assertEqual(enlazar([cargado, self.biblioteca], 7),
+                         enlazar([self.principal, self.biblioteca], 7))
+
+    def test_tabla_de_simbolos(self):
+        self.assertEqual(self.principal.importa, ["f"])
+        self.assertEqual(self.biblioteca.exporta, {"f": ("codigo", 0)})
+        # f queda tras el módulo principal y los datos de la biblioteca
+        _, simbolos = enlazar([self.principal, self.biblioteca], 0)
+        self.assertEqual(simbolos["f"], len(self.principal) + celdas(self.biblioteca.datos))
+
+    def test_base_distinta_de_cero(self):
+        base = 100
+        palabras_0, simbolos_0 = enlazar([self.principal, self.biblioteca], 0)
+        palabras, simbolos = enlazar([self.principal, self.biblioteca], base)
+        self.assertEqual(simbolos, {nombre: direccion + base for nombre, direccion in simbolos_0.items()})
+        # Solo cambian las palabras con reubicaciones, y exactamente en la base
+        diferencias = [nueva - vieja for nueva, vieja in zip(palabras, palabras_0)
+                       if isinstance(nueva, int)]
+        reubicaciones = len(self.principal.reubicaciones) + len(self.biblioteca.reubicaciones)
+        self.assertEqual(sorted(set(diferencias)), [0, base])
+        self.assertEqual(diferencias.count(base), reubicaciones)
+
+    def test_igual_al_enlazador_de_texto(self):
+        # Un módulo sin importaciones enlazado como objeto da el texto de linkerloader
+        tac = ["begin_func main", "x = 5", "y = x * 2", "return y", "end_func"]
+        data_section, code_section, _, _ = traducir_modulo(tac, True)
+        binario = ensamblar_texto(formatear_asm(data_section, code_section))
+        palabras, _ = enlazar([objeto_de_tac("main", tac)], 37)
+        self.assertEqual(texto_enlazado(palabras), enlazar_texto(binario, 37))
+
+    def test_simbolo_duplicado(self):
+        otra = objeto_de_tac("otra", BIBLIOTECA, entrada=False)
+        with self.assertRaisesRegex(ErrorEnlace, r"más de una vez: f \(otra\)"):
+            enlazar([self.principal, self.biblioteca, otra])
+
+    def test_simbolo_no_definido(self):
+        with self.assertRaisesRegex(ErrorEnlace, "no definidos: f"):
+            enlazar([self.principal])
+
+
+@unittest.skipIf(Memoria is None, "assets/memoria.py necesita PyQt5")
+class PruebaCargaMemoria(unittest.TestCase):
+    def setUp(self):
+        self.memoria = Memoria(mock.MagicMock())
+
+    def test_carga_palabras_y_reservas(self):
+        escritas = self.memoria.load_image(10, [5, 0, Reserva(3), 7])
+        self.assertEqual(escritas, 6)
+        self.assertEqual([self.memoria.leer_memoria(direccion) for direccion in range(10, 16)],
+                         [5, 0, PALABRA_CERO, PALABRA_CERO, PALABRA_CERO, 7])
+        self.assertEqual(self.memoria.imagen, range(10, 16))
+        # Dentro del programa la palabra 0 es un NOP, fuera es el fin
+        self.assertFalse(self.memoria.fin_de_programa(11))
+        self.assertTrue(self.memoria.fin_de_programa(16))
+
+    def test_no_escribe_en_la_pila(self):
+        inicio = self.memoria.stack_start
+        escritas = self.memoria.load_image(inicio - 2, [1, 2, 3, Reserva(4)])
+        self.assertEqual(escritas, 2)
+        self.assertEqual(self.memoria.leer_memoria(inicio), 0)
+        self.assertEqual(self.memoria.imagen, range(inicio - 2, inicio))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+"""
+src/ensamblador.py debe producir el mismo texto que `compilados/ensamblador` (la
+herramienta flex) para todos los mnemónicos, modos de direccionamiento y datos que
+la herramienta acepta. Se omite si la herramienta no está compilada (ver README).
+"""
+import itertools
+import os
+import subprocess
+import tempfile
+import unittest
+
+from src.ensamblador import MNEMONICOS, ensamblar_texto
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ENSAMBLADOR = os.path.join(RAIZ, "compilados", "ensamblador" + ("" if os.name == "posix" else ".exe"))
+
+REGISTROS = ["R0", "R1", "R2", "R3"]
+DIRECCIONES = ["[0x0]", "[0x7]", "[0x1F]", "[0x3E8]", "[0xFFFFF]"]
+
+# Operandos de ejemplo para cada formato de MNEMONICOS
+OPERANDOS = {
+    "RRR": [", ".join(registros) for registros in itertools.permutations(REGISTROS, 3)],
+    "RRD": [f"{a}, {b}, {d}" for (a, b), d in zip(itertools.permutations(REGISTROS, 2),
+                                                 itertools.cycle(DIRECCIONES))],
+    "OO": [f"{a}, {b}" for a, b in itertools.product(REGISTROS[:2] + DIRECCIONES[:3], repeat=2)],
+    "D": DIRECCIONES,
+    "D+": DIRECCIONES,
+    "R": REGISTROS,
+    "": [""],
+}
+
+# Separadores que aceptan las reglas flex ({spaces} incluye la comilla doble)
+VARIANTES = [
+    "LOAD  R1,[0x5]", 'STORE"R2, "[0xA]', "ADD R1,R2,R3  ", "JUMP [0x2] ", "OUT   R3",
+    'HALT"', "  NOP", "CMP [0x1], [0x2]",
+]
+
+DATOS = [
+    "0", "7", "1048575", "+5", "-5", "-1048576", "3.5", "-0.25", "+1.75", "1.3", "100",
+    "TRUE", "FALSE", "a", "Z", "[1,2,3]", "[1.5,-2,+3,TRUE,FALSE,'x']", ".reservar 4",
+    ".reservar 1  ",
+]
+
+# Líneas que la herramienta rechaza (y el módulo también, salvo sus extensiones)
+ERRORES = ["LOAD R4, [0x1]", "ADD R1, R2", "JUMP [0xg]", "FOO R1", "BEQ R1, R2, R3"]
+
+
+def programa():
+    lineas = []
+    for mnemonico, formatos in MNEMONICOS.items():
+        for formato in formatos:
+            # MOVE, SHL, SHR, ROL y ROR con dos registros son una extensión del módulo
+            if formato == "RR":
+                continue
+            for operandos in OPERANDOS[formato]:
+                lineas.append(f"{mnemonico} {operandos}".rstrip())
+    return "\n".join(lineas + VARIANTES + DATOS + ERRORES) + "\n"
+
+
+@unittest.skipUnless(os.path.exists(ENSAMBLADOR), f"{ENSAMBLADOR} no está compilado")
+class PruebaEnsambladorFlex(unittest.TestCase):
+    def ensamblar_flex(self, texto):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, "programa.asm")
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+            return subprocess.run([ENSAMBLADOR, ruta], capture_output=True, text=True,
+                                  check=True).stdout
+
+    def test_mismo_binario(self):
+        texto = programa()
+        esperado = self.ensamblar_flex(texto)
+        # Solo las líneas de ERRORES son errores para la herramienta
+        errores = [linea for linea in esperado.splitlines() if linea.startswith("[Error")]
+        self.assertEqual(errores, [f"[Error ensamblador ]{linea}" for linea in ERRORES])
+        self.assertEqual(ensamblar_texto(texto).splitlines(), esperado.splitlines())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Reglas de mirilla de src/mirilla.py, una por una, sobre secciones de código
+pequeñas. Con `inicio` 0, la instrucción de índice i está en la dirección i y un
+salto a "[0xA]" continúa en la instrucción A + 1.
+"""
+import unittest
+from collections import Counter
+
+from src.mirilla import REGLAS, optimizar_codigo, reglas_de_nivel
+
+
+def aplicar(code_section, *reglas, entradas=()):
+    """
+    @return: Tupla (código resultante, función reubicar, cambios por regla)
+    """
+    estadisticas = Counter()
+    nuevo, reubicar = optimizar_codigo(code_section, 0, reglas, entradas, estadisticas)
+    return nuevo, reubicar, estadisticas
+
+
+class PruebaCargas(unittest.TestCase):
+    def test_carga_repetida_mismo_registro(self):
+        nuevo, _, cambios = aplicar(
+            ["LOAD R0, [0x1]", "OUT R0", "LOAD R0, [0x1]", "OUT R0", "HALT"], "carga-repetida")
+        self.assertEqual(nuevo, ["LOAD R0, [0x1]", "OUT R0", "OUT R0", "HALT"])
+        self.assertEqual(cambios, {"carga-repetida": 1})
+
+    def test_carga_repetida_otro_registro(self):
+        # Las lecturas de R1 pasan a R0 hasta que R1 se vuelve a escribir
+        nuevo, _, _ = aplicar(
+            ["LOAD R0, [0x1]", "LOAD R1, [0x1]", "ADD R1, R2, R3", "STORE R1, [0x4]",
+             "LOAD R1, [0x2]", "OUT R1", "HALT"], "carga-repetida")
+        self.assertEqual(nuevo, ["LOAD R0, [0x1]", "ADD R0, R2, R3", "STORE R0, [0x4]",
+                                 "LOAD R1, [0x2]", "OUT R1", "HALT"])
+
+    def test_renombrar_se_detiene_en_un_salto(self):
+        # R1 se sigue leyendo después del salto: no se puede cambiar por R0
+        codigo = ["LOAD R0, [0x1]", "LOAD R1, [0x1]", "OUT R1", "JUMP [0x5]",
+                  "HALT", "HALT", "OUT R1", "HALT"]
+        nuevo, _, cambios = aplicar(codigo, "carga-repetida")
+        self.assertEqual(nuevo, codigo)
+        self.assertEqual(cambios, {})
+
+    def test_renombrar_se_detiene_en_una_llegada(self):
+        # A "OUT R1" llega un salto desde fuera del tramo
+        codigo = ["LOAD R0, [0x1]", "LOAD R1, [0x1]", "OUT R1", "LOAD R1, [0x2]", "HALT"]
+        nuevo, _, _ = aplicar(codigo, "carga-repetida", entradas=[1])
+        self.assertEqual(nuevo, codigo)
+
+    def test_otro_registro_cambia_antes_de_leerse(self):
+        codigo = ["LOAD R0, [0x1]", "LOAD R1, [0x1]", "LOAD R0, [0x2]", "OUT R1",
+                  "LOAD R1, [0x3]", "HALT"]
+        nuevo, _, _ = aplicar(codigo, "carga-repetida")
+        self.assertEqual(nuevo, codigo)
+
+    def test_carga_tras_guardar(self):
+        nuevo, _, cambios = aplicar(
+            ["LOAD R0, [0x1]", "STORE R0, [0x2]", "LOAD R0, [0x2]", "OUT R0", "HALT"],
+            "carga-tras-guardar")
+        self.assertEqual(nuevo, ["LOAD R0, [0x1]", "STORE R0, [0x2]", "OUT R0", "HALT"])
+        self.assertEqual(cambios, {"carga-tras-guardar": 1})
+
+    def test_carga_tras_guardar_un_resultado(self):
+        # El resultado de una operación cambia al guardarse: la carga se conserva
+        codigo = ["ADD R0, R1, R2", "STORE R2, [0x2]", "LOAD R2, [0x2]", "OUT R2", "HALT"]
+        nuevo, _, _ = aplicar(codigo, "carga-tras-guardar")
+        self.assertEqual(nuevo, codigo)
+
+    def test_carga_tras_guardar_solo_en_o2(self):
+        self.assertNotIn("carga-tras-guardar", reglas_de_nivel(1))
+        self.assertIn("carga-tras-guardar", reglas_de_nivel(2))
+
+
+class PruebaSaltos(unittest.TestCase):
+    def test_salto_al_siguiente(self):
+        nuevo, _, cambios = aplicar(["JUMP [0x0]", "OUT R0", "HALT"], "salto-al-siguiente")
+        self.assertEqual(nuevo, ["OUT R0", "HALT"])
+        self.assertEqual(cambios, {"salto-al-siguiente": 1})
+
+    def test_salto_al_siguiente_no_quita_llamadas(self):
+        codigo = ["CALL [0x0]", "OUT R0", "HALT"]
+        self.assertEqual(aplicar(codigo, "salto-al-siguiente")[0], codigo)
+
+    def test_destino_dentro_de_lo_quitado(self):
+        # El BEQ salta al "JUMP [0x3]", que se quita: continúa en la instrucción
+        # que le seguía
+        nuevo, reubicar, cambios = aplicar(
+            ["BEQ R0, R1, [0x2]", "JUMP [0x1]", "OUT R0", "JUMP [0x3]", "OUT R1", "HALT"],
+            "salto-al-siguiente")
+        self.assertEqual(nuevo, ["BEQ R0, R1, [0x1]", "OUT R0", "OUT R1", "HALT"])
+        self.assertEqual(cambios, {"salto-al-siguiente": 2})
+        self.assertEqual(reubicar(2), 1)
+        self.assertEqual(reubicar(3), 1)
+        self.assertEqual(reubicar(0x40), 0x40)
+
+    def test_salto_a_salto(self):
+        nuevo, _, cambios = aplicar(
+            ["JUMP [0x1]", "HALT", "JUMP [0x3]", "OUT R0", "HALT"], "salto-a-salto")
+        self.assertEqual(nuevo, ["JUMP [0x3]", "HALT", "JUMP [0x3]", "OUT R0", "HALT"])
+        self.assertEqual(cambios, {"salto-a-salto": 1})
+
+    def test_salto_a_salto_en_ciclo(self):
+        codigo = ["JUMP [0x1]", "HALT", "JUMP [0x1]"]
+        nuevo, _, _ = aplicar(codigo, "salto-a-salto")
+        self.assertEqual(nuevo, codigo)
+
+    def test_inalcanzable(self):
+        nuevo, reubicar, cambios = aplicar(
+            ["JUMP [0x2]", "OUT R0", "OUT R1", "HALT"], "inalcanzable")
+        self.assertEqual(nuevo, ["JUMP [0x0]", "HALT"])
+        self.assertEqual(cambios, {"inalcanzable": 2})
+        self.assertEqual(reubicar(2), 0)
+
+    def test_inalcanzable_con_entrada(self):
+        # A "OUT R1" se llega desde fuera (p. ej. una función exportada)
+        nuevo, reubicar, _ = aplicar(
+            ["JUMP [0x2]", "OUT R0", "OUT R1", "HALT"], "inalcanzable", entradas=[1])
+        self.assertEqual(nuevo, ["JUMP [0x1]", "OUT R1", "HALT"])
+        self.assertEqual(reubicar(1), 0)
+
+
+class PruebaReglas(unittest.TestCase):
+    def test_regla_desconocida(self):
+        with self.assertRaises(ValueError):
+            optimizar_codigo(["HALT"], 0, ["no-existe"])
+
+    def test_sin_reglas(self):
+        codigo = ["JUMP [0x0]", "HALT"]
+        nuevo, reubicar = optimizar_codigo(codigo, 0, [])
+        self.assertEqual(nuevo, codigo)
+        self.assertEqual(reubicar(5), 5)
+
+    def test_todas_las_reglas_tienen_prueba(self):
+        probadas = {"carga-repetida", "carga-tras-guardar", "salto-al-siguiente",
+                    "salto-a-salto", "inalcanzable"}
+        self.assertEqual(set(REGLAS), probadas)
+
+
+if __name__ == "__main__":
+    unittest.main()
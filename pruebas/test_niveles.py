@@ -0,0 +1,152 @@
+"""
+Los niveles de optimización no deben cambiar lo que hace un programa: el mismo TAC
+traducido con -O0, -O1 y -O2 debe escribir los mismos valores en la salida.
+
+Los programas se ejecutan en una máquina mínima con la semántica de main.py para
+las instrucciones que genera src/TAC.py. Los registros tienen valores de Python y
+cada STORE pasa por la palabra de 21 bits (assets/codec_palabra.py), así que un
+valor que se reutiliza desde un registro sin guardarse se nota en los flotantes.
+"""
+import random
+import unittest
+
+from assets.codec_palabra import (DESPLAZAMIENTO_PREFIJO, MASCARA_RESTO, codificar_dato,
+                                  decodificar_dato)
+from src.enlazador import Reserva, enlazar_texto, imagen_memoria
+from src.ensamblador import CODIGOS, ensamblar_texto
+from src.optimizador import NIVELES
+from src.TAC import formatear_asm, leer_tac, tac_to_assembly
+
+PASOS = 3000
+
+
+def ejecutar(tac, nivel):
+    """
+    Traduce y ejecuta un programa TAC.
+
+    @return: Tupla (valores escritos con OUT, cómo terminó: "HALT", "fin", "pasos"
+             o el nombre de la excepción)
+    """
+    data_section, code_section = tac_to_assembly(leer_tac(tac), nivel=nivel)
+    binario = ensamblar_texto(formatear_asm(data_section, code_section))
+    celdas = []
+    for celda in imagen_memoria(enlazar_texto(binario, 0).splitlines()):
+        celdas += [celda.valor] * celda.tamano if isinstance(celda, Reserva) else [celda]
+    memoria = dict(enumerate(celdas))
+    programa = len(celdas)
+    registros = [0] * 4
+    salida = []
+    pila = []
+    cp = 0
+    try:
+        for _ in range(PASOS):
+            palabra = memoria.get(cp, 0)
+            if palabra == 0 and cp >= programa:
+                return salida, "fin"
+            comando = CODIGOS[palabra >> DESPLAZAMIENTO_PREFIJO]
+            resto = format(palabra & MASCARA_RESTO, "027b")
+            r1, r2, r3 = int(resto[:2], 2), int(resto[2:4], 2), int(resto[4:6], 2)
+            if comando == "HALT":
+                return salida, "HALT"
+            if comando == "LOAD":
+                registros[r1] = decodificar_dato(memoria.get(int(resto[2:], 2), 0))
+            elif comando == "STORE":
+                memoria[int(resto[2:], 2)] = codificar_dato(registros[r1])
+            elif comando in ("ADD", "SUB", "MUL", "DIV"):
+                a, b = registros[r1], registros[r2]
+                registros[r3] = {"ADD": a + b, "SUB": a - b, "MUL": a * b}[comando] \
+                    if comando != "DIV" else a / b
+            elif comando in ("BEQ", "BNE", "BLT", "JLE"):
+                a, b = registros[r1], registros[r2]
+                if {"BEQ": a == b, "BNE": a != b, "BLT": a < b, "JLE": a <= b}[comando]:
+                    cp = int(resto[4:], 2)
+            elif comando == "JUMP":
+                cp = int(resto, 2)
+            elif comando == "CALL":
+                pila.append(cp)
+                cp = int(resto, 2)
+            elif comando == "OUT":
+                salida.append(registros[r1])
+            elif comando != "NOP":
+                return salida, comando
+            cp += 1
+    except ArithmeticError as e:
+        return salida, type(e).__name__
+    return salida, "pasos"
+
+
+LITERALES = ["0", "1", "2", "5", "7", "99", "0.5", "3.5", "1.3", "3.7", "0.7"]
+COMPARACIONES = ["==", "!=", "<", "<=", ">", ">="]
+
+
+def programa_aleatorio(aleatorio):
+    """TAC con funciones, ciclos, saltos condicionales, llamadas y flotantes."""
+    funciones = ["main"] + aleatorio.sample(["f", "g"], aleatorio.randint(0, 2))
+    lineas = []
+    for numero, funcion in enumerate(funciones):
+        etiquetas = [f"L{numero * 10 + indice}" for indice in range(1, 5)]
+        sin_definir = list(etiquetas)
+        aleatorio.shuffle(sin_definir)
+        temporales = [f"t{numero * 10 + indice}" for indice in range(1, 5)]
+        nombres = ["a", "b", "x", "res"] + temporales
+
+        def operando():
+            return aleatorio.choice(nombres + LITERALES)
+
+        lineas.append(f"begin_func {funcion}")
+        lineas += [f"{nombre} = {aleatorio.choice(LITERALES)}" for nombre in nombres]
+        for _ in range(aleatorio.randint(2, 16)):
+            tipo = aleatorio.random()
+            if tipo < 0.25:
+                lineas.append(f"{aleatorio.choice(nombres)} = {operando()}")
+            elif tipo < 0.55:
+                lineas.append(f"{aleatorio.choice(nombres)} = {operando()} "
+                              f"{aleatorio.choice('+-*/')} {operando()}")
+            elif tipo < 0.7:
+                condicion = aleatorio.choice(temporales)
+                lineas.append(f"{condicion} = {operando()} {aleatorio.choice(COMPARACIONES)} {operando()}")
+                lineas.append(f"ifz {condicion} goto {aleatorio.choice(etiquetas)}")
+            elif tipo < 0.8 and sin_definir:
+                lineas.append(sin_definir.pop() + ":")
+            elif tipo < 0.85:
+                lineas.append(f"goto {aleatorio.choice(etiquetas)}")
+            elif tipo < 0.9:
+                lineas.append(f"{aleatorio.choice(nombres)} = call {aleatorio.choice(funciones)}, 0")
+            else:
+                lineas.append(f"return {operando()}")
+        # Las etiquetas que no aparecieron se definen al final de la función
+        lineas += [etiqueta + ":" for etiqueta in sin_definir]
+        lineas.append(f"return {aleatorio.choice(nombres)}")
+        lineas.append("end_func")
+    return "\n".join(lineas) + "\n"
+
+
+class PruebaNiveles(unittest.TestCase):
+    def comparar(self, tac):
+        """Compara los niveles; devuelve si el programa terminó en todos."""
+        try:
+            resultados = [ejecutar(tac, nivel) for nivel in NIVELES]
+        except ValueError:
+            # TAC que la traducción rechaza (p. ej. una etiqueta sin definir)
+            return False
+        if any(fin == "pasos" for _, fin in resultados):
+            return False
+        for nivel, resultado in zip(NIVELES[1:], resultados[1:]):
+            self.assertEqual(resultado, resultados[0], f"-O{nivel} distinto de -O0 en:\n{tac}")
+        return True
+
+    def test_flotantes_reutilizados(self):
+        # Con -O2, z y w no deben conservar en los registros la precisión que la
+        # palabra de memoria pierde en -O0
+        tac = ("begin_func main\nt1 = 1.3\nx = t1\nt2 = 3.7\ny = t2\nt3 = x * y\nz = t3\n"
+               "t4 = z * y\nw = t4\nreturn w\nend_func\n")
+        self.assertTrue(self.comparar(tac))
+
+    def test_programas_aleatorios(self):
+        aleatorio = random.Random(2042)
+        terminados = sum(self.comparar(programa_aleatorio(aleatorio)) for _ in range(300))
+        self.assertGreater(terminados, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Modo servidor (--servidor) de las herramientas de `compilados/`: una solicitud por
+src/servidores.py debe dar el mismo resultado que la herramienta con archivos, y
+una solicitud repetida el mismo resultado que la primera (el estado se reinicia).
+
+Las pruebas de las herramientas se omiten si no están compiladas (ver README). El
+reinicio del supervisor se prueba con una herramienta falsa que sigue el protocolo.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from src.servidores import SupervisorHerramientas
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+COMPILADOS = os.path.join(RAIZ, "compilados")
+
+PROGRAMA = """Fun main() {
+    Ent x = 2;
+    Ent y = x * 3 + 1;
+    Ret y;
+}
+"""
+
+
+class PruebaHerramientasCompiladas(unittest.TestCase):
+    def setUp(self):
+        self.herramientas = SupervisorHerramientas(COMPILADOS)
+        for nombre in ("preprocesador", "compilador"):
+            if not os.path.exists(self.herramientas.ruta(nombre)):
+                self.skipTest(f"{self.herramientas.ruta(nombre)} no está compilado")
+        self.directorio = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.herramientas.detener()
+        self.directorio.cleanup()
+
+    def archivo(self, nombre, texto=""):
+        ruta = os.path.join(self.directorio.name, nombre)
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(texto)
+        return ruta
+
+    def test_preprocesador(self):
+        fuente = self.archivo("programa.src", PROGRAMA)
+        esperado = subprocess.run([self.herramientas.ruta("preprocesador"), fuente],
+                                  capture_output=True, text=True, check=True).stdout
+        self.assertEqual(self.herramientas.solicitar("preprocesador", PROGRAMA), esperado)
+        self.assertEqual(self.herramientas.solicitar("preprocesador", PROGRAMA), esperado)
+        self.assertEqual(self.herramientas.servidor("preprocesador").reinicios, 0)
+
+    def test_compilador(self):
+        preprocesado = self.herramientas.solicitar("preprocesador", PROGRAMA)
+        entrada = self.archivo("programa.out", preprocesado)
+        salida = self.archivo("programa.tac")
+        subprocess.run([self.herramientas.ruta("compilador"), entrada, salida],
+                       capture_output=True, check=True, cwd=self.directorio.name)
+        with open(salida, encoding="utf-8") as archivo:
+            esperado = archivo.read()
+        self.assertIn("begin_func main", esperado)
+        self.assertEqual(self.herramientas.solicitar("compilador", preprocesado), esperado)
+        self.assertEqual(self.herramientas.solicitar("compilador", preprocesado), esperado)
+
+
+# Herramienta de prueba con el protocolo de servidor.h: responde la entrada en
+# mayúsculas. Con la entrada "caer" termina sin responder la primera vez (deja una
+# marca en su directorio) y responde normalmente en el reintento.
+HERRAMIENTA_FALSA = """#!{python}
+import os
+import sys
+
+marca = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cayo")
+entrada = sys.stdin.buffer
+salida = sys.stdout.buffer
+while True:
+    cabecera = entrada.readline()
+    if not cabecera:
+        break
+    datos = entrada.read(int(cabecera.split()[0]))
+    if datos == b"caer" and not os.path.exists(marca):
+        open(marca, "w").close()
+        sys.exit(1)
+    resultado = datos.upper()
+    salida.write(b"0 %d\\n" % len(resultado) + resultado)
+    salida.flush()
+"""
+
+
+@unittest.skipUnless(os.name == "posix", "la herramienta de prueba es un script ejecutable")
+class PruebaSupervisor(unittest.TestCase):
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.herramientas = SupervisorHerramientas(self.directorio.name)
+        ruta = self.herramientas.ruta("preprocesador")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(HERRAMIENTA_FALSA.format(python=sys.executable))
+        os.chmod(ruta, 0o755)
+
+    def tearDown(self):
+        self.herramientas.detener()
+        self.directorio.cleanup()
+
+    def test_reinicia_tras_matar_el_proceso(self):
+        self.assertEqual(self.herramientas.solicitar("preprocesador", "hola"), "HOLA")
+        servidor = self.herramientas.servidor("preprocesador")
+        proceso = servidor.proceso
+        proceso.kill()
+        proceso.wait()
+
+        self.assertEqual(self.herramientas.solicitar("preprocesador", "otra"), "OTRA")
+        self.assertIsNot(servidor.proceso, proceso)
+        self.assertTrue(servidor.vivo)
+        self.assertEqual(servidor.reinicios, 1)
+
+    def test_repite_la_solicitud_si_el_proceso_cae(self):
+        self.assertEqual(self.herramientas.solicitar("preprocesador", "hola"), "HOLA")
+        self.assertEqual(self.herramientas.solicitar("preprocesador", "caer"), "CAER")
+        self.assertTrue(os.path.exists(os.path.join(self.directorio.name, "cayo")))
+        self.assertEqual(self.herramientas.servidor("preprocesador").reinicios, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
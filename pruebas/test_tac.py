@@ -0,0 +1,44 @@
+"""
+Errores de la traducción de TAC a ensamblador (src/TAC.py).
+"""
+import unittest
+
+from src.optimizador import NIVELES
+from src.TAC import ErrorEtiqueta, ErrorOperando, tac_to_assembly, traducir_modulo
+
+
+class PruebaErroresTraduccion(unittest.TestCase):
+    def test_operando_no_definido(self):
+        tac = ["begin_func main", "x = y + 1", "return x", "end_func"]
+        for nivel in NIVELES:
+            with self.subTest(nivel=nivel), self.assertRaises(ErrorOperando) as contexto:
+                tac_to_assembly(tac, nivel=nivel)
+            self.assertEqual((contexto.exception.operando, contexto.exception.funcion),
+                             ("y", "main"))
+            self.assertEqual(str(contexto.exception), "Operando no definido: y (en main)")
+
+    def test_operando_no_definido_antes_de_optimizar(self):
+        # -O2 elimina t3 porque nunca se lee, pero el error se informa en todos los niveles
+        tac = ["begin_func main", "x = 1", "t3 = t2 - x", "return x", "end_func"]
+        for nivel in NIVELES:
+            with self.subTest(nivel=nivel):
+                with self.assertRaisesRegex(ErrorOperando, r"t2 \(en main\)"):
+                    tac_to_assembly(tac, nivel=nivel)
+                with self.assertRaisesRegex(ErrorOperando, "t2"):
+                    traducir_modulo(tac, True, nivel)
+
+    def test_variable_de_otra_funcion(self):
+        # Las variables son globales: basta con que otra unidad la asigne
+        tac = ["begin_func main", "t1 = call f, 0", "y = g + 1", "return y", "end_func",
+               "begin_func f", "g = 2", "return g", "end_func"]
+        for nivel in NIVELES:
+            tac_to_assembly(tac, nivel=nivel)
+
+    def test_etiqueta_no_definida(self):
+        tac = ["begin_func main", "goto L9", "end_func"]
+        with self.assertRaisesRegex(ErrorEtiqueta, r"L9 \(en main\)"):
+            tac_to_assembly(tac, nivel=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
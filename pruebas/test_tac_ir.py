@@ -0,0 +1,39 @@
+"""
+IR del TAC (src/tac_ir.py): `formatear` es lo inverso de `analizar_linea`.
+"""
+import unittest
+
+from src.tac_ir import LLAMADA, TablaSimbolos, analizar, analizar_linea, crear, formatear
+
+LINEAS = [
+    "begin_func main", "param a", "L1:", "x = 5", "x = y", "t1 = a + 2.5", "t2 = x / y",
+    "t3 = x <= 4", "t4 = call f, 0", "t5 = call g, 3", "ifz t3 goto L2", "goto L1",
+    "return t1", "end_func",
+]
+
+
+class PruebaFormatear(unittest.TestCase):
+    def test_ida_y_vuelta(self):
+        instrucciones, tabla = analizar(LINEAS)
+        for linea, instr in zip(LINEAS, instrucciones):
+            instr.texto = None
+            self.assertEqual(formatear(instr, tabla), linea)
+
+    def test_llamada_conserva_los_argumentos(self):
+        tabla = TablaSimbolos()
+        instr = analizar_linea("t1 = call suma, 2", tabla)
+        self.assertEqual((instr.tipo, instr.funcion, instr.argumentos), (LLAMADA, "suma", "2"))
+        nueva = crear(tabla, LLAMADA, instr.destino, funcion="suma", argumentos=instr.argumentos)
+        self.assertEqual(nueva.texto, "t1 = call suma, 2")
+
+    def test_sin_texto_original(self):
+        tabla = TablaSimbolos()
+        for linea in ("x = y + z + w", "print x"):
+            instr = analizar_linea(linea, tabla)
+            instr.texto = None
+            with self.assertRaises(ValueError):
+                formatear(instr, tabla)
+
+
+if __name__ == "__main__":
+    unittest.main()
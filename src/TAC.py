@@ -1,454 +1,846 @@
-import re
+import os
 import sys
+from functools import lru_cache
+
+if not __package__:
+    # Ejecutado como script (python TAC.py): los módulos de src/ se importan como paquete
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from src.tac_ir import (ASIGNACION, ASIGNACIONES, COMPARACION, DESCONOCIDA, ETIQUETA,
+                        EXPRESION, FIN_FUNCION, GOTO, IFZ, INICIO_FUNCION, LLAMADA,
+                        OPERACION, OPERADORES, PARAM, RETORNO, analizar)
+from src import mirilla, optimizador, tac_ir
+from src.cache import version_archivo
+from src.ensamblador import linea_reserva, tamano_reserva
+from src.mirilla import optimizar_codigo, reglas_de_nivel
+from src.optimizador import (NIVEL_POR_DEFECTO, bloques_basicos, comparaciones_emparejadas,
+                             es_temporal, indices_de, optimizar_unidades, traduccion_exacta)
+
+# Registro de depuración en debug_TAC_to_assembler.log (desactivado por defecto;
+# se activa con --debug desde la línea de comandos)
+DEBUG = False
 
 def debug_print(*args, **kwargs):
+    if not DEBUG:
+        return
     with open('debug_TAC_to_assembler.log', 'a', encoding='utf-8') as f:
         print(*args, **kwargs, file=f)
 
-def tac_to_assembly(tac_file):
+def version_traductor():
+    """Versión del traductor para la caché: cambia si se edita este módulo, la IR o los optimizadores."""
+    return "/".join(version_archivo(ruta) for ruta in
+                    (__file__, tac_ir.__file__, optimizador.__file__, mirilla.__file__))
+
+def leer_tac(tac):
     """
-    Traduce código de Tres Direcciones (TAC) a instrucciones de ensamblador para una máquina virtual simple.
+    Normaliza la entrada del traductor a una lista de líneas TAC sin espacios ni líneas vacías.
     
-    Este proceso incluye:
-    1. Construcción de tablas de constantes y variables
-    2. Asignación de direcciones de memoria
-    3. Generación de código ensamblador equivalente
-    4. Resolución de etiquetas de salto
+    @param tac: Texto TAC, lista/iterable de líneas o ruta a un archivo .tac existente
+    @return: Lista de líneas TAC
+    """
+    if isinstance(tac, str):
+        if '\n' not in tac and os.path.isfile(tac):
+            with open(tac, 'r', encoding='utf-8') as f:
+                tac = f.read()
+        tac = tac.splitlines()
+    return [line.strip() for line in tac if line.strip()]
+
+def formatear_asm(data_section, code_section):
+    """
+    Une las secciones de datos y código en el texto del archivo .asm (una línea por elemento).
     
-    @param tac_file: Ruta al archivo TAC de entrada
-    @return: Tupla con (sección de datos, sección de código)
+    @return: Texto ensamblador
     """
-    # Leer y limpiar el archivo TAC
-    with open(tac_file, 'r', encoding='utf-8') as f:
-        tac_lines = [line.strip() for line in f if line.strip()]
+    return "".join(f"{linea}\n" for linea in data_section) + "".join(f"{linea}\n" for linea in code_section)
 
-    # --- Construir la tabla de constantes ---
-    # Solo incluimos las constantes que aparecen en el TAC.
-    # Se incluye "0" por defecto, ya que es común para comparaciones.
-    const_table = {"0": 0}
-    next_const_addr = 1
+def tamano_datos(data_section):
+    """
+    Celdas que ocupa la sección de datos: una por constante más las de la reserva.
+    
+    @return: Dirección de la primera instrucción
+    """
+    return sum(tamano_reserva(linea) or 1 for linea in data_section)
 
-    # Primera pasada: identificar todas las constantes numéricas
+def dividir_unidades(tac_lines):
+    """
+    Divide el TAC en unidades de traducción: cada unidad empieza en un `begin_func`
+    (las líneas previas a la primera función forman su propia unidad).
+    
+    @param tac_lines: Lista de líneas TAC
+    @return: Lista de tuplas de líneas, en el orden del programa
+    """
+    unidades = []
+    actual = []
     for line in tac_lines:
-        # Ignorar etiquetas o líneas de control de flujo
-        if line.startswith('L') and ':' in line:
-            continue
-        if line.startswith('begin_func') or line.startswith('end_func') or line.startswith('param'):
-            continue
+        if line.startswith('begin_func') and actual:
+            unidades.append(tuple(actual))
+            actual = []
+        actual.append(line)
+    if actual:
+        unidades.append(tuple(actual))
+    return unidades
 
-        # Buscar constantes en asignaciones
-        if '=' in line and not line.startswith('ifz') and not line.startswith('goto'):
-            parts = [p.strip() for p in line.split('=', 1)]
-            expr = parts[1]
-            
-            # Si es un operando solo (no una operación)
-            if '+' not in expr and '-' not in expr and '*' not in expr and '/' not in expr and '==' not in expr and '!=' not in expr and '<' not in expr and '<=' not in expr and '>' not in expr and '>=' not in expr:
-                if expr.replace('.', '', 1).isdigit() and expr not in const_table:
-                    const_table[expr] = next_const_addr
-                    next_const_addr += 1
-            # Si es una operación, buscar constantes en los operandos
-            else:
-                # Manejar operadores de comparación también
-                operators = r'[+\-*/=<>!]+'
-                for op in re.split(operators, expr):
-                    op = op.strip()
-                    if op and op.replace('.', '', 1).isdigit() and op not in const_table:
-                        const_table[op] = next_const_addr
-                        next_const_addr += 1
+class ErrorEtiqueta(Exception):
+    """
+    Saltos o llamadas a etiquetas que no están definidas en el programa.
+    `faltantes` es la lista de (etiqueta, función donde se usa).
+    """
+    def __init__(self, faltantes):
+        self.faltantes = faltantes
+        detalle = ", ".join(f"{etiqueta} (en {funcion})" if funcion else etiqueta
+                            for etiqueta, funcion in dict.fromkeys(faltantes))
+        super().__init__(f"Etiquetas no definidas: {detalle}")
 
-    # --- Construir la tabla de variables ---
-    var_table = {}
-    next_var_addr = next_const_addr  # Las variables se asignan tras las constantes
+class ErrorOperando(Exception):
+    """
+    Operando que no es una constante ni una variable asignada en el programa.
+    `operando` es su nombre y `funcion` la función donde se usa (None fuera de una).
+    """
+    def __init__(self, operando, funcion=None):
+        self.operando = operando
+        self.funcion = funcion
+        donde = f" (en {funcion})" if funcion else ""
+        super().__init__(f"Operando no definido: {operando}{donde}")
 
-    # Segunda pasada: asignar direcciones a todas las variables
-    for line in tac_lines:
-        # Ignorar etiquetas o líneas de control de flujo
-        if line.startswith('L') and ':' in line:
-            continue
-        if line.startswith('begin_func') or line.startswith('end_func'):
-            continue
-        if line.startswith('param'):
-            param = line.split()[1]
-            if param not in var_table:
-                var_table[param] = next_var_addr
-                next_var_addr += 1
+class Fragmento:
+    """
+    Resultado simbólico de traducir una unidad (función) de TAC.
+    
+    No contiene direcciones: las constantes, variables y etiquetas se referencian
+    por nombre y se resuelven al enlazar todas las unidades, de modo que un
+    fragmento sirve mientras no cambie el TAC de su función.
+    
+    - funcion: nombre de la función de la unidad (None si no empieza con begin_func)
+    - simbolos: nombre de cada id de símbolo de la unidad (ver src/tac_ir.py)
+    - literales: si cada id de símbolo es una constante numérica
+    - constantes / variables: nombres en orden de primera aparición
+    - constantes_retorno: constantes de los `return` (no se registran como constantes
+      de la unidad; solo se agregan si ninguna unidad las registra)
+    - etiquetas: etiqueta -> desplazamiento dentro de la unidad
+    - tamano: instrucciones que ocupa la unidad según el conteo de etiquetas
+    - codigo: lista de (formato, referencias); cada referencia es (tipo, id de
+      símbolo) para operandos y (tipo, nombre) para etiquetas
+    - requeridos: ids de operandos que deben existir aunque no se emitan
+    """
+    def __init__(self, funcion, simbolos, literales, constantes, variables, etiquetas,
+                 tamano, codigo, requeridos, constantes_retorno=()):
+        self.funcion = funcion
+        self.simbolos = simbolos
+        self.literales = literales
+        self.constantes = constantes
+        self.constantes_retorno = constantes_retorno
+        self.variables = variables
+        self.etiquetas = etiquetas
+        self.tamano = tamano
+        self.codigo = codigo
+        self.requeridos = requeridos
 
-        # Procesar asignaciones y retornos
-        if '=' in line and not line.startswith('ifz') and not line.startswith('goto'):
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            if target not in var_table:
-                var_table[target] = next_var_addr
-                next_var_addr += 1
-                
-            # Procesar también variables en expresiones de comparación
-            if '==' in expr or '!=' in expr or '<' in expr or '<=' in expr or '>' in expr or '>=' in expr:
-                # Extraer los operandos de la comparación
-                comp_parts = re.split(r'(==|!=|<=|>=|<|>)', expr)
-                for part in comp_parts:
-                    part = part.strip()
-                    if part and not part in ['==', '!=', '<=', '>=', '<', '>'] and not part.replace('.', '', 1).isdigit() and part not in var_table:
-                        var_table[part] = next_var_addr
-                        next_var_addr += 1
-                        
-        elif line.startswith('return'):
-            ret_var = line.split()[1]
-            if ret_var not in var_table and not ret_var.replace('.', '', 1).isdigit():
-                var_table[ret_var] = next_var_addr
-                next_var_addr += 1
+def _constantes_de(instrucciones, tabla):
+    """Constantes numéricas de la unidad, en orden de primera aparición."""
+    constantes = []
+    vistas = {tabla.ids.get("0")}  # "0" siempre ocupa la dirección 0
+    literales = tabla.literales
+    for instr in instrucciones:
+        # Constantes en asignaciones y en los operandos de operaciones y comparaciones
+        if instr.tipo in (ASIGNACION, OPERACION, COMPARACION):
+            for simbolo in instr.operandos:
+                if literales[simbolo] and simbolo not in vistas:
+                    vistas.add(simbolo)
+                    constantes.append(tabla.nombres[simbolo])
+    return constantes
 
-    # --- Construir la sección de datos ---
-    total_addresses = next_var_addr  # Suma de direcciones usadas para constantes y variables
-    data_section = ["0"] * total_addresses  # Inicializar toda la memoria en "0"
-    # Colocar cada constante en su dirección asignada
-    for const, addr in const_table.items():
-        data_section[addr] = const
+def _variables_de(instrucciones, tabla):
+    """Variables de la unidad, en orden de primera aparición."""
+    variables = []
+    vistas = set()
+    literales = tabla.literales
+    def agregar(simbolo):
+        if simbolo not in vistas:
+            vistas.add(simbolo)
+            variables.append(tabla.nombres[simbolo])
 
-    # --- Generar la sección de código ---
-    code_section = []
-    asm_position = 0
+    for instr in instrucciones:
+        tipo = instr.tipo
+        if tipo == PARAM:
+            agregar(instr.operandos[0])
+        elif tipo in ASIGNACIONES:
+            agregar(instr.destino)
+            # Los operandos de las comparaciones también son variables
+            if tipo == COMPARACION:
+                for simbolo in instr.operandos:
+                    if not literales[simbolo]:
+                        agregar(simbolo)
+        elif tipo == RETORNO:
+            if not literales[instr.operandos[0]]:
+                agregar(instr.operandos[0])
+    return variables
 
-    # Mapeo de etiquetas a posiciones de código ensamblador
-    label_to_asm = {}
+# Instrucciones de máquina que se cuentan por cada tipo de instrucción TAC
+TAMANOS = {
+    OPERACION: 4,    # LOAD, LOAD, op, STORE
+    COMPARACION: 2,  # LOAD, LOAD (el salto lo emite el ifz)
+    ASIGNACION: 2,   # LOAD, STORE
+    LLAMADA: 2,      # CALL, STORE
+    EXPRESION: 2,
+    IFZ: 1,          # BEQ/BNE/BLT/JLE
+    GOTO: 1,         # JUMP
+    RETORNO: 3,      # LOAD, OUT, HALT
+}
 
-    # Primera pasada para identificar posiciones de etiquetas
-    current_position = len(data_section)
-    for line in tac_lines:
-        if line.startswith('begin_func'):
-            label = line.split(' ')[1]            
-            label_to_asm[label] = current_position
-            continue
-        if line.startswith('begin_func') or line.startswith('end_func') or line.startswith('param'):
-            continue
-        if line.startswith('L') and ':' in line:
-            label = line.split(':')[0]
-            label_to_asm[label] = current_position
-            continue
+def _etiquetas_de(instrucciones):
+    """
+    Posiciones relativas de las etiquetas y tamaño de la unidad.
+    
+    @return: Tupla (etiqueta -> desplazamiento, instrucciones contadas)
+    """
+    etiquetas = {}
+    current_position = 0
+    for instr in instrucciones:
+        if instr.tipo == INICIO_FUNCION or instr.tipo == ETIQUETA:
+            etiquetas[instr.etiqueta] = current_position
+        else:
+            current_position += TAMANOS.get(instr.tipo, 0)
+    return etiquetas, current_position
 
-        # Contar instrucciones para cada tipo de operación
-        if '=' in line and ' + ' in line:
-            current_position += 4  # LOAD, LOAD, ADD, STORE
-        elif '=' in line and ' - ' in line:
-            current_position += 4  # LOAD, LOAD, SUB, STORE
-        elif '=' in line and ' * ' in line:
-            current_position += 4  # LOAD, LOAD, MUL, STORE
-        elif '=' in line and ' / ' in line:
-            current_position += 4  # LOAD, LOAD, DIV, STORE
-        elif '=' in line and ' == ' in line:
-            current_position += 2  # LOAD, LOAD, CMP, STORE
-        elif '=' in line and ' != ' in line:
-            current_position += 2  # LOAD, LOAD
-        elif '=' in line and ' < ' in line:
-            current_position += 2  # LOAD, LOAD
-        elif '=' in line and ' <= ' in line:
-            current_position += 2  # LOAD, LOAD
-        elif '=' in line and ' > ' in line:
-            current_position += 2  # LOAD, LOAD
-        elif '=' in line and ' >= ' in line:
-            current_position += 2  # LOAD, LOAD
-        elif '=' in line and not line.startswith('ifz') and not line.startswith('goto'):
-            current_position += 2  # LOAD, STORE
-        elif line.startswith('ifz'):
-            current_position += 1  # BEQ
-        elif line.startswith('goto'):
-            current_position += 1  # JUMP
-        elif line.startswith('return'):
-            current_position += 3  # LOAD, OUT HALT
-            
-    debug_print("Tabla de etiquetas:", label_to_asm)
+# Entrada de código cuya traducción depende de si un nombre es variable del programa
+SI_VARIABLE = object()
+
+# Tipos de referencia simbólica de un fragmento:
+#   "op"      constante o variable (debe existir)
+#   "op0"     constante o variable; una variable desconocida se resuelve a 0x0
+#   "funcion" etiqueta que debe existir (destino de CALL)
+#   "etiqueta" etiqueta de salto que debe existir
+
+# Mapeo de operadores de comparación a instrucciones de salto
+INSTRUCCIONES_SALTO = {
+    "==": "BEQ", # Si no son iguales, salta y no ejecuta la instruccion dentro
+    "!=": "BNE", # Si no son diferentes, salta y no ejecuta la instruccion en la etiqueta
+    "<": "BLT", # se invierte el orden de los registros y si no es menor o igual se salta la instruccion
+    ">": "BLT", # si no es mayor se salta la instruccion
+    "<=": "JLE", # se invierte el orden de los registros y si no es menor se salta la instruccion
+    ">=": "JLE"  # si no es mayor o igual se salta la instruccion
+}
+
+def _codigo_de(instrucciones, tabla, primera_linea):
+    """
+    Genera el código simbólico de una unidad.
     
-    # Segunda pasada para generar código
+    @param primera_linea: Primera línea del programa completo (se traduce como CALL main)
+    @return: Tupla (código, ids de operandos requeridos)
+    """
+    code_section = []
+    requeridos = []
     pila_compare = []  # ✅ Pila para almacenar los operadores de comparación
-    for line in tac_lines:
-        debug_print(f"Procesando línea: {line}")
-        # Ignorar directivas de función y parámetros
-        if line == tac_lines[0]:
-            label = 'main'
-            target_addr = var_table[target]
-            label_addr = label_to_asm[label]
-            print("address:",label_to_asm,label_addr)
-            code_section.append(f"CALL [0x{label_addr:X}]")
-            asm_position += 1
-            continue
-        if line.startswith('begin_func') or line.startswith('end_func') or line.startswith('param'):
-            continue
-        # Ignorar etiquetas en esta pasada, ya las procesamos en la primera pasada
-        if line.startswith('L') and ':' in line:
+    literales = tabla.literales
+
+    for instr in instrucciones:
+        debug_print("Procesando línea:", instr.texto)
+        tipo = instr.tipo
+        if instr.texto == primera_linea:
+            code_section.append(("CALL [{0}]", (("funcion", 'main'),)))
             continue
 
-        # Operación de suma: a = b + c
-        if '=' in line and ' + ' in line:
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            target_addr = var_table[target]
-            left, right = [x.strip() for x in expr.split(' + ')]
-            
-            # Resolver la dirección: si es un literal, usar la tabla de constantes; si es una variable, usar la tabla de variables.
-            left_addr = const_table[left] if left.replace('.', '', 1).isdigit() else var_table[left]
-            right_addr = const_table[right] if right.replace('.', '', 1).isdigit() else var_table[right]
-            
-            code_section.append(f"LOAD R0, [0x{left_addr:X}]")
-            asm_position += 1
-            code_section.append(f"LOAD R1, [0x{right_addr:X}]")
-            asm_position += 1
-            
+        # Operaciones aritméticas: a = b + c, a = b - c, a = b * c, a = b / c
+        if tipo == OPERACION:
+            left, right = instr.operandos
+            code_section.append(("LOAD R0, [{0}]", (("op", left),)))
+            code_section.append(("LOAD R1, [{0}]", (("op", right),)))
             # FIXED: Changed format to match VM's expected bit pattern
             # Original: ADD R2, R0, R1
             # VM expects: destination register first, then operands
-            code_section.append("ADD R0, R1, R2")
-            asm_position += 1
-            
-            code_section.append(f"STORE R2, [0x{target_addr:X}]")
-            asm_position += 1
-
-        # Operación de resta: a = b - c
-        elif '=' in line and ' - ' in line:
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            target_addr = var_table[target]
-            left, right = [x.strip() for x in expr.split(' - ')]
-            
-            left_addr = const_table[left] if left.replace('.', '', 1).isdigit() else var_table[left]
-            right_addr = const_table[right] if right.replace('.', '', 1).isdigit() else var_table[right]
-            
-            code_section.append(f"LOAD R0, [0x{left_addr:X}]")
-            asm_position += 1
-            code_section.append(f"LOAD R1, [0x{right_addr:X}]")
-            asm_position += 1
-            
-            # FIXED: Changed format to match VM's expected bit pattern
-            code_section.append("SUB R0, R1, R2")
-            asm_position += 1
-            
-            code_section.append(f"STORE R2, [0x{target_addr:X}]")
-            asm_position += 1
-
-        # Operación de multiplicación: a = b * c
-        elif '=' in line and ' * ' in line:
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            target_addr = var_table[target]
-            left, right = [x.strip() for x in expr.split(' * ')]
-            
-            left_addr = const_table[left] if left.replace('.', '', 1).isdigit() else var_table[left]
-            right_addr = const_table[right] if right.replace('.', '', 1).isdigit() else var_table[right]
-            
-            code_section.append(f"LOAD R0, [0x{left_addr:X}]")
-            asm_position += 1
-            code_section.append(f"LOAD R1, [0x{right_addr:X}]")
-            asm_position += 1
-            
-            # FIXED: Changed format to match VM's expected bit pattern
-            code_section.append("MUL R0, R1, R2")
-            asm_position += 1
-            
-            code_section.append(f"STORE R2, [0x{target_addr:X}]")
-            asm_position += 1
-
-        # Operación de división: a = b / c
-        elif '=' in line and ' / ' in line:
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            target_addr = var_table[target]
-            left, right = [x.strip() for x in expr.split(' / ')]
-            
-            left_addr = const_table[left] if left.replace('.', '', 1).isdigit() else var_table[left]
-            right_addr = const_table[right] if right.replace('.', '', 1).isdigit() else var_table[right]
-            
-            code_section.append(f"LOAD R0, [0x{left_addr:X}]")
-            asm_position += 1
-            code_section.append(f"LOAD R1, [0x{right_addr:X}]")
-            asm_position += 1
-            
-            # FIXED: Changed format to match VM's expected bit pattern
-            code_section.append("DIV R0, R1, R2")
-            asm_position += 1
-            
-            code_section.append(f"STORE R2, [0x{target_addr:X}]")
-            asm_position += 1
-        
-        # Operación de igualdad: a = b == c
-        elif '=' in line and ' == ' in line:
-            pila_compare.append('==')
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            target_addr = var_table[target]
-            left, right = [x.strip() for x in expr.split(' == ')]
-            
-            left_addr = const_table[left] if left.replace('.', '', 1).isdigit() else var_table[left]
-            right_addr = const_table[right] if right.replace('.', '', 1).isdigit() else var_table[right]
-            
-            code_section.append(f"LOAD R0, [0x{left_addr:X}]")
-            asm_position += 1
-            code_section.append(f"LOAD R1, [0x{right_addr:X}]")
-            asm_position += 1
-            # code_section.append(f"STORE R0, [0x{target_addr:X}]")  # Almacenar 0
-            # asm_position += 1
-            # code_section.append(f"LOAD R2, [0x1]")  # Cargar 1
-            # asm_position += 1
-            # code_section.append(f"STORE R2, [0x{target_addr:X}]")  # Almacenar 1
-            # asm_position += 1
-
-        # Manejar asignaciones simples: var = literal o var = otra_var
-        elif '=' in line and not line.startswith('ifz') and not line.startswith('goto'):
-            target, expr = [x.strip() for x in line.split('=', 1)]
-            target_addr = var_table[target]
-            
-            # Manejo de expresiones de comparación
-            if '==' in expr or '!=' in expr or '<' in expr or '<=' in expr or '>' in expr or '>=' in expr:
-                # Aquí implementar la lógica para manejar comparaciones
-                # Este sería el punto donde necesitamos manejar "a == b" y similares
-                op_match = re.search(r'(==|!=|<=|>=|<|>)', expr)
-                if op_match:
-                    op = op_match.group(1)
-                    left, right = [x.strip() for x in expr.split(op)]
-                    
-                    # Obtener direcciones de los operandos
-                    left_addr = const_table[left] if left.replace('.', '', 1).isdigit() else var_table.get(left, 0)
-                    right_addr = const_table[right] if right.replace('.', '', 1).isdigit() else var_table.get(right, 0)
-                    
-                    # Generar código para la comparación
-                    code_section.append(f"LOAD R0, [0x{left_addr:X}]")
-                    asm_position += 1
-                    code_section.append(f"LOAD R1, [0x{right_addr:X}]")
-                    asm_position += 1
-                    pila_compare.append(op)
-                else:
-                    code_section.append(f"# Expresión de comparación no reconocida: {expr}")
-                    asm_position += 1
-            # Asignación de constante
-            elif expr.replace('.', '', 1).isdigit():
-                const_addr = const_table[expr]
-                code_section.append(f"LOAD R0, [0x{const_addr:X}]")
-                asm_position += 1
-                code_section.append(f"STORE R0, [0x{target_addr:X}]")
-                asm_position += 1
-            # Asignación de variable
-            elif expr in var_table:
-                source_addr = var_table[expr]
-                code_section.append(f"LOAD R0, [0x{source_addr:X}]")
-                asm_position += 1
-                code_section.append(f"STORE R0, [0x{target_addr:X}]")
-                asm_position += 1
-             # Asignacion de llamada a función: var = call func, num_args
-            elif 'call' in line:
-                target, call_expr = [x.strip() for x in line.split('=', 1)]
-                label, num_args = call_expr.split(', ')
-                label = label.split()[1]
-                target_addr = var_table[target]
-
-                label_addr = label_to_asm[label]
-                print("address:",label_to_asm,label_addr)
-                code_section.append(f"CALL [0x{label_addr:X}]")
-                asm_position += 1
-                print("solo funciona con un argumento, argumentos:",num_args)
-                code_section.append(f"STORE R0, [0x{target_addr:X}]")
-                asm_position += 1
-
-            # Caso no reconocido
+            code_section.append((f"{OPERADORES[instr.operador]} R0, R1, R2", ()))
+            code_section.append(("STORE R2, [{0}]", (("op", instr.destino),)))
+
+        # Comparaciones: a = b == c, a = b < c, ... (el salto lo genera el ifz)
+        elif tipo == COMPARACION:
+            left, right = instr.operandos
+            # La igualdad exige que los operandos existan; en las demás una
+            # variable desconocida se lee de la dirección 0
+            ref = "op" if instr.operador == "==" else "op0"
+            code_section.append(("LOAD R0, [{0}]", ((ref, left),)))
+            code_section.append(("LOAD R1, [{0}]", ((ref, right),)))
+            pila_compare.append(instr.operador)
+
+        # Asignaciones simples: var = literal o var = otra_var
+        elif tipo == ASIGNACION:
+            fuente = instr.operandos[0]
+            if literales[fuente]:
+                code_section.append(("LOAD R0, [{0}]", (("op", fuente),)))
+                code_section.append(("STORE R0, [{0}]", (("op", instr.destino),)))
             else:
-                code_section.append(f"# Expresión no reconocida: {expr}")
-                asm_position += 1
+                # Si `fuente` es una variable del programa (puede estar definida en
+                # otra unidad) se copia; si no, la expresión no se reconoce
+                copia = [("LOAD R0, [{0}]", (("op", fuente),)),
+                         ("STORE R0, [{0}]", (("op", instr.destino),))]
+                otro = [(f"# Expresión no reconocida: {tabla.nombres[fuente]}", None)]
+                code_section.append((SI_VARIABLE, (fuente, copia, otro)))
+
+        # Asignacion de llamada a función: var = call func, num_args
+        elif tipo == LLAMADA:
+            debug_print("solo funciona con un argumento:", instr.texto)
+            code_section.append(("CALL [{0}]", (("funcion", instr.funcion),)))
+            code_section.append(("STORE R0, [{0}]", (("op", instr.destino),)))
+
+        elif tipo == EXPRESION:
+            expr = instr.texto.split('=', 1)[1].strip()
+            code_section.append((f"# Expresión no reconocida: {expr}", None))
 
         # Instrucción condicional: ifz condición goto etiqueta
-        elif line.startswith('ifz'):
+        elif tipo == IFZ:
             comparacion = pila_compare.pop()  # ✅ Extrae el último operador de comparación
-            parts = line.split()
-            cond = parts[1]
-            goto_label = parts[3]
-            cond_addr = const_table[cond] if cond.replace('.', '', 1).isdigit() else var_table[cond]
-
-            # Mapeo de operadores a instrucciones de ensamblador
-            instrucciones_salto = {
-                "==": "BEQ", # Si no son iguales, salta y no ejecuta la instruccion dentro
-                "!=": "BNE", # Si no son diferentes, salta y no ejecuta la instruccion en la etiqueta
-                "<": "BLT", # se invierte el orden de los registros y si no es menor o igual se salta la instruccion
-                ">": "BLT", # si no es mayor se salta la instruccion
-                "<=": "JLE", # se invierte el orden de los registros y si no es menor se salta la instruccion
-                ">=": "JLE"  # si no es mayor o igual se salta la instruccion
-            }
-
-            instr_salto = instrucciones_salto.get(comparacion, "NOP")
+            requeridos.append(instr.operandos[0])
+            instr_salto = INSTRUCCIONES_SALTO.get(comparacion, "NOP")
             # Generación del código de salto con base en las instrucciones de comparación
-            if comparacion in ["==", "!="]:
-                if goto_label in label_to_asm:
-                    code_section.append(f"{instr_salto} R0, R1, [0x{label_to_asm[goto_label]:X}]")
-                else:
-                    code_section.append(f"{instr_salto} R0, R1, [{goto_label}]")
-            elif comparacion in ["<", "<=", ">", ">="]:
-                if comparacion in [">", ">="]:
-                    if goto_label in label_to_asm:
-                        code_section.append(f"{instr_salto} R1, R0, [0x{label_to_asm[goto_label]:X}]")
-                    else:
-                        code_section.append(f"{instr_salto} R1, R0, [{goto_label}]")
-                else:
-                    if goto_label in label_to_asm:
-                        code_section.append(f"{instr_salto} R0, R1, [0x{label_to_asm[goto_label]:X}]")
-                    else:
-                        code_section.append(f"{instr_salto} R0, R1, [{goto_label}]")
-
-            asm_position += 1
+            if comparacion in [">", ">="]:
+                code_section.append((f"{instr_salto} R1, R0, [{{0}}]", (("etiqueta", instr.etiqueta),)))
+            elif comparacion in ["==", "!=", "<", "<="]:
+                code_section.append((f"{instr_salto} R0, R1, [{{0}}]", (("etiqueta", instr.etiqueta),)))
 
         # Salto incondicional: goto etiqueta
-        elif line.startswith('goto'):
-            goto_label = line.split()[1]
-            if goto_label in label_to_asm:
-                code_section.append(f"JUMP [0x{label_to_asm[goto_label]:X}]")
-            else:
-                code_section.append(f"JUMP [{goto_label}]")
-            asm_position += 1
+        elif tipo == GOTO:
+            code_section.append(("JUMP [{0}]", (("etiqueta", instr.etiqueta),)))
 
         # Retorno de función: return variable
-        elif line.startswith('return'):
-            ret_var = line.split()[1]
-            if ret_var.replace('.', '', 1).isdigit():
-                ret_addr = const_table[ret_var]
-            else:
-                ret_addr = var_table[ret_var]
-                
-            code_section.append(f"LOAD R0, [0x{ret_addr:X}]")
-            asm_position += 1
-            code_section.append("OUT R0")
-            asm_position += 1
-            code_section.append("HALT")
-            asm_position += 1
+        elif tipo == RETORNO:
+            code_section.append(("LOAD R0, [{0}]", (("op", instr.operandos[0]),)))
+            code_section.append(("OUT R0", ()))
+            code_section.append(("HALT", ()))
 
         # Instrucción no implementada o no reconocida
-        else:
-            code_section.append(f"# Instrucción no implementada: {line}")
-            asm_position += 1
-
-    # Resolver referencias a etiquetas en el código
-    fixed_code_section = []
-    for instr in code_section:
-        if instr.startswith("#"):
-            fixed_code_section.append(instr)
-        else:
-            modified_instr = instr
-            for label, pos in label_to_asm.items():
-                if f"[{label}]" in modified_instr:
-                    modified_instr = modified_instr.replace(f"[{label}]", f"[0x{pos:X}]")
-            fixed_code_section.append(modified_instr)
+        elif tipo == DESCONOCIDA:
+            code_section.append((f"# Instrucción no implementada: {instr.texto}", None))
+
+        # Directivas de función, parámetros y etiquetas no generan código
+
+    return code_section, requeridos
+
+# Registros de propósito general de la máquina virtual (R0–R3)
+REGISTROS = 4
+
+def _lecturas(instr):
+    """Ids cuyo valor lee el código de la instrucción (la condición del ifz no se carga)."""
+    if instr.tipo in (ASIGNACION, OPERACION, COMPARACION, RETORNO):
+        return instr.operandos
+    return ()
+
+def _codigo_con_registros(instrucciones, tabla, primera_linea):
+    """
+    Genera el código simbólico de una unidad manteniendo los valores en R0–R3
+    dentro de cada bloque básico, en lugar de cargar los operandos y guardar el
+    resultado en cada instrucción.
+
+    Cada registro puede tener varios nombres con el mismo valor (tras una copia) y
+    un nombre es "sucio" si su valor en memoria no está al día. Los operandos se
+    cargan solo si no están en un registro; al necesitar un registro se libera el
+    que se vuelve a leer más tarde en el bloque (guardando sus nombres sucios si se
+    leen después). Al salir del bloque (salto, llamada, return o etiqueta) se guardan
+    las variables sucias; los temporales solo si se leen en otro bloque. Tras un ifz
+    se conservan los valores ya guardados en el camino que no salta.
+
+    El resultado de una operación no queda en su registro: se guarda en seguida (si
+    se lee después) y cada uso lo vuelve a cargar, para que pase por la palabra de
+    memoria como en los niveles 0 y 1 (los flotantes se redondean al guardarse y los
+    enteros se recortan a 21 bits). Así los registros solo tienen valores leídos de
+    la memoria, que no cambian al guardarse de nuevo.
+
+    Solo se usa si la traducción del programa es exacta y cada comparación va seguida
+    de su ifz (ver src/optimizador.py). Como las instrucciones ya no ocupan lo que
+    cuenta TAMANOS, las etiquetas se ubican con el código generado.
+
+    @param primera_linea: Primera línea del programa completo (se traduce como CALL main)
+    @return: Tupla (código, ids de operandos requeridos, etiqueta -> desplazamiento,
+             instrucciones contadas)
+    """
+    code_section = []
+    requeridos = []
+    etiquetas = {}
+    posicion = 0
+    nombres = tabla.nombres
+
+    # Bloque de cada instrucción y, por temporal, si su valor debe guardarse en
+    # memoria al salir de un bloque: se lee en otro bloque, antes de definirse en el
+    # suyo (p. ej. en un ciclo), en un parámetro o como subíndice de otro nombre
+    bloques = list(bloques_basicos(instrucciones))
+    bloque_de = [0] * len(instrucciones)
+    for numero, (inicio, fin) in enumerate(bloques):
+        bloque_de[inicio:fin] = [numero] * (fin - inicio)
+    leido_en = {}
+    siempre = indices_de(tabla)
+    for numero, (inicio, fin) in enumerate(bloques):
+        definidos = set()
+        for instr in instrucciones[inicio:fin]:
+            if instr.tipo == PARAM:
+                siempre.update(instr.operandos)
+            for simbolo in _lecturas(instr):
+                # Una lectura antes de la definición en el bloque cuenta como de otro bloque
+                leido_en.setdefault(simbolo, set()).add(numero if simbolo in definidos else -1)
+            if instr.tipo in (ASIGNACION, OPERACION, LLAMADA):
+                definidos.add(instr.destino)
+
+    def guardar_al_salir(simbolo, bloque):
+        if not es_temporal(nombres[simbolo]) or simbolo in siempre:
+            return True
+        return bool(leido_en.get(simbolo, set()) - {bloque})
+
+    vinculos = {}   # id -> registro que tiene su valor
+    sucios = set()  # ids cuyo valor en memoria está desactualizado
+
+    def emitir(formato, refs=()):
+        nonlocal posicion
+        code_section.append((formato, refs))
+        posicion += 1
+
+    def proxima_lectura(simbolo, desde):
+        # Posición de la siguiente lectura en el bloque actual (None si no hay)
+        for numero in range(desde, fin_bloque):
+            if simbolo in _lecturas(instrucciones[numero]):
+                return numero
+        return None
+
+    def contenido(registro):
+        return [simbolo for simbolo, otro in vinculos.items() if otro == registro]
+
+    def liberar(registro, desde):
+        for simbolo in contenido(registro):
+            if simbolo in sucios and (guardar_al_salir(simbolo, bloque)
+                                      or proxima_lectura(simbolo, desde) is not None):
+                emitir(f"STORE R{registro}, [{{0}}]", (("op", simbolo),))
+            sucios.discard(simbolo)
+            del vinculos[simbolo]
+
+    def registro_libre(fijos, desde):
+        # Un registro vacío o el que más tarde se vuelve a leer en el bloque
+        def prioridad(registro):
+            lecturas = [proxima_lectura(simbolo, desde) for simbolo in contenido(registro)]
+            if not lecturas:
+                return (2, 0)
+            if all(lectura is None for lectura in lecturas):
+                return (1, -sum(simbolo in sucios for simbolo in contenido(registro)))
+            return (0, min(lectura for lectura in lecturas if lectura is not None))
+        registro = max((r for r in range(REGISTROS) if r not in fijos), key=prioridad)
+        liberar(registro, desde)
+        return registro
+
+    def obtener(simbolo, fijos, numero):
+        registro = vinculos.get(simbolo)
+        if registro is None:
+            registro = registro_libre(fijos, numero)
+            emitir(f"LOAD R{registro}, [{{0}}]", (("op", simbolo),))
+            vinculos[simbolo] = registro
+        return registro
+
+    def olvidar(simbolo):
+        vinculos.pop(simbolo, None)
+        sucios.discard(simbolo)
+
+    def salir(bloque, conservar=False):
+        # Guarda lo que se lee fuera del bloque; si `conservar`, los valores guardados
+        # siguen en sus registros (camino que no salta de un ifz)
+        for registro in range(REGISTROS):
+            for simbolo in contenido(registro):
+                if simbolo in sucios and guardar_al_salir(simbolo, bloque):
+                    emitir(f"STORE R{registro}, [{{0}}]", (("op", simbolo),))
+                    sucios.discard(simbolo)
+        for simbolo in list(vinculos):
+            if not conservar or simbolo in sucios:
+                olvidar(simbolo)
+
+    for numero, instr in enumerate(instrucciones):
+        debug_print("Procesando línea:", instr.texto)
+        tipo = instr.tipo
+        bloque = bloque_de[numero]
+        fin_bloque = bloques[bloque][1]
+        siguiente = numero + 1
+        if tipo in (ASIGNACION, OPERACION, COMPARACION, RETORNO, IFZ):
+            requeridos.extend(instr.operandos)
+
+        if tipo in (INICIO_FUNCION, ETIQUETA):
+            if numero:
+                salir(bloque_de[numero - 1])
+            etiquetas[instr.etiqueta] = posicion
+        if instr.texto == primera_linea:
+            # CALL main no se cuenta (las etiquetas lo compensan con el +1 del salto)
+            salir(bloque)
+            code_section.append(("CALL [{0}]", (("funcion", 'main'),)))
+            posicion += TAMANOS.get(tipo, 0)
+            continue
+
+        if tipo == OPERACION:
+            left, right = instr.operandos
+            fijos = {vinculos[simbolo] for simbolo in instr.operandos if simbolo in vinculos}
+            registro_izquierdo = obtener(left, fijos, numero)
+            registro_derecho = obtener(right, fijos | {registro_izquierdo}, numero)
+            # El destino puede ser uno de los operandos: la máquina los lee antes de escribir
+            olvidar(instr.destino)
+            destino = registro_libre((), siguiente)
+            emitir(f"{OPERADORES[instr.operador]} R{registro_izquierdo}, R{registro_derecho}, R{destino}")
+            if guardar_al_salir(instr.destino, bloque) or proxima_lectura(instr.destino, siguiente) is not None:
+                emitir(f"STORE R{destino}, [{{0}}]", (("op", instr.destino),))
+
+        elif tipo == COMPARACION:
+            # La comparación solo carga sus operandos; el salto lo genera el ifz siguiente
+            left, right = instr.operandos
+            fijos = {vinculos[simbolo] for simbolo in instr.operandos if simbolo in vinculos}
+            registro_izquierdo = obtener(left, fijos, numero)
+            registro_derecho = obtener(right, fijos | {registro_izquierdo}, numero)
+
+        elif tipo == ASIGNACION:
+            fuente = instr.operandos[0]
+            if fuente != instr.destino:
+                registro = obtener(fuente, (), numero)
+                olvidar(instr.destino)
+                vinculos[instr.destino] = registro
+                sucios.add(instr.destino)
+
+        elif tipo == LLAMADA:
+            salir(bloque)
+            emitir("CALL [{0}]", (("funcion", instr.funcion),))
+            emitir("STORE R0, [{0}]", (("op", instr.destino),))
+
+        elif tipo == IFZ:
+            salir(bloque, conservar=True)
+            comparacion = instrucciones[numero - 1].operador
+            if comparacion in (">", ">="):
+                registro_izquierdo, registro_derecho = registro_derecho, registro_izquierdo
+            emitir(f"{INSTRUCCIONES_SALTO[comparacion]} R{registro_izquierdo}, R{registro_derecho}, [{{0}}]",
+                   (("etiqueta", instr.etiqueta),))
+
+        elif tipo == GOTO:
+            salir(bloque)
+            emitir("JUMP [{0}]", (("etiqueta", instr.etiqueta),))
+
+        elif tipo == RETORNO:
+            registro = obtener(instr.operandos[0], (), numero)
+            salir(bloque)
+            emitir(f"OUT R{registro}")
+            emitir("HALT")
+
+        elif tipo == FIN_FUNCION:
+            salir(bloque)
+
+    if instrucciones:
+        salir(bloque_de[-1])
+    return code_section, requeridos, etiquetas, posicion
+
+@lru_cache(maxsize=1024)
+def traducir_unidad(lineas, primera_linea, registros=False):
+    """
+    Traduce una unidad de TAC a un fragmento simbólico. Las líneas se leen una sola
+    vez para obtener su IR (src/tac_ir.py) y las pasadas trabajan sobre ella. El
+    resultado se guarda en memoria: al recompilar solo se traducen de nuevo las
+    funciones cuyo TAC cambió.
+    
+    @param lineas: Tupla de líneas TAC de la unidad
+    @param primera_linea: Primera línea del programa completo
+    @param registros: Si los valores se mantienen en registros (ver `usar_registros`)
+    @return: Fragmento
+    """
+    instrucciones, tabla = analizar(lineas)
+    if registros and comparaciones_emparejadas(instrucciones):
+        codigo, requeridos, etiquetas, tamano = _codigo_con_registros(instrucciones, tabla, primera_linea)
+    else:
+        etiquetas, tamano = _etiquetas_de(instrucciones)
+        codigo, requeridos = _codigo_de(instrucciones, tabla, primera_linea)
+    funcion = instrucciones[0].etiqueta if instrucciones[0].tipo == INICIO_FUNCION else None
+    constantes_retorno = [tabla.nombres[instr.operandos[0]] for instr in instrucciones
+                          if instr.tipo == RETORNO and tabla.literales[instr.operandos[0]]]
+    return Fragmento(funcion, tabla.nombres, tabla.literales,
+                     _constantes_de(instrucciones, tabla), _variables_de(instrucciones, tabla),
+                     etiquetas, tamano, codigo, requeridos, constantes_retorno)
+
+
+def usar_registros(unidades, nivel):
+    """
+    Si el código de las unidades mantiene los valores en registros: desde el nivel 2
+    y solo si la traducción del programa es exacta (ver src/optimizador.py).
+    
+    @param unidades: Unidades TAC del programa, ya optimizadas
+    @param nivel: Nivel de optimización
+    @return: bool
+    """
+    return nivel >= 2 and traduccion_exacta(unidades)
+
+
+def direcciones_etiquetas(fragmentos, inicio):
+    """
+    Dirección de cada etiqueta (incluidas las funciones) cuando el código de los
+    fragmentos se coloca en orden a partir de `inicio`.
     
+    @param fragmentos: Lista de Fragmento en el orden del programa
+    @param inicio: Dirección de la primera instrucción (tamaño de la sección de datos)
+    @return: Diccionario etiqueta -> dirección
+    """
+    label_to_asm = {}
+    current_position = inicio
+    for fragmento in fragmentos:
+        for label, desplazamiento in fragmento.etiquetas.items():
+            label_to_asm[label] = current_position + desplazamiento
+        current_position += fragmento.tamano
+    return label_to_asm
+
+def enlazar_fragmentos(fragmentos, externas=None):
+    """
+    Asigna direcciones a los fragmentos de todas las unidades y genera el ensamblador.
+    
+    Las constantes y variables de cada unidad se fusionan en orden (sin repetir),
+    lo que reproduce la distribución de memoria de traducir el programa completo:
+    constantes desde la dirección 0 ("0" siempre en la 0), luego variables, y el
+    código a continuación de la sección de datos. Las variables y temporales no se
+    escriben una por una: la sección de datos termina con una línea ".reservar N"
+    que el cargador llena con el dato 0.
+    
+    @param fragmentos: Lista de Fragmento en el orden del programa
+    @param externas: Si se da una lista, las llamadas a funciones que no están en los
+                     fragmentos se emiten como "[nombre]" (para el enlazador de objetos)
+                     y sus nombres se agregan a la lista; si no, son un error
+    @return: Tupla (sección de datos, lista con el código de cada unidad)
+    @raises ErrorEtiqueta: Si algún salto o llamada usa una etiqueta no definida
+    @raises ErrorOperando: Si una instrucción lee una variable que nunca se asigna
+    """
+    # --- Construir la tabla de constantes ---
+    const_table = {"0": 0}
+    for fragmento in fragmentos:
+        for const in fragmento.constantes:
+            if const not in const_table:
+                const_table[const] = len(const_table)
+    # Las constantes que solo aparecen en un `return` (p. ej. porque el optimizador
+    # plegó la instrucción que las registraba) van al final de la tabla
+    for fragmento in fragmentos:
+        for const in fragmento.constantes_retorno:
+            if const not in const_table:
+                const_table[const] = len(const_table)
+
+    # --- Construir la tabla de variables ---
+    var_table = {}
+    next_var_addr = len(const_table)  # Las variables se asignan tras las constantes
+    for fragmento in fragmentos:
+        for var in fragmento.variables:
+            if var not in var_table:
+                var_table[var] = next_var_addr
+                next_var_addr += 1
+
+    # --- Construir la sección de datos ---
+    # Cada constante en su dirección asignada y una reserva en 0 para las variables
+    data_section = list(const_table)
+    if var_table:
+        data_section.append(linea_reserva(len(var_table)))
+
+    # Mapeo de etiquetas a posiciones de código ensamblador
+    label_to_asm = direcciones_etiquetas(fragmentos, next_var_addr)
+    debug_print("Tabla de etiquetas:", label_to_asm)
+
+    # Referencias a etiquetas o funciones que no existen: (nombre, función donde aparece)
+    sin_resolver = []
+
+    def resolver_etiqueta(tipo, nombre, fragmento):
+        direccion_etiqueta = label_to_asm.get(nombre)
+        if direccion_etiqueta is not None:
+            return f"0x{direccion_etiqueta:X}"
+        if tipo == "funcion" and externas is not None:
+            if nombre not in externas:
+                externas.append(nombre)
+            return nombre
+        sin_resolver.append((nombre, fragmento.funcion))
+        return nombre
+
+    codigo_unidades = []
+    for fragmento in fragmentos:
+        # Dirección de cada id de símbolo de la unidad: los literales en la tabla de
+        # constantes y las variables en la tabla de variables (None si no existe)
+        nombres = fragmento.simbolos
+        direcciones = [const_table.get(nombre) if literal else var_table.get(nombre)
+                       for nombre, literal in zip(nombres, fragmento.literales)]
+
+        def direccion(simbolo):
+            addr = direcciones[simbolo]
+            if addr is None:
+                raise ErrorOperando(nombres[simbolo], fragmento.funcion)
+            return addr
+
+        def resolver(tipo, ref):
+            if tipo == "op":
+                return f"0x{direccion(ref):X}"
+            if tipo == "op0":
+                # Una variable desconocida se resuelve a 0x0 (una constante debe existir)
+                if direcciones[ref] is None and not fragmento.literales[ref]:
+                    return "0x0"
+                return f"0x{direccion(ref):X}"
+            return resolver_etiqueta(tipo, ref, fragmento)
+
+        def emitir(entradas, destino):
+            for formato, refs in entradas:
+                if formato is SI_VARIABLE:
+                    simbolo, copia, otro = refs
+                    emitir(copia if nombres[simbolo] in var_table else otro, destino)
+                elif refs is None:
+                    destino.append(formato)
+                else:
+                    destino.append(formato.format(*[resolver(tipo, ref) for tipo, ref in refs]))
+
+        for simbolo in fragmento.requeridos:
+            direccion(simbolo)
+        codigo = []
+        emitir(fragmento.codigo, codigo)
+        codigo_unidades.append(codigo)
+
+    if sin_resolver:
+        raise ErrorEtiqueta(sin_resolver)
+
     debug_print("Tabla de constantes:", const_table)
     debug_print("Tabla de variables:", var_table)
     debug_print("Sección de datos:", data_section)
-    debug_print("Sección de código:", fixed_code_section)
-    return data_section, fixed_code_section
+    return data_section, codigo_unidades
+
+@lru_cache(maxsize=1024)
+def _operandos_de_unidad(lineas):
+    """
+    Variables que define una unidad y variables cuya dirección necesita su código
+    sin optimizar (operandos de las operaciones y condiciones de los `ifz`).
+
+    @return: Tupla (nombre de la función o None, variables definidas, variables leídas)
+    """
+    instrucciones, tabla = analizar(lineas)
+    leidas = []
+    for instr in instrucciones:
+        if instr.tipo == OPERACION:
+            simbolos = instr.operandos
+        elif instr.tipo == IFZ:
+            simbolos = instr.operandos[:1]
+        else:
+            continue
+        leidas += [tabla.nombres[simbolo] for simbolo in simbolos if not tabla.literales[simbolo]]
+    funcion = instrucciones[0].etiqueta if instrucciones[0].tipo == INICIO_FUNCION else None
+    return funcion, frozenset(_variables_de(instrucciones, tabla)), tuple(leidas)
+
+def comprobar_operandos(unidades):
+    """
+    Comprueba, antes de optimizar, que cada variable que lee el programa se asigne en
+    alguna unidad. Las pasadas pueden quitar la instrucción que la lee (p. ej. un
+    temporal que nunca se usa), y sin esta comprobación el mismo TAC fallaría en
+    -O0 y se traduciría en -O2.
+
+    @param unidades: Unidades TAC del programa (tuplas de líneas), sin optimizar
+    @raises ErrorOperando: Con la primera variable leída que no se asigna
+    """
+    resumenes = [_operandos_de_unidad(unidad) for unidad in unidades]
+    definidas = set().union(*(variables for _, variables, _ in resumenes))
+    for funcion, _, leidas in resumenes:
+        for nombre in leidas:
+            if nombre not in definidas:
+                raise ErrorOperando(nombre, funcion)
+
+def traducir_por_unidades(tac, bibliotecas=(), nivel=NIVEL_POR_DEFECTO):
+    """
+    Traduce TAC a ensamblador conservando la división por unidades (funciones).
+    Solo se traducen las unidades que no están en la caché de `traducir_unidad`.
+    
+    @param tac: Texto TAC, lista de líneas o ruta a un archivo TAC
+    @param bibliotecas: TAC de las bibliotecas importadas (ver src/bibliotecas.py); sus
+                        funciones se enlazan después de las del programa
+    @param nivel: Nivel de optimización del TAC (ver src/optimizador.py)
+    @return: Tupla (sección de datos, lista con el código de cada unidad)
+    """
+    tac_lines = leer_tac(tac)
+    primera_linea = tac_lines[0] if tac_lines else None
+    unidades = dividir_unidades(tac_lines)
+    for biblioteca in bibliotecas:
+        unidades += dividir_unidades(leer_tac(biblioteca))
+    comprobar_operandos(unidades)
+    unidades = optimizar_unidades(unidades, nivel)
+    registros = usar_registros(unidades, nivel)
+    fragmentos = [traducir_unidad(unidad, primera_linea, registros) for unidad in unidades]
+    return enlazar_fragmentos(fragmentos)
+
+def traducir_modulo(tac, entrada=True, nivel=NIVEL_POR_DEFECTO):
+    """
+    Traduce el TAC de un módulo que se enlaza por separado (ver src/objeto.py).
+    Las llamadas a funciones que el módulo no define quedan como "[nombre]".
+    
+    @param tac: Texto TAC, lista de líneas o ruta a un archivo TAC
+    @param entrada: Si es True, la primera línea se traduce como CALL main (módulo
+                    principal); los demás módulos solo aportan sus funciones
+    @param nivel: Nivel de optimización del TAC (ver src/optimizador.py)
+    @return: Tupla (sección de datos, sección de código, funciones exportadas como
+             nombre -> dirección relativa, funciones importadas)
+    """
+    tac_lines = leer_tac(tac)
+    primera_linea = tac_lines[0] if tac_lines and entrada else None
+    unidades = dividir_unidades(tac_lines)
+    comprobar_operandos(unidades)
+    unidades = optimizar_unidades(unidades, nivel)
+    registros = usar_registros(unidades, nivel)
+    fragmentos = [traducir_unidad(unidad, primera_linea, registros) for unidad in unidades]
+    importa = []
+    data_section, codigo_unidades = enlazar_fragmentos(fragmentos, importa)
+    direcciones = direcciones_etiquetas(fragmentos, tamano_datos(data_section))
+    exporta = {unidad[0].split()[1]: direcciones[unidad[0].split()[1]]
+               for unidad in unidades if unidad[0].startswith('begin_func')}
+    code_section = [instr for codigo in codigo_unidades for instr in codigo]
+    # Las funciones exportadas se llaman desde otros módulos: la mirilla las conserva
+    code_section, reubicar = optimizar_codigo(code_section, tamano_datos(data_section),
+                                              reglas_de_nivel(nivel), exporta.values())
+    exporta = {funcion: reubicar(direccion) for funcion, direccion in exporta.items()}
+    return data_section, code_section, exporta, importa
+
+def tac_to_assembly(tac, bibliotecas=(), nivel=NIVEL_POR_DEFECTO, estadisticas=None):
+    """
+    Traduce código de Tres Direcciones (TAC) a instrucciones de ensamblador para una máquina virtual simple.
+    
+    Este proceso incluye:
+    1. División del TAC en unidades (funciones) y traducción simbólica de cada una
+    2. Construcción de tablas de constantes y variables
+    3. Asignación de direcciones de memoria
+    4. Resolución de etiquetas de salto
+    5. Optimización de mirilla del código resultante (src/mirilla.py), desde el nivel 1
+    
+    Se puede llamar directamente desde Python (interfaz gráfica, otras herramientas)
+    sin lanzar un intérprete ni pasar por archivos.
+    
+    @param tac: Texto TAC, lista de líneas o ruta a un archivo TAC
+    @param bibliotecas: TAC de las bibliotecas importadas a enlazar con el programa
+    @param nivel: Nivel de optimización (ver src/optimizador.py y src/mirilla.py)
+    @param estadisticas: Counter opcional donde se suman los cambios de cada regla de mirilla
+    @return: Tupla con (sección de datos, sección de código)
+    @raises ErrorEtiqueta: Si algún salto o llamada usa una etiqueta no definida
+    @raises ErrorOperando: Si una instrucción lee una variable que nunca se asigna
+    """
+    data_section, codigo_unidades = traducir_por_unidades(tac, bibliotecas, nivel)
+    code_section = [instr for codigo in codigo_unidades for instr in codigo]
+    code_section, _ = optimizar_codigo(code_section, tamano_datos(data_section),
+                                       reglas_de_nivel(nivel), estadisticas=estadisticas)
+    debug_print("Sección de código:", code_section)
+    return data_section, code_section
 
 def main():
     """
     Función principal que procesa los argumentos de línea de comandos, 
     llama al traductor TAC-a-ensamblador y escribe el resultado en un archivo.
     
-    Uso desde línea de comandos: python TAC.py <archivo_entrada.tac>
+    Uso desde línea de comandos: python TAC.py [--debug] [-O0|-O1|-O2] <archivo_entrada.tac>
     El archivo de salida tendrá el mismo nombre pero con extensión .asm
     """
-    if len(sys.argv) != 2:
-        print("Uso: python TAC.py <archivo_entrada.tac>")
+    global DEBUG
+    args = sys.argv[1:]
+    nivel = NIVEL_POR_DEFECTO
+    while args and args[0] in ('--debug', '-O0', '-O1', '-O2'):
+        if args[0] == '--debug':
+            DEBUG = True
+        else:
+            nivel = int(args[0][2:])
+        args = args[1:]
+    if len(args) != 1:
+        print("Uso: python TAC.py [--debug] [-O0|-O1|-O2] <archivo_entrada.tac>")
+        sys.exit(1)
+    tac_file = args[0]
+    with open(tac_file, 'r', encoding='utf-8') as f:
+        tac = f.read()
+    try:
+        data_section, code_section = tac_to_assembly(tac, nivel=nivel)
+    except (ErrorEtiqueta, ErrorOperando) as e:
+        print(f"Error: {e}")
         sys.exit(1)
-    tac_file = sys.argv[1]
-    data_section, code_section = tac_to_assembly(tac_file)
     output_file = tac_file.replace('.tac', '.asm')
     with open(output_file, 'w', encoding='utf-8') as f:
-        for data in data_section:
-            f.write(f"{data}\n")
-        for instr in code_section:
-            f.write(f"{instr}\n")
+        f.write(formatear_asm(data_section, code_section))
     print(f"\nCódigo ensamblador escrito en {output_file}")
 
 if __name__ == "__main__":
@@ -67,7 +67,7 @@
 
 
 /* First part of user prologue.  */
-#line 1 ".\\analizador_sintactico.y"
+#line 1 "analizador_sintactico.y"
 
     /**
      * @archivo: analizador_sintactico.y
@@ -87,6 +87,7 @@
     #include "ast.h"
     #include "analizador_semantico.h"
     #include "intermediate_code.h" 
+    #include "servidor.h"
 
     /**
      * @declaraciones_externas: Elementos definidos en otros archivos del compilador
@@ -95,6 +96,15 @@
     extern int yylex();
     extern FILE* yyin;
     extern int yylineno;
+    extern void reset_symbol_table(void);
+
+    /**
+     * @declaraciones_externas: Manejo de buffers del analizador léxico
+     * @descripción: Permiten analizar un programa en memoria (modo servidor)
+     */
+    typedef struct yy_buffer_state *YY_BUFFER_STATE;
+    extern YY_BUFFER_STATE yy_scan_bytes(const char *bytes, int len);
+    extern void yy_delete_buffer(YY_BUFFER_STATE buffer);
     
     /**
      * @función: yyerror
@@ -110,7 +120,7 @@
      */
     Node* ast_root = NULL;
 
-#line 114 "analizador_sintactico.tab.c"
+#line 124 "analizador_sintactico.tab.c"
 
 # ifndef YY_CAST
 #  ifdef __cplusplus
@@ -581,12 +591,12 @@ static const yytype_int8 yytranslate[] =
 /* YYRLINE[YYN] -- Source line where rule number YYN was defined.  */
 static const yytype_int16 yyrline[] =
 {
-       0,   101,   101,   114,   115,   131,   146,   147,   148,   163,
-     176,   177,   178,   188,   199,   200,   219,   220,   221,   222,
-     223,   224,   234,   250,   255,   267,   278,   288,   298,   310,
-     311,   312,   313,   314,   315,   331,   335,   339,   342,   345,
-     350,   354,   358,   362,   366,   378,   379,   380,   395,   406,
-     427,   430,   441,   444,   458
+       0,   111,   111,   124,   125,   141,   156,   157,   158,   173,
+     186,   187,   188,   198,   209,   210,   229,   230,   231,   232,
+     233,   234,   244,   260,   265,   277,   288,   298,   308,   320,
+     321,   322,   323,   324,   325,   341,   345,   349,   352,   355,
+     360,   364,   368,   372,   376,   388,   389,   390,   405,   416,
+     437,   440,   451,   454,   468
 };
 #endif
 
@@ -1491,22 +1501,22 @@ yyreduce:
   switch (yyn)
     {
   case 2: /* program: function_list  */
-#line 101 ".\\analizador_sintactico.y"
+#line 111 "analizador_sintactico.y"
                        { 
         (yyval.node) = create_node(NODE_PROGRAM, (yyvsp[0].node), NULL);
         ast_root = (yyval.node);  // Asigna la raíz del AST para su posterior procesamiento.
     }
-#line 1500 "analizador_sintactico.tab.c"
+#line 1510 "analizador_sintactico.tab.c"
     break;
 
   case 3: /* function_list: function  */
-#line 114 ".\\analizador_sintactico.y"
+#line 124 "analizador_sintactico.y"
                                       { (yyval.node) = (yyvsp[0].node); }
-#line 1506 "analizador_sintactico.tab.c"
+#line 1516 "analizador_sintactico.tab.c"
     break;
 
   case 4: /* function_list: function_list function  */
-#line 115 ".\\analizador_sintactico.y"
+#line 125 "analizador_sintactico.y"
                                       { 
                                         (yyval.node) = (yyvsp[-1].node);
                                         // Se recorre la lista hasta el último nodo y se enlaza la nueva función.
@@ -1514,33 +1524,33 @@ yyreduce:
                                         while(last->next) last = last->next;
                                         last->next = (yyvsp[0].node);
                                      }
-#line 1518 "analizador_sintactico.tab.c"
+#line 1528 "analizador_sintactico.tab.c"
     break;
 
   case 5: /* function: TOKEN_FUN TOKEN_ID TOKEN_LPAREN param_list TOKEN_RPAREN block  */
-#line 132 ".\\analizador_sintactico.y"
+#line 142 "analizador_sintactico.y"
                                      { 
                                         Node *func = create_node(NODE_FUNCTION, (yyvsp[-2].node), (yyvsp[0].node));
                                         func->symbol_index = (yyvsp[-4].symbol_index);  // Asigna el índice del identificador de la función.
                                         (yyval.node) = func;
                                      }
-#line 1528 "analizador_sintactico.tab.c"
+#line 1538 "analizador_sintactico.tab.c"
     break;
 
   case 6: /* param_list: %empty  */
-#line 146 ".\\analizador_sintactico.y"
+#line 156 "analizador_sintactico.y"
                                       { (yyval.node) = NULL; }
-#line 1534 "analizador_sintactico.tab.c"
+#line 1544 "analizador_sintactico.tab.c"
     break;
 
   case 7: /* param_list: param  */
-#line 147 ".\\analizador_sintactico.y"
+#line 157 "analizador_sintactico.y"
                                       { (yyval.node) = (yyvsp[0].node); }
-#line 1540 "analizador_sintactico.tab.c"
+#line 1550 "analizador_sintactico.tab.c"
     break;
 
   case 8: /* param_list: param_list TOKEN_COMMA param  */
-#line 148 ".\\analizador_sintactico.y"
+#line 158 "analizador_sintactico.y"
                                       {
                                         (yyval.node) = (yyvsp[-2].node);
                                         // Se recorre la lista de parámetros y se enlaza el nuevo parámetro.
@@ -1548,51 +1558,51 @@ yyreduce:
                                         while(last->next) last = last->next;
                                         last->next = (yyvsp[0].node);
                                      }
-#line 1552 "analizador_sintactico.tab.c"
+#line 1562 "analizador_sintactico.tab.c"
     break;
 
   case 9: /* param: type TOKEN_ID  */
-#line 163 ".\\analizador_sintactico.y"
+#line 173 "analizador_sintactico.y"
                                       {
                                         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
                                         id->symbol_index = (yyvsp[0].symbol_index);  // Asigna el índice del identificador del parámetro.
                                         (yyval.node) = id;
                                      }
-#line 1562 "analizador_sintactico.tab.c"
+#line 1572 "analizador_sintactico.tab.c"
     break;
 
   case 10: /* type: TOKEN_ENT  */
-#line 176 ".\\analizador_sintactico.y"
+#line 186 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_ENT; }
-#line 1568 "analizador_sintactico.tab.c"
+#line 1578 "analizador_sintactico.tab.c"
     break;
 
   case 11: /* type: TOKEN_FLO  */
-#line 177 ".\\analizador_sintactico.y"
+#line 187 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_FLO; }
-#line 1574 "analizador_sintactico.tab.c"
+#line 1584 "analizador_sintactico.tab.c"
     break;
 
   case 12: /* type: TOKEN_NAT  */
-#line 178 ".\\analizador_sintactico.y"
+#line 188 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_NAT; }
-#line 1580 "analizador_sintactico.tab.c"
+#line 1590 "analizador_sintactico.tab.c"
     break;
 
   case 13: /* block: TOKEN_LBRACE statement_list TOKEN_RBRACE  */
-#line 189 ".\\analizador_sintactico.y"
+#line 199 "analizador_sintactico.y"
                                      { (yyval.node) = create_node(NODE_BLOCK, (yyvsp[-1].node), NULL); }
-#line 1586 "analizador_sintactico.tab.c"
+#line 1596 "analizador_sintactico.tab.c"
     break;
 
   case 14: /* statement_list: %empty  */
-#line 199 ".\\analizador_sintactico.y"
+#line 209 "analizador_sintactico.y"
                                       { (yyval.node) = NULL; }
-#line 1592 "analizador_sintactico.tab.c"
+#line 1602 "analizador_sintactico.tab.c"
     break;
 
   case 15: /* statement_list: statement_list statement  */
-#line 200 ".\\analizador_sintactico.y"
+#line 210 "analizador_sintactico.y"
                                       {
                                         if ((yyvsp[-1].node) == NULL) {
                                             (yyval.node) = (yyvsp[0].node);
@@ -1604,203 +1614,203 @@ yyreduce:
                                             last->next = (yyvsp[0].node);
                                         }
                                      }
-#line 1608 "analizador_sintactico.tab.c"
+#line 1618 "analizador_sintactico.tab.c"
     break;
 
   case 22: /* declaration_stmt: type TOKEN_ID TOKEN_ASSIGN expr TOKEN_SEMICOLON  */
-#line 235 ".\\analizador_sintactico.y"
+#line 245 "analizador_sintactico.y"
                                      {
                                         // Se crea un nodo identificador y se asocia a la declaración.
                                         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
                                         id->symbol_index = (yyvsp[-3].symbol_index);
                                         (yyval.node) = create_node(NODE_DECLARATION, id, (yyvsp[-1].node));
                                      }
-#line 1619 "analizador_sintactico.tab.c"
+#line 1629 "analizador_sintactico.tab.c"
     break;
 
   case 23: /* assignment_stmt: TOKEN_ID TOKEN_ASSIGN expr TOKEN_SEMICOLON  */
-#line 250 ".\\analizador_sintactico.y"
+#line 260 "analizador_sintactico.y"
                                                  {
         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
         id->symbol_index = (yyvsp[-3].symbol_index);
         (yyval.node) = create_node(NODE_ASSIGNMENT, id, (yyvsp[-1].node));
     }
-#line 1629 "analizador_sintactico.tab.c"
+#line 1639 "analizador_sintactico.tab.c"
     break;
 
   case 24: /* assignment_stmt: array_access TOKEN_ASSIGN expr TOKEN_SEMICOLON  */
-#line 255 ".\\analizador_sintactico.y"
+#line 265 "analizador_sintactico.y"
                                                      {
         (yyval.node) = create_node(NODE_ARRAY_ASSIGNMENT, (yyvsp[-3].node), (yyvsp[-1].node));
     }
-#line 1637 "analizador_sintactico.tab.c"
+#line 1647 "analizador_sintactico.tab.c"
     break;
 
   case 25: /* if_stmt: TOKEN_IF TOKEN_LPAREN condition TOKEN_RPAREN block  */
-#line 268 ".\\analizador_sintactico.y"
+#line 278 "analizador_sintactico.y"
                                      { (yyval.node) = create_node(NODE_IF, (yyvsp[-2].node), (yyvsp[0].node)); }
-#line 1643 "analizador_sintactico.tab.c"
+#line 1653 "analizador_sintactico.tab.c"
     break;
 
   case 26: /* while_stmt: TOKEN_WHILE TOKEN_LPAREN condition TOKEN_RPAREN block  */
-#line 279 ".\\analizador_sintactico.y"
+#line 289 "analizador_sintactico.y"
                                      { (yyval.node) = create_node(NODE_WHILE, (yyvsp[-2].node), (yyvsp[0].node)); }
-#line 1649 "analizador_sintactico.tab.c"
+#line 1659 "analizador_sintactico.tab.c"
     break;
 
   case 27: /* return_stmt: TOKEN_RET expr TOKEN_SEMICOLON  */
-#line 288 ".\\analizador_sintactico.y"
+#line 298 "analizador_sintactico.y"
                                       { (yyval.node) = create_node(NODE_RETURN, (yyvsp[-1].node), NULL); }
-#line 1655 "analizador_sintactico.tab.c"
+#line 1665 "analizador_sintactico.tab.c"
     break;
 
   case 28: /* condition: expr relop expr  */
-#line 298 ".\\analizador_sintactico.y"
+#line 308 "analizador_sintactico.y"
                                      { 
                                         (yyval.node) = create_node(NODE_BINARY_OP, (yyvsp[-2].node), (yyvsp[0].node));
                                         (yyval.node)->symbol_index = (yyvsp[-1].symbol_index);  // El índice del operador relacional.
                                      }
-#line 1664 "analizador_sintactico.tab.c"
+#line 1674 "analizador_sintactico.tab.c"
     break;
 
   case 29: /* relop: TOKEN_RELOP_LT  */
-#line 310 ".\\analizador_sintactico.y"
+#line 320 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_RELOP_LT; }
-#line 1670 "analizador_sintactico.tab.c"
+#line 1680 "analizador_sintactico.tab.c"
     break;
 
   case 30: /* relop: TOKEN_RELOP_LE  */
-#line 311 ".\\analizador_sintactico.y"
+#line 321 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_RELOP_LE; }
-#line 1676 "analizador_sintactico.tab.c"
+#line 1686 "analizador_sintactico.tab.c"
     break;
 
   case 31: /* relop: TOKEN_RELOP_EQ  */
-#line 312 ".\\analizador_sintactico.y"
+#line 322 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_RELOP_EQ; }
-#line 1682 "analizador_sintactico.tab.c"
+#line 1692 "analizador_sintactico.tab.c"
     break;
 
   case 32: /* relop: TOKEN_RELOP_NE  */
-#line 313 ".\\analizador_sintactico.y"
+#line 323 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_RELOP_NE; }
-#line 1688 "analizador_sintactico.tab.c"
+#line 1698 "analizador_sintactico.tab.c"
     break;
 
   case 33: /* relop: TOKEN_RELOP_GT  */
-#line 314 ".\\analizador_sintactico.y"
+#line 324 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_RELOP_GT; }
-#line 1694 "analizador_sintactico.tab.c"
+#line 1704 "analizador_sintactico.tab.c"
     break;
 
   case 34: /* relop: TOKEN_RELOP_GE  */
-#line 315 ".\\analizador_sintactico.y"
+#line 325 "analizador_sintactico.y"
                                      { (yyval.symbol_index) = TOKEN_RELOP_GE; }
-#line 1700 "analizador_sintactico.tab.c"
+#line 1710 "analizador_sintactico.tab.c"
     break;
 
   case 35: /* expr: TOKEN_ID  */
-#line 331 ".\\analizador_sintactico.y"
+#line 341 "analizador_sintactico.y"
                {
         (yyval.node) = create_node(NODE_IDENTIFIER, NULL, NULL);
         (yyval.node)->symbol_index = (yyvsp[0].symbol_index);
     }
-#line 1709 "analizador_sintactico.tab.c"
+#line 1719 "analizador_sintactico.tab.c"
     break;
 
   case 36: /* expr: TOKEN_NUMBER  */
-#line 335 ".\\analizador_sintactico.y"
+#line 345 "analizador_sintactico.y"
                    {
         (yyval.node) = create_node(NODE_NUMBER, NULL, NULL);
         (yyval.node)->symbol_index = (yyvsp[0].symbol_index);
     }
-#line 1718 "analizador_sintactico.tab.c"
+#line 1728 "analizador_sintactico.tab.c"
     break;
 
   case 37: /* expr: array_access  */
-#line 339 ".\\analizador_sintactico.y"
+#line 349 "analizador_sintactico.y"
                    {
         (yyval.node) = (yyvsp[0].node);
     }
-#line 1726 "analizador_sintactico.tab.c"
+#line 1736 "analizador_sintactico.tab.c"
     break;
 
   case 38: /* expr: array_literal  */
-#line 342 ".\\analizador_sintactico.y"
+#line 352 "analizador_sintactico.y"
                     {
         (yyval.node) = (yyvsp[0].node);
     }
-#line 1734 "analizador_sintactico.tab.c"
+#line 1744 "analizador_sintactico.tab.c"
     break;
 
   case 39: /* expr: TOKEN_ID TOKEN_LPAREN arg_list TOKEN_RPAREN  */
-#line 345 ".\\analizador_sintactico.y"
+#line 355 "analizador_sintactico.y"
                                                   {
         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
         id->symbol_index = (yyvsp[-3].symbol_index);
         (yyval.node) = create_node(NODE_FUNCTION_CALL, id, (yyvsp[-1].node));
     }
-#line 1744 "analizador_sintactico.tab.c"
+#line 1754 "analizador_sintactico.tab.c"
     break;
 
   case 40: /* expr: expr TOKEN_PLUS expr  */
-#line 350 ".\\analizador_sintactico.y"
+#line 360 "analizador_sintactico.y"
                            {
         (yyval.node) = create_node(NODE_BINARY_OP, (yyvsp[-2].node), (yyvsp[0].node));
         (yyval.node)->symbol_index = TOKEN_PLUS;
     }
-#line 1753 "analizador_sintactico.tab.c"
+#line 1763 "analizador_sintactico.tab.c"
     break;
 
   case 41: /* expr: expr TOKEN_MINUS expr  */
-#line 354 ".\\analizador_sintactico.y"
+#line 364 "analizador_sintactico.y"
                             {
         (yyval.node) = create_node(NODE_BINARY_OP, (yyvsp[-2].node), (yyvsp[0].node));
         (yyval.node)->symbol_index = TOKEN_MINUS;
     }
-#line 1762 "analizador_sintactico.tab.c"
+#line 1772 "analizador_sintactico.tab.c"
     break;
 
   case 42: /* expr: expr TOKEN_MULT expr  */
-#line 358 ".\\analizador_sintactico.y"
+#line 368 "analizador_sintactico.y"
                            {
         (yyval.node) = create_node(NODE_BINARY_OP, (yyvsp[-2].node), (yyvsp[0].node));
         (yyval.node)->symbol_index = TOKEN_MULT;
     }
-#line 1771 "analizador_sintactico.tab.c"
+#line 1781 "analizador_sintactico.tab.c"
     break;
 
   case 43: /* expr: expr TOKEN_DIV expr  */
-#line 362 ".\\analizador_sintactico.y"
+#line 372 "analizador_sintactico.y"
                           {
         (yyval.node) = create_node(NODE_BINARY_OP, (yyvsp[-2].node), (yyvsp[0].node));
         (yyval.node)->symbol_index = TOKEN_DIV;
     }
-#line 1780 "analizador_sintactico.tab.c"
+#line 1790 "analizador_sintactico.tab.c"
     break;
 
   case 44: /* expr: TOKEN_LPAREN expr TOKEN_RPAREN  */
-#line 366 ".\\analizador_sintactico.y"
+#line 376 "analizador_sintactico.y"
                                      {
         (yyval.node) = (yyvsp[-1].node);
     }
-#line 1788 "analizador_sintactico.tab.c"
+#line 1798 "analizador_sintactico.tab.c"
     break;
 
   case 45: /* arg_list: %empty  */
-#line 378 ".\\analizador_sintactico.y"
+#line 388 "analizador_sintactico.y"
                                       { (yyval.node) = NULL; }
-#line 1794 "analizador_sintactico.tab.c"
+#line 1804 "analizador_sintactico.tab.c"
     break;
 
   case 46: /* arg_list: expr  */
-#line 379 ".\\analizador_sintactico.y"
+#line 389 "analizador_sintactico.y"
                                       { (yyval.node) = (yyvsp[0].node); }
-#line 1800 "analizador_sintactico.tab.c"
+#line 1810 "analizador_sintactico.tab.c"
     break;
 
   case 47: /* arg_list: arg_list TOKEN_COMMA expr  */
-#line 380 ".\\analizador_sintactico.y"
+#line 390 "analizador_sintactico.y"
                                       {
                                         (yyval.node) = (yyvsp[-2].node);
                                         // Se enlaza el nuevo argumento al final de la lista.
@@ -1808,11 +1818,11 @@ yyreduce:
                                         while(last->next) last = last->next;
                                         last->next = (yyvsp[0].node);
                                      }
-#line 1812 "analizador_sintactico.tab.c"
+#line 1822 "analizador_sintactico.tab.c"
     break;
 
   case 48: /* array_decl: TOKEN_ARREGLO type TOKEN_ID TOKEN_LBRACK expr TOKEN_RBRACK TOKEN_SEMICOLON  */
-#line 395 ".\\analizador_sintactico.y"
+#line 405 "analizador_sintactico.y"
                                                                                  {
         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
         id->symbol_index = (yyvsp[-4].symbol_index);
@@ -1824,11 +1834,11 @@ yyreduce:
         // Create array declaration node
         (yyval.node) = create_node(NODE_ARRAY_DECL, id, (yyvsp[-2].node));  // Left: ID, Right: Size expression
     }
-#line 1828 "analizador_sintactico.tab.c"
+#line 1838 "analizador_sintactico.tab.c"
     break;
 
   case 49: /* array_decl: TOKEN_ARREGLO type TOKEN_ID TOKEN_LBRACK expr TOKEN_RBRACK TOKEN_ASSIGN array_literal TOKEN_SEMICOLON  */
-#line 406 ".\\analizador_sintactico.y"
+#line 416 "analizador_sintactico.y"
                                                                                                             {
         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
         id->symbol_index = (yyvsp[-6].symbol_index);
@@ -1841,56 +1851,56 @@ yyreduce:
         Node *size_and_type = create_node(NODE_ARRAY_SIZE, (yyvsp[-4].node), array_type);
         (yyval.node) = create_node(NODE_ARRAY_DECL, id, create_node(NODE_ARRAY_INIT, size_and_type, (yyvsp[-1].node)));
     }
-#line 1845 "analizador_sintactico.tab.c"
+#line 1855 "analizador_sintactico.tab.c"
     break;
 
   case 50: /* array_literal: TOKEN_LBRACK array_elements TOKEN_RBRACK  */
-#line 427 ".\\analizador_sintactico.y"
+#line 437 "analizador_sintactico.y"
                                                {
         (yyval.node) = create_node(NODE_ARRAY_LITERAL, (yyvsp[-1].node), NULL);
     }
-#line 1853 "analizador_sintactico.tab.c"
+#line 1863 "analizador_sintactico.tab.c"
     break;
 
   case 51: /* array_literal: TOKEN_LBRACK TOKEN_RBRACK  */
-#line 430 ".\\analizador_sintactico.y"
+#line 440 "analizador_sintactico.y"
                                 {
         (yyval.node) = create_node(NODE_ARRAY_LITERAL, NULL, NULL);  // Empty array
     }
-#line 1861 "analizador_sintactico.tab.c"
+#line 1871 "analizador_sintactico.tab.c"
     break;
 
   case 52: /* array_elements: expr  */
-#line 441 ".\\analizador_sintactico.y"
+#line 451 "analizador_sintactico.y"
            {
         (yyval.node) = (yyvsp[0].node);
     }
-#line 1869 "analizador_sintactico.tab.c"
+#line 1879 "analizador_sintactico.tab.c"
     break;
 
   case 53: /* array_elements: array_elements TOKEN_COMMA expr  */
-#line 444 ".\\analizador_sintactico.y"
+#line 454 "analizador_sintactico.y"
                                       {
         (yyval.node) = (yyvsp[-2].node);
         Node *last = (yyvsp[-2].node);
         while (last->next) last = last->next;
         last->next = (yyvsp[0].node);
     }
-#line 1880 "analizador_sintactico.tab.c"
+#line 1890 "analizador_sintactico.tab.c"
     break;
 
   case 54: /* array_access: TOKEN_ID TOKEN_LBRACK expr TOKEN_RBRACK  */
-#line 458 ".\\analizador_sintactico.y"
+#line 468 "analizador_sintactico.y"
                                               {
         Node *id = create_node(NODE_IDENTIFIER, NULL, NULL);
         id->symbol_index = (yyvsp[-3].symbol_index);
         (yyval.node) = create_node(NODE_ARRAY_ACCESS, id, (yyvsp[-1].node));
     }
-#line 1890 "analizador_sintactico.tab.c"
+#line 1900 "analizador_sintactico.tab.c"
     break;
 
 
-#line 1894 "analizador_sintactico.tab.c"
+#line 1904 "analizador_sintactico.tab.c"
 
       default: break;
     }
@@ -2114,7 +2124,7 @@ yyreturnlab:
   return yyresult;
 }
 
-#line 465 ".\\analizador_sintactico.y"
+#line 475 "analizador_sintactico.y"
 
 
 /**
@@ -2133,6 +2143,53 @@ void yyerror(const char *s) {
     fprintf(stderr, "Error: %s at line %d\n", s, yylineno);
 }
 
+/**
+ * @función: servir
+ * @descripción: Atiende solicitudes de compilación por la entrada estándar (modo servidor).
+ *              Los datos de cada solicitud son el código preprocesado y la respuesta
+ *              es el código de tres direcciones (TAC). Ver servidor.h para el protocolo.
+ * 
+ * @reinicio_de_estado:
+ *   Antes de cada solicitud se vacía la tabla de símbolos del analizador léxico,
+ *   se reinicia yylineno y se descarta la raíz del AST anterior. El administrador
+ *   de temporales y etiquetas se crea de nuevo en cada generación.
+ * 
+ * @retorno:
+ *   - 0: Fin normal (EOF en la entrada)
+ *   - 1: No se pudo iniciar el modo servidor
+ */
+int servir(void) {
+    if (servidor_iniciar() != 0) {
+        fprintf(stderr, "Debug: No se pudo iniciar el modo servidor\n");
+        return 1;
+    }
+
+    size_t longitud;
+    char argumentos[SERVIDOR_MAX_ARGUMENTOS];
+    char *datos;
+    while ((datos = servidor_leer_solicitud(&longitud, argumentos)) != NULL) {
+        reset_symbol_table();
+        ast_root = NULL;
+
+        YY_BUFFER_STATE entrada = yy_scan_bytes(datos, (int) longitud);
+        int parse_result = yyparse();
+        yy_delete_buffer(entrada);
+
+        if (parse_result != 0) {
+            servidor_responder_texto(1, "Analisis sintactico fallido");
+        } else if (!ast_root) {
+            servidor_responder_texto(1, "La raiz del AST es NULL a pesar de un analisis exitoso");
+        } else {
+            init_semantic_analysis(ast_root);
+            FILE *salida = servidor_abrir_salida();
+            generate_intermediate_code_stream(ast_root, salida);
+            servidor_responder(0, salida);
+        }
+        free(datos);
+    }
+    return 0;
+}
+
 /**
  * @función: main
  * @descripción: Punto de entrada principal del compilador que coordina
@@ -2156,6 +2213,10 @@ void yyerror(const char *s) {
  *   5. Muestra mensajes de progreso y estado
  */
 int main(int argc, char **argv) {
+    if (argc == 2 && strcmp(argv[1], SERVIDOR_OPCION) == 0) {
+        return servir();
+    }
+
     // Mensaje de inicio del compilador.
     printf("Debug: Iniciando compilador\n");
     
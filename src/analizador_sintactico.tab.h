@@ -91,7 +91,7 @@ extern int yydebug;
 #if ! defined YYSTYPE && ! defined YYSTYPE_IS_DECLARED
 union YYSTYPE
 {
-#line 56 ".\\analizador_sintactico.y"
+#line 66 "analizador_sintactico.y"
 
     int symbol_index;         // Índice en la tabla de símbolos para identificadores y valores
     struct Node *node;        // Puntero a nodo del AST para construcciones sintácticas
@@ -17,6 +17,7 @@
     #include "ast.h"
     #include "analizador_semantico.h"
     #include "intermediate_code.h" 
+    #include "servidor.h"
 
     /**
      * @declaraciones_externas: Elementos definidos en otros archivos del compilador
@@ -25,6 +26,15 @@
     extern int yylex();
     extern FILE* yyin;
     extern int yylineno;
+    extern void reset_symbol_table(void);
+
+    /**
+     * @declaraciones_externas: Manejo de buffers del analizador léxico
+     * @descripción: Permiten analizar un programa en memoria (modo servidor)
+     */
+    typedef struct yy_buffer_state *YY_BUFFER_STATE;
+    extern YY_BUFFER_STATE yy_scan_bytes(const char *bytes, int len);
+    extern void yy_delete_buffer(YY_BUFFER_STATE buffer);
     
     /**
      * @función: yyerror
@@ -480,6 +490,53 @@ void yyerror(const char *s) {
     fprintf(stderr, "Error: %s at line %d\n", s, yylineno);
 }
 
+/**
+ * @función: servir
+ * @descripción: Atiende solicitudes de compilación por la entrada estándar (modo servidor).
+ *              Los datos de cada solicitud son el código preprocesado y la respuesta
+ *              es el código de tres direcciones (TAC). Ver servidor.h para el protocolo.
+ * 
+ * @reinicio_de_estado:
+ *   Antes de cada solicitud se vacía la tabla de símbolos del analizador léxico,
+ *   se reinicia yylineno y se descarta la raíz del AST anterior. El administrador
+ *   de temporales y etiquetas se crea de nuevo en cada generación.
+ * 
+ * @retorno:
+ *   - 0: Fin normal (EOF en la entrada)
+ *   - 1: No se pudo iniciar el modo servidor
+ */
+int servir(void) {
+    if (servidor_iniciar() != 0) {
+        fprintf(stderr, "Debug: No se pudo iniciar el modo servidor\n");
+        return 1;
+    }
+
+    size_t longitud;
+    char argumentos[SERVIDOR_MAX_ARGUMENTOS];
+    char *datos;
+    while ((datos = servidor_leer_solicitud(&longitud, argumentos)) != NULL) {
+        reset_symbol_table();
+        ast_root = NULL;
+
+        YY_BUFFER_STATE entrada = yy_scan_bytes(datos, (int) longitud);
+        int parse_result = yyparse();
+        yy_delete_buffer(entrada);
+
+        if (parse_result != 0) {
+            servidor_responder_texto(1, "Analisis sintactico fallido");
+        } else if (!ast_root) {
+            servidor_responder_texto(1, "La raiz del AST es NULL a pesar de un analisis exitoso");
+        } else {
+            init_semantic_analysis(ast_root);
+            FILE *salida = servidor_abrir_salida();
+            generate_intermediate_code_stream(ast_root, salida);
+            servidor_responder(0, salida);
+        }
+        free(datos);
+    }
+    return 0;
+}
+
 /**
  * @función: main
  * @descripción: Punto de entrada principal del compilador que coordina
@@ -503,6 +560,10 @@ void yyerror(const char *s) {
  *   5. Muestra mensajes de progreso y estado
  */
 int main(int argc, char **argv) {
+    if (argc == 2 && strcmp(argv[1], SERVIDOR_OPCION) == 0) {
+        return servir();
+    }
+
     // Mensaje de inicio del compilador.
     printf("Debug: Iniciando compilador\n");
     
@@ -0,0 +1,174 @@
+"""
+Objetos precompilados de las bibliotecas de `librerias/`.
+
+`#import <nombre>` ya no copia el código de la biblioteca en el programa: el
+preprocesador deja la directiva como referencia y, al traducir, se enlaza el
+objeto de la biblioteca. El objeto es el TAC de la biblioteca compilado una sola
+vez, con sus nombres privados (variables, temporales y etiquetas) renombrados para
+que no choquen con los del programa; solo sus funciones quedan visibles.
+
+Los objetos se guardan en la caché de compilación con la fuente de la biblioteca
+como entrada, de modo que solo se recompilan cuando la biblioteca cambia.
+"""
+import hashlib
+import json
+import os
+import re
+
+from src.cache import PATRON_IMPORT, version_archivo
+
+DIRECTORIO_BIBLIOTECAS = "librerias"
+EXTENSION = ".lib"
+
+# Palabras del TAC que no son nombres del programa
+_PALABRAS_TAC = {"begin_func", "end_func", "param", "call", "ifz", "goto", "return"}
+_IDENTIFICADOR = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
+
+
+class ErrorBiblioteca(Exception):
+    """Biblioteca importada que no existe o no se pudo compilar."""
+
+
+def importaciones(texto):
+    """
+    Bibliotecas que importa un código (`#import <nombre>`), sin repetir y en orden.
+
+    @param texto: Código fuente o preprocesado
+    @return: Lista de nombres
+    """
+    return list(dict.fromkeys(PATRON_IMPORT.findall(texto)))
+
+
+def privatizar(tac_lines, nombre, importadas=()):
+    """
+    Renombra los nombres privados de una biblioteca agregando el sufijo `__<nombre>`.
+    Las funciones definidas en la biblioteca conservan su nombre (se exportan), igual
+    que las que exportan las bibliotecas que importa.
+
+    @param tac_lines: Líneas TAC de la biblioteca
+    @param nombre: Nombre de la biblioteca
+    @param importadas: Funciones exportadas por las bibliotecas que importa
+    @return: Tupla (líneas renombradas, funciones exportadas)
+    """
+    exporta = [line.split()[1] for line in tac_lines if line.startswith("begin_func")]
+    publicos = _PALABRAS_TAC | set(exporta) | set(importadas)
+    sufijo = "__" + re.sub(r"\W", "_", nombre)
+
+    def renombrar(coincidencia):
+        identificador = coincidencia.group()
+        return identificador if identificador in publicos else identificador + sufijo
+
+    return [_IDENTIFICADOR.sub(renombrar, line) for line in tac_lines], exporta
+
+
+class ObjetoBiblioteca:
+    """
+    Biblioteca compilada lista para enlazar.
+
+    - nombre: nombre de la biblioteca
+    - exporta: funciones que define
+    - importa: bibliotecas que importa a su vez
+    - tac: líneas TAC con los nombres privados renombrados
+    - clave: resumen del objeto (cambia solo si cambia el TAC)
+    """
+    def __init__(self, nombre, exporta, importa, tac):
+        self.nombre = nombre
+        self.exporta = tuple(exporta)
+        self.importa = tuple(importa)
+        self.tac = tuple(tac)
+        self.clave = hashlib.sha256("\n".join(self.tac).encode("utf-8")).hexdigest()
+
+    def serializar(self):
+        return json.dumps({"nombre": self.nombre, "exporta": self.exporta,
+                           "importa": self.importa, "tac": self.tac})
+
+    @classmethod
+    def deserializar(cls, texto):
+        datos = json.loads(texto)
+        return cls(datos["nombre"], datos["exporta"], datos["importa"], datos["tac"])
+
+
+class Bibliotecas:
+    """
+    Compila las bibliotecas bajo demanda y conserva sus objetos en memoria y en la caché.
+    """
+    def __init__(self, herramientas, directorio=DIRECTORIO_BIBLIOTECAS, cache=None):
+        self.herramientas = herramientas
+        self.directorio = directorio
+        self.cache = cache
+        self.objetos = {}  # nombre -> ((versión del archivo fuente, importadas), ObjetoBiblioteca)
+        self._en_curso = set()  # Bibliotecas que se están resolviendo (importaciones circulares)
+
+    def ruta(self, nombre):
+        return os.path.join(self.directorio, nombre + EXTENSION)
+
+    def _compilar(self, nombre, fuente, importadas):
+        tac = self.herramientas.solicitar("compilador", fuente)
+        tac_lines = [line.strip() for line in tac.splitlines() if line.strip()]
+        lineas, exporta = privatizar(tac_lines, nombre, importadas)
+        return ObjetoBiblioteca(nombre, exporta, importaciones(fuente), lineas).serializar()
+
+    def objeto(self, nombre):
+        """
+        Objeto de una biblioteca; solo se compila si su fuente cambió.
+
+        @param nombre: Nombre de la biblioteca (sin extensión)
+        @return: ObjetoBiblioteca
+        @raises ErrorBiblioteca: Si la biblioteca no existe
+        """
+        ruta = self.ruta(nombre)
+        try:
+            with open(ruta, "r", encoding="utf-8") as archivo:
+                fuente = archivo.read()
+        except OSError as e:
+            raise ErrorBiblioteca(f"No se puede abrir la biblioteca {ruta}") from e
+
+        # Las funciones de las bibliotecas importadas no se renombran: se resuelven
+        # primero (en una importación circular, la que se está resolviendo no cuenta)
+        self._en_curso.add(nombre)
+        try:
+            importadas = tuple(funcion for objeto in self.resolver(importaciones(fuente))
+                               for funcion in objeto.exporta)
+        finally:
+            self._en_curso.discard(nombre)
+
+        version = (version_archivo(ruta), importadas)
+        guardado = self.objetos.get(nombre)
+        if guardado is not None and guardado[0] == version:
+            return guardado[1]
+        if self.cache is None:
+            texto = self._compilar(nombre, fuente, importadas)
+        else:
+            # La versión del compilador y de este módulo forman parte de la clave
+            version_objeto = f"{self.herramientas.version('compilador')}/{version_archivo(__file__)}"
+            texto, _ = self.cache.obtener_o_calcular(
+                "biblioteca", version_objeto, fuente,
+                lambda: self._compilar(nombre, fuente, importadas), opciones=(nombre, *importadas))
+        objeto = ObjetoBiblioteca.deserializar(texto)
+        self.objetos[nombre] = (version, objeto)
+        return objeto
+
+    def resolver(self, nombres):
+        """
+        Objetos a enlazar para una lista de importaciones, incluidas las bibliotecas
+        que importan otras bibliotecas (cada una una sola vez, en orden de importación).
+
+        @param nombres: Bibliotecas importadas por el programa
+        @return: Lista de ObjetoBiblioteca
+        """
+        objetos = []
+        vistos = set()
+
+        def visitar(nombre):
+            # Las bibliotecas en curso las agrega la resolución que las está compilando
+            if nombre in vistos or nombre in self._en_curso:
+                return
+            vistos.add(nombre)
+            objeto = self.objeto(nombre)
+            objetos.append(objeto)
+            for importada in objeto.importa:
+                visitar(importada)
+
+        for nombre in nombres:
+            visitar(nombre)
+        return objetos
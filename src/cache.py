@@ -0,0 +1,189 @@
+"""
+Caché de compilación direccionada por contenido.
+
+Cada resultado de etapa (código preprocesado, TAC, ensamblador, binario
+reubicable, imagen enlazada) se guarda en disco bajo la clave
+sha256(etapa, versión de la herramienta, entrada, opciones). Si ninguna de
+esas partes cambió, la etapa no se vuelve a ejecutar.
+
+Las entradas se desalojan por LRU (según la fecha de último uso del archivo)
+cuando el tamaño total supera el límite configurado.
+"""
+import hashlib
+import os
+import re
+
+DIRECTORIO_CACHE = ".cache_compilacion"
+LIMITE_BYTES = 64 * 1024 * 1024  # 64 MiB
+
+PATRON_IMPORT = re.compile(r"^#import *<([^>]*)>", re.MULTILINE)
+
+
+def version_archivo(ruta):
+    """
+    Versión de una herramienta a partir de su ejecutable o módulo fuente.
+    Cambia cada vez que la herramienta se recompila o se edita.
+
+    @param ruta: Ruta del ejecutable o del archivo fuente
+    @return: Cadena "<tamaño>-<mtime en ns>", o "ausente" si no existe
+    """
+    try:
+        estado = os.stat(ruta)
+    except OSError:
+        return "ausente"
+    return f"{estado.st_size}-{estado.st_mtime_ns}"
+
+
+def dependencias_preprocesador(texto, directorio="librerias"):
+    """
+    Bibliotecas que importa un código fuente (`#import <nombre>`) y si existen.
+    Forma parte de la clave del preprocesado: el preprocesador solo deja la referencia
+    de las bibliotecas que encuentra (su contenido se enlaza después, ver src/bibliotecas.py).
+
+    @param texto: Código fuente
+    @param directorio: Directorio de las bibliotecas (.lib)
+    @return: Cadena con el nombre de cada biblioteca importada y si existe
+    """
+    partes = []
+    for nombre in PATRON_IMPORT.findall(texto):
+        existe = os.path.isfile(os.path.join(directorio, nombre + ".lib"))
+        partes.append(f"{nombre}:{'presente' if existe else 'ausente'}")
+    return "\n".join(partes)
+
+
+class CacheCompilacion:
+    """
+    Almacén en disco de resultados de etapas, con desalojo LRU y límite de tamaño.
+    """
+    def __init__(self, directorio=DIRECTORIO_CACHE, limite_bytes=LIMITE_BYTES):
+        self.directorio = directorio
+        self.limite_bytes = limite_bytes
+        self.aciertos = 0
+        self.fallos = 0
+        self.entradas = {}  # clave -> (tamaño, último uso)
+        self.tamano_total = 0
+        self._cargar_indice()
+
+    def _cargar_indice(self):
+        """Reconstruye el índice de tamaños y fechas de uso a partir del directorio."""
+        if not os.path.isdir(self.directorio):
+            return
+        for subdirectorio in os.listdir(self.directorio):
+            ruta_sub = os.path.join(self.directorio, subdirectorio)
+            if not os.path.isdir(ruta_sub):
+                continue
+            for nombre in os.listdir(ruta_sub):
+                if nombre.endswith(".tmp"):
+                    continue
+                try:
+                    estado = os.stat(os.path.join(ruta_sub, nombre))
+                except OSError:
+                    continue
+                self.entradas[nombre] = (estado.st_size, estado.st_mtime_ns)
+                self.tamano_total += estado.st_size
+
+    @staticmethod
+    def clave(etapa, version, entrada, opciones=()):
+        """
+        Calcula la clave de una etapa.
+
+        @param etapa: Nombre de la etapa (p. ej. "compilador")
+        @param version: Versión de la herramienta (ver `version_archivo`)
+        @param entrada: Texto de entrada de la etapa
+        @param opciones: Secuencia de opciones que afectan el resultado
+        @return: Resumen sha256 en hexadecimal
+        """
+        resumen = hashlib.sha256()
+        for parte in (etapa, version, *[str(opcion) for opcion in opciones]):
+            datos = str(parte).encode("utf-8")
+            resumen.update(len(datos).to_bytes(8, "little"))
+            resumen.update(datos)
+        resumen.update(b"\0")
+        resumen.update(entrada.encode("utf-8"))
+        return resumen.hexdigest()
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave[:2], clave)
+
+    def obtener(self, clave):
+        """
+        Busca un resultado y marca la entrada como usada.
+
+        @return: Texto guardado, o None si no está en la caché
+        """
+        if clave not in self.entradas:
+            self.fallos += 1
+            return None
+        ruta = self._ruta(clave)
+        try:
+            with open(ruta, "r", encoding="utf-8", newline="") as archivo:
+                valor = archivo.read()
+            os.utime(ruta)
+        except OSError:
+            # Borrada desde fuera: se olvida la entrada
+            tamano, _ = self.entradas.pop(clave)
+            self.tamano_total -= tamano
+            self.fallos += 1
+            return None
+        tamano, _ = self.entradas[clave]
+        self.entradas[clave] = (tamano, os.stat(ruta).st_mtime_ns)
+        self.aciertos += 1
+        return valor
+
+    def guardar(self, clave, valor):
+        """Guarda un resultado (escritura atómica) y desaloja entradas si hace falta."""
+        ruta = self._ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+        # Temporal por proceso: varios procesos de construcción pueden guardar la misma clave
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8", newline="") as archivo:
+            archivo.write(valor)
+        os.replace(temporal, ruta)
+
+        estado = os.stat(ruta)
+        anterior = self.entradas.get(clave)
+        if anterior is not None:
+            self.tamano_total -= anterior[0]
+        self.entradas[clave] = (estado.st_size, estado.st_mtime_ns)
+        self.tamano_total += estado.st_size
+        self._desalojar()
+
+    def _desalojar(self):
+        """Elimina las entradas usadas hace más tiempo hasta respetar el límite."""
+        if self.tamano_total <= self.limite_bytes:
+            return
+        for clave, (tamano, _) in sorted(self.entradas.items(), key=lambda item: item[1][1]):
+            if self.tamano_total <= self.limite_bytes:
+                break
+            try:
+                os.remove(self._ruta(clave))
+            except OSError:
+                pass
+            del self.entradas[clave]
+            self.tamano_total -= tamano
+
+    def obtener_o_calcular(self, etapa, version, entrada, calcular, opciones=()):
+        """
+        Devuelve el resultado guardado de la etapa o lo calcula y lo guarda.
+        Si `calcular` lanza una excepción no se guarda nada.
+
+        @param calcular: Función sin argumentos que produce el texto de salida
+        @return: Tupla (resultado, acierto) donde acierto indica si vino de la caché
+        """
+        clave = self.clave(etapa, version, entrada, opciones)
+        valor = self.obtener(clave)
+        if valor is not None:
+            return valor, True
+        valor = calcular()
+        self.guardar(clave, valor)
+        return valor, False
+
+    def limpiar(self):
+        """Elimina todas las entradas."""
+        for clave in list(self.entradas):
+            try:
+                os.remove(self._ruta(clave))
+            except OSError:
+                pass
+        self.entradas.clear()
+        self.tamano_total = 0
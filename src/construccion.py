@@ -0,0 +1,263 @@
+"""
+Construcción en paralelo de programas de varios archivos fuente.
+
+Cada archivo pasa por preprocesado → compilación → traducción TAC → ensamblado en
+un proceso de trabajo distinto (ProcessPoolExecutor) y produce un objeto reubicable
+(ver src/objeto.py). Las bibliotecas importadas por cualquiera de los archivos se
+construyen una sola vez en una segunda ronda y al final se enlaza todo en el
+proceso principal:
+
+    python -m src.construccion [-j N] [-O N] [-o salida.txt] [--base N] principal.src otros.src...
+
+El primer archivo es el módulo principal (su primera línea es CALL main); los demás
+aportan sus funciones. Se reporta el tiempo de cada etapa por archivo y el total;
+con `--tiempos tiempos.json` se exporta además cada medición (tiempo real y de CPU,
+tamaños y aciertos de la caché, ver src/tiempos.py).
+"""
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.bibliotecas import DIRECTORIO_BIBLIOTECAS, Bibliotecas, ErrorBiblioteca, importaciones
+from src.cache import CacheCompilacion, dependencias_preprocesador
+from src.objeto import ErrorEnlace, enlazar, objeto_de_tac
+from src.optimizador import NIVEL_POR_DEFECTO, NIVELES
+from src.servidores import ErrorHerramienta, SupervisorHerramientas
+from src.TAC import ErrorEtiqueta, ErrorOperando
+from src.tiempos import RegistroTiempos, tamano
+
+ETAPAS = ("preprocesado", "compilacion", "traduccion", "ensamblado")
+
+# Estado de cada proceso de trabajo: los servidores de las herramientas se inician
+# una vez por proceso y terminan al cerrarse sus tuberías cuando el proceso sale.
+_herramientas = None
+_bibliotecas = None
+_nivel = NIVEL_POR_DEFECTO
+
+
+class ErrorConstruccion(Exception):
+    """Uno o más archivos no se pudieron construir o enlazar."""
+    def __init__(self, errores):
+        super().__init__("\n".join(errores))
+        self.errores = errores
+
+
+class ResultadoArchivo:
+    """
+    Resultado de construir un archivo (o una biblioteca).
+
+    - nombre: ruta del archivo o nombre de la biblioteca
+    - objetos: lista de ObjetoModulo producidos
+    - importa: bibliotecas que importa el archivo
+    - mediciones: RegistroTiempos de sus etapas
+    - error: mensaje si la construcción falló
+    """
+    def __init__(self, nombre, objetos=(), importa=(), mediciones=None, error=None):
+        self.nombre = nombre
+        self.objetos = list(objetos)
+        self.importa = list(importa)
+        self.mediciones = mediciones if mediciones is not None else RegistroTiempos()
+        self.error = error
+
+    @property
+    def tiempos(self):
+        """Etapa -> segundos."""
+        return self.mediciones.por_etapa()
+
+    @property
+    def total(self):
+        return self.mediciones.pared
+
+
+class ResultadoConstruccion:
+    """
+    Programa enlazado y tiempos de la construcción.
+
+    - palabras: imagen de memoria a partir de la dirección base
+    - simbolos: símbolo -> dirección absoluta
+    - archivos: lista de ResultadoArchivo (archivos fuente y luego bibliotecas)
+    - enlace: RegistroTiempos del enlace
+    - tiempo_total: segundos de tiempo real transcurrido
+    """
+    def __init__(self, palabras, simbolos, archivos, enlace, tiempo_total):
+        self.palabras = palabras
+        self.simbolos = simbolos
+        self.archivos = archivos
+        self.enlace = enlace
+        self.tiempo_total = tiempo_total
+
+    @property
+    def tiempo_enlace(self):
+        return self.enlace.pared
+
+    def reporte(self):
+        """Tabla de tiempos por archivo y etapa, en milisegundos."""
+        ancho = max([len("archivo")] + [len(archivo.nombre) for archivo in self.archivos])
+        lineas = [f"{'archivo':<{ancho}} " + " ".join(f"{etapa:>13}" for etapa in ETAPAS)
+                  + f" {'total':>10}"]
+        for archivo in self.archivos:
+            tiempos = archivo.tiempos
+            celdas = [f"{tiempos[etapa] * 1000:13.2f}" if etapa in tiempos
+                      else f"{'-':>13}" for etapa in ETAPAS]
+            lineas.append(f"{archivo.nombre:<{ancho}} " + " ".join(celdas)
+                          + f" {archivo.total * 1000:10.2f}")
+        lineas.append(f"enlace: {self.tiempo_enlace * 1000:.2f} ms")
+        lineas.append(f"total:  {self.tiempo_total * 1000:.2f} ms "
+                      f"(suma por archivo: {sum(a.total for a in self.archivos) * 1000:.2f} ms)")
+        return "\n".join(lineas)
+
+    def a_json(self):
+        """Todas las mediciones de la construcción como JSON (ver src/tiempos.py)."""
+        return json.dumps({
+            "archivos": [{"nombre": archivo.nombre, **archivo.mediciones.como_dict()}
+                         for archivo in self.archivos],
+            "enlace": self.enlace.como_dict(),
+            "total": self.tiempo_total,
+        }, indent=2)
+
+
+def _iniciar_trabajador(directorio_compilados, directorio_bibliotecas, usar_cache, nivel):
+    global _herramientas, _bibliotecas, _nivel
+    _nivel = nivel
+    cache = CacheCompilacion() if usar_cache else None
+    _herramientas = SupervisorHerramientas(directorio_compilados, cache=cache)
+    _bibliotecas = Bibliotecas(_herramientas, directorio_bibliotecas, cache)
+
+
+def construir_archivo(ruta, entrada):
+    """
+    Construye un archivo fuente como objeto (se ejecuta en un proceso de trabajo).
+
+    @param ruta: Archivo fuente
+    @param entrada: Si es el módulo principal
+    @return: ResultadoArchivo
+    """
+    tiempos = RegistroTiempos()
+    cache = _herramientas.cache
+    try:
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            texto = archivo.read()
+        with tiempos.medir("preprocesado", texto, cache) as medicion:
+            preprocesado = _herramientas.solicitar(
+                "preprocesador", texto,
+                dependencias=dependencias_preprocesador(texto, _bibliotecas.directorio))
+            medicion.salida = tamano(preprocesado)
+
+        with tiempos.medir("compilacion", preprocesado, cache) as medicion:
+            tac = _herramientas.solicitar("compilador", preprocesado)
+            medicion.salida = tamano(tac)
+
+        nombre = os.path.splitext(os.path.basename(ruta))[0]
+        objeto = objeto_de_tac(nombre, tac, entrada, _nivel, tiempos)
+    except (OSError, ErrorHerramienta, ErrorEtiqueta, ErrorOperando, KeyError, IndexError,
+            ValueError) as e:
+        return ResultadoArchivo(ruta, mediciones=tiempos, error=f"{ruta}: {e!r}")
+    return ResultadoArchivo(ruta, [objeto], importaciones(preprocesado), tiempos)
+
+
+def construir_biblioteca(nombre):
+    """
+    Construye como objetos una biblioteca y las que importa a su vez
+    (se ejecuta en un proceso de trabajo).
+
+    @param nombre: Nombre de la biblioteca
+    @return: ResultadoArchivo
+    """
+    tiempos = RegistroTiempos()
+    try:
+        with tiempos.medir("compilacion", cache=_herramientas.cache) as medicion:
+            objetos = _bibliotecas.resolver([nombre])
+            medicion.salida = sum(tamano(objeto.tac) for objeto in objetos)
+
+        modulos = [objeto_de_tac(objeto.nombre, objeto.tac, False, _nivel, tiempos)
+                   for objeto in objetos]
+    except (ErrorBiblioteca, ErrorHerramienta, ErrorEtiqueta, ErrorOperando, KeyError,
+            IndexError, ValueError) as e:
+        return ResultadoArchivo(f"<{nombre}>", mediciones=tiempos, error=f"<{nombre}>: {e!r}")
+    return ResultadoArchivo(f"<{nombre}>", modulos, mediciones=tiempos)
+
+
+def construir(rutas, base=0, trabajos=None, directorio_compilados="./compilados",
+              directorio_bibliotecas=DIRECTORIO_BIBLIOTECAS, usar_cache=True,
+              nivel=NIVEL_POR_DEFECTO):
+    """
+    Construye y enlaza un programa de varios archivos fuente.
+
+    @param rutas: Archivos fuente; el primero es el módulo principal
+    @param base: Dirección de carga del programa enlazado
+    @param trabajos: Procesos de trabajo (por defecto, uno por núcleo); con 1 todo se
+                     construye en el proceso actual
+    @param usar_cache: Si las etapas de las herramientas usan la caché de compilación
+    @param nivel: Nivel de optimización del TAC (ver src/optimizador.py)
+    @return: ResultadoConstruccion
+    @raises ErrorConstruccion: Si algún archivo falla o el enlace no se puede completar
+    """
+    inicio = time.perf_counter()
+    argumentos_trabajador = (directorio_compilados, directorio_bibliotecas, usar_cache, nivel)
+    trabajos = trabajos or os.cpu_count() or 1
+    entradas = [numero == 0 for numero in range(len(rutas))]
+
+    if trabajos == 1:
+        _iniciar_trabajador(*argumentos_trabajador)
+        try:
+            archivos = list(map(construir_archivo, rutas, entradas))
+            nombres = list(dict.fromkeys(n for a in archivos for n in a.importa))
+            archivos += map(construir_biblioteca, nombres)
+        finally:
+            _herramientas.detener()
+    else:
+        with ProcessPoolExecutor(max_workers=trabajos, initializer=_iniciar_trabajador,
+                                 initargs=argumentos_trabajador) as ejecutor:
+            archivos = list(ejecutor.map(construir_archivo, rutas, entradas))
+            nombres = list(dict.fromkeys(n for a in archivos for n in a.importa))
+            archivos += ejecutor.map(construir_biblioteca, nombres)
+
+    errores = [archivo.error for archivo in archivos if archivo.error]
+    if errores:
+        raise ErrorConstruccion(errores)
+
+    # Cada biblioteca una sola vez aunque la importen varias bibliotecas
+    objetos = list({objeto.nombre: objeto
+                    for archivo in archivos for objeto in archivo.objetos}.values())
+    enlace = RegistroTiempos()
+    try:
+        with enlace.medir("enlace", objetos) as medicion:
+            palabras, simbolos = enlazar(objetos, base)
+            medicion.salida = tamano(palabras)
+    except ErrorEnlace as e:
+        raise ErrorConstruccion([str(e)]) from e
+    return ResultadoConstruccion(palabras, simbolos, archivos, enlace,
+                                 time.perf_counter() - inicio)
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from src.objeto import texto_enlazado
+
+    parser = argparse.ArgumentParser(description="Construye en paralelo un programa de varios archivos.")
+    parser.add_argument("fuentes", nargs="+", help="archivos fuente (el primero es el principal)")
+    parser.add_argument("-j", "--trabajos", type=int, default=None, help="procesos de trabajo")
+    parser.add_argument("-O", dest="nivel", type=int, choices=NIVELES, default=NIVEL_POR_DEFECTO,
+                        help="nivel de optimización del TAC")
+    parser.add_argument("-o", "--salida", help="archivo de salida con el binario enlazado")
+    parser.add_argument("--base", type=int, default=0, help="dirección de carga")
+    parser.add_argument("--sin-cache", action="store_true", help="no usar la caché de compilación")
+    parser.add_argument("--tiempos", help="archivo JSON donde se exportan las mediciones de cada etapa")
+    opciones = parser.parse_args()
+
+    try:
+        resultado = construir(opciones.fuentes, opciones.base, opciones.trabajos,
+                              usar_cache=not opciones.sin_cache, nivel=opciones.nivel)
+    except ErrorConstruccion as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    if opciones.salida:
+        with open(opciones.salida, "w", encoding="utf-8", newline="") as salida:
+            salida.write(texto_enlazado(resultado.palabras))
+    if opciones.tiempos:
+        with open(opciones.tiempos, "w", encoding="utf-8") as salida:
+            salida.write(resultado.a_json())
+    print(resultado.reporte())
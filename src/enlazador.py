@@ -0,0 +1,103 @@
+"""
+Enlazador-cargador en proceso, equivalente a `compilados/linkerloader` (linkerLoader.l).
+
+Reemplaza cada dirección relativa "(n)" del código binario por los 21 bits de la
+dirección absoluta base + n y entrega el resultado como texto (el mismo que escribe
+la herramienta flex) o como imagen de memoria lista para `Memoria.load_image`.
+
+Las líneas ".reservar N" no tienen direcciones y pasan sin cambios; en la imagen de
+memoria son una Reserva que el cargador llena de una vez.
+"""
+from src.ensamblador import PALABRA_CERO, binario_natural, atoi, tamano_reserva
+
+
+class Reserva:
+    """
+    Tramo de la imagen de memoria que el cargador llena con una misma palabra.
+
+    - tamano: celdas del tramo
+    - valor: contenido de cada celda (el dato 0)
+    """
+    __slots__ = ("tamano", "valor")
+
+    def __init__(self, tamano, valor=PALABRA_CERO):
+        self.tamano = tamano
+        self.valor = valor
+
+
+def reubicar_linea(linea, base):
+    """
+    Reubica una línea (replace_address): si contiene "(" y ")" se reemplaza desde el
+    primer "(" hasta el primer ")" por la dirección absoluta en 21 bits.
+
+    @param linea: Línea de código binario reubicable (sin salto de línea)
+    @param base: Dirección base
+    @return: Línea con la dirección absoluta
+    """
+    inicio = linea.find("(")
+    fin = linea.find(")")
+    if inicio < 0 or fin < 0:
+        return linea
+    cierre = linea.find(")", inicio)
+    relativa = atoi(linea[inicio + 1:cierre]) if cierre >= 0 else 0
+    return linea[:inicio] + binario_natural(base + relativa) + linea[fin + 1:]
+
+
+def enlazar_lineas(texto, base):
+    """
+    Reubica un texto completo, línea por línea.
+
+    @param texto: Código binario reubicable
+    @param base: Dirección base
+    @return: Lista de líneas con direcciones absolutas
+    """
+    lineas = texto.split("\n")
+    if lineas and lineas[-1] == "":
+        lineas.pop()
+    return [reubicar_linea(linea, base) if "(" in linea else linea for linea in lineas]
+
+
+def enlazar_texto(texto, base):
+    """
+    Reubica un texto completo (process_file).
+
+    @return: Texto con direcciones absolutas, en el formato de `compilados/linkerloader`
+    """
+    return "".join(f"{linea}\n" for linea in enlazar_lineas(texto, base))
+
+
+def palabra_de_linea(linea):
+    """
+    Contenido de la celda de memoria para una línea enlazada: el entero de la palabra
+    si la línea es binaria, una Reserva si es ".reservar N" o el texto tal cual en otro
+    caso (p. ej. un error del ensamblador).
+    """
+    texto = linea.strip()
+    if texto and texto.strip("01") == "":
+        return int(texto, 2)
+    tamano = tamano_reserva(texto)
+    if tamano is not None:
+        return Reserva(tamano)
+    return linea
+
+
+def imagen_memoria(lineas):
+    """
+    Convierte las líneas enlazadas en las palabras que se cargan en memoria.
+
+    @param lineas: Líneas con direcciones absolutas
+    @return: Lista con el contenido de cada celda, en orden (una Reserva por cada tramo)
+    """
+    return [palabra_de_linea(linea) for linea in lineas]
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 4:
+        print("Uso: python enlazador.py <entrada.txt> <salida.txt> <dirección base>")
+        sys.exit(1)
+    with open(sys.argv[1], "r", encoding="utf-8", newline="") as entrada:
+        resultado = enlazar_texto(entrada.read(), int(sys.argv[3]))
+    with open(sys.argv[2], "w", encoding="utf-8", newline="") as salida:
+        salida.write(resultado)
@@ -0,0 +1,562 @@
+"""
+Ensamblador en proceso, equivalente a `compilados/ensamblador` (ensamblador.l).
+
+Produce exactamente el mismo texto que la herramienta flex (una palabra por línea,
+con las direcciones relativas como "(n)" para el enlazador) y además cada palabra
+como entero junto con la lista de reubicaciones, sin pasar por archivos ni procesos.
+
+Reglas de reconocimiento (las mismas de ensamblador.l):
+    - Cada línea se reconoce completa con la primera regla que la cubre; si ninguna
+      la cubre se emite "[Error ensamblador ]<línea>".
+    - Los espacios al inicio de una línea se ignoran (salvo en la primera línea del
+      texto, donde flex los trata como parte de la línea) y las líneas en blanco no
+      producen salida.
+    - Los operandos se separan con "," y espacios (o comillas, como en la regla flex).
+    - Reserva: una línea ".reservar N" ocupa N celdas que el cargador llena con el
+      dato 0 (la palabra de "0"). Se copia tal cual a la salida, en una sola línea,
+      en lugar de N palabras iguales.
+
+Extensiones respecto a la herramienta flex (líneas que antes eran un error):
+    - MOVE, SHL, SHR, ROL y ROR con dos registros.
+    - Etiquetas: una línea "nombre:" define una etiqueta con la dirección (relativa)
+      de la siguiente palabra, y "[nombre]" puede usarse en lugar de "[0x..]".
+    - Referencias externas (`ensamblar(..., externos=nombres)`): un "[nombre]" de
+      la lista que no es una etiqueta del programa se ensambla con la dirección 0 y
+      queda registrado para que lo resuelva el enlazador de objetos (src/objeto.py).
+    - Direccionamiento por registro: "LOAD Rx, [Ry]" y "STORE Rx, [Ry]" se ensamblan
+      como LOADR y STORER (opcodes 11101 y 11110), igual que "LOAD Rx, Ry".
+"""
+import re
+from functools import lru_cache
+
+MASCARA_21 = (1 << 21) - 1
+BITS_DIRECCION = 21
+
+# Código de operación según la posición en la tabla de la máquina virtual
+CODIGOS = [
+    "NOP", "LOAD", "STORE", "MOVE", "ADD", "SUB", "MUL", "DIV", "AND", "OR", "NOR",
+    "NOT", "SHL", "SHR", "ROL", "ROR", "JUMP", "BEQ", "BNE", "BLT", "JLE", "PUSH",
+    "POP", "CALL", "RET", "IN", "OUT", "CMP", "CLR", "ERROR", "ERROR", "HALT"
+]
+OPCODES = {nombre: format(codigo, "05b") for codigo, nombre in enumerate(CODIGOS)
+           if nombre != "ERROR"}
+# LOAD y STORE con un registro como segundo operando (LOADR y STORER)
+OPCODES_REGISTRO = {"LOAD": "11101", "STORE": "11110"}
+
+# Piezas de las expresiones de ensamblador.l ({spaces} incluye la comilla doble)
+_ESPACIO = '[ "]'
+_REGISTRO = "R[0-3]"
+_DIRECCION = r"\[0x[0-9A-F]+\]"
+_OPERANDO = f"(?:{_REGISTRO}|{_DIRECCION})"
+_POR_REGISTRO = re.compile(
+    rf"(LOAD|STORE){_ESPACIO}+({_REGISTRO}),{_ESPACIO}*\[({_REGISTRO})\]{_ESPACIO}*")
+
+# Formato de operandos -> (expresión de los operandos, conversiones de sscanf esperadas)
+FORMATOS = {
+    "RRR": (f"{_ESPACIO}+{_REGISTRO},{_ESPACIO}*{_REGISTRO},{_ESPACIO}*{_REGISTRO}{_ESPACIO}*", 4),
+    "RRD": (f"{_ESPACIO}+{_REGISTRO},{_ESPACIO}*{_REGISTRO},{_ESPACIO}*{_DIRECCION}{_ESPACIO}*", 4),
+    "OO": (f"{_ESPACIO}+{_OPERANDO},{_ESPACIO}*{_OPERANDO}{_ESPACIO}*", 3),
+    "RR": (f"{_ESPACIO}+{_REGISTRO},{_ESPACIO}*{_REGISTRO}{_ESPACIO}*", 3),
+    "D": (f"{_ESPACIO}{_DIRECCION}{_ESPACIO}*", 2),  # JUMP/CALL: un solo separador
+    "D+": (f"{_ESPACIO}+{_DIRECCION}{_ESPACIO}*", 2),
+    "R": (f"{_ESPACIO}+{_REGISTRO}{_ESPACIO}*", 2),
+    "": (f"{_ESPACIO}*", 1),
+}
+
+# Mnemónico -> formatos de operandos aceptados (en el orden de las reglas flex)
+MNEMONICOS = {
+    **{nombre: ("RRR",) for nombre in ("ADD", "SUB", "MUL", "DIV", "AND", "OR", "NOR")},
+    **{nombre: ("RRD",) for nombre in ("BEQ", "BNE", "BLT", "JLE")},
+    **{nombre: ("OO",) for nombre in ("LOAD", "STORE", "CMP")},
+    **{nombre: ("RR",) for nombre in ("MOVE", "SHL", "SHR", "ROL", "ROR")},
+    "JUMP": ("D",),
+    "CALL": ("D",),
+    "IN": ("D+", "R"),
+    **{nombre: ("R",) for nombre in ("NOT", "CLR", "PUSH", "POP", "OUT")},
+    **{nombre: ("",) for nombre in ("RET", "NOP", "HALT")},
+}
+
+# Tabla precalculada: mnemónico -> [(opcode, expresión compilada, conversiones)]
+TABLA = {
+    nombre: [(OPCODES[nombre], re.compile(FORMATOS[formato][0]), FORMATOS[formato][1])
+             for formato in formatos]
+    for nombre, formatos in MNEMONICOS.items()
+}
+
+_MNEMONICO = re.compile(r"[A-Z]+")
+_ETIQUETA = re.compile(r"([A-Za-z_][A-Za-z0-9_]*):[ \t]*")
+_REFERENCIA = re.compile(r"\[([A-Za-z_][A-Za-z0-9_]*)\]")
+
+_BOOLEANO = "(?:[Ff][Aa][Ll][Ss][Ee]|[Tt][Rr][Uu][Ee])"
+# El "." de la regla flex de flotantes acepta cualquier carácter: "100" también es flotante
+_FLOTANTE = "[+-]?[0-9]+.[0-9]+"
+_ENTERO = "[+-][0-9]+"
+_NATURAL = "[0-9]+"
+_DATOS = [
+    ("flotante", re.compile(_FLOTANTE)),
+    ("entero", re.compile(_ENTERO)),
+    ("natural", re.compile(_NATURAL)),
+    ("booleano", re.compile(_BOOLEANO)),
+    ("caracter", re.compile("[A-Za-z]")),
+    ("arreglo", re.compile(
+        rf"\[(?:(?:{_FLOTANTE}|{_ENTERO}|{_NATURAL}|{_BOOLEANO}|'[A-Za-z]'),?)+\]")),
+]
+
+_BLANCOS_C = " \t\n\v\f\r"  # isspace() de C
+_ATOF_DECIMAL = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+_ATOF_HEXADECIMAL = re.compile(r"([+-]?)0[xX]((?:[0-9a-fA-F]+\.?[0-9a-fA-F]*|\.[0-9a-fA-F]+)(?:[pP][+-]?[0-9]+)?)")
+_ATOI = re.compile(r"[+-]?[0-9]+")
+_HEXADECIMAL = re.compile(r"[ \t\n\v\f\r]*([+-]?)(?:0[xX](?=[0-9a-fA-F]))?([0-9a-fA-F]*)")
+_PALABRA_REUBICABLE = re.compile(r"([01]*)\(([0-9]+)\)([01]*)")
+
+PREFIJO_BOOLEANO = "00000000001"
+PREFIJO_NATURAL = "00000000010"
+PREFIJO_ENTERO = "00000000011"
+PREFIJO_FLOTANTE = "00000000100"
+PREFIJO_CARACTER = "00000000101"
+PREFIJO_ARREGLO = "00000000110"
+
+DIRECTIVA_RESERVA = ".reservar"
+_RESERVA = re.compile(r"\.reservar[ \t]+([0-9]+)[ \t]*")
+# Palabra con la que el cargador llena una reserva: la misma que ensambla "0"
+PALABRA_CERO = int(PREFIJO_NATURAL + "0" * BITS_DIRECCION, 2)
+
+
+# ---------------------------------------------------------------------------
+# Conversiones de la biblioteca de C usadas por ensamblador.l
+# ---------------------------------------------------------------------------
+
+def _atof(texto):
+    """atof(): convierte el prefijo más largo que sea un número (0.0 si no hay ninguno)."""
+    texto = texto.lstrip(_BLANCOS_C)
+    hexadecimal = _ATOF_HEXADECIMAL.match(texto)
+    if hexadecimal:
+        signo, cuerpo = hexadecimal.groups()
+        if "p" not in cuerpo.lower():
+            cuerpo += "p0"
+        return float.fromhex(signo + "0x" + cuerpo)
+    decimal = _ATOF_DECIMAL.match(texto)
+    return float(decimal.group()) if decimal else 0.0
+
+
+def atoi(texto):
+    """atoi() en una plataforma con long de 64 bits e int de 32 bits."""
+    numero = _ATOI.match(texto.lstrip(_BLANCOS_C))
+    if not numero:
+        return 0
+    valor = max(-2**63, min(2**63 - 1, int(numero.group())))
+    valor &= 0xFFFFFFFF
+    return valor - 2**32 if valor >= 2**31 else valor
+
+
+def _strtol_hexadecimal(texto):
+    signo, digitos = _HEXADECIMAL.match(texto).groups()
+    valor = int(digitos, 16) if digitos else 0
+    return -valor if signo == "-" else valor
+
+
+def _escanear(texto, conversiones):
+    """
+    Equivalente de sscanf(texto, "%9s %[^,], %[^,], %9s", ...) limitado a las
+    primeras `conversiones` conversiones.
+
+    @return: Lista con los campos leídos (puede tener menos de los pedidos)
+    """
+    campos = []
+    longitud = len(texto)
+    i = 0
+    for numero in range(conversiones):
+        if numero > 0:
+            if numero > 1:
+                # "," literal antes del segundo %[^,] y del último %9s
+                if i >= longitud or texto[i] != ",":
+                    break
+                i += 1
+            while i < longitud and texto[i] in _BLANCOS_C:
+                i += 1
+        if numero in (0, 3):
+            # %9s: omite blancos y lee hasta 9 caracteres que no sean blancos
+            while i < longitud and texto[i] in _BLANCOS_C:
+                i += 1
+            inicio = i
+            while i < longitud and i - inicio < 9 and texto[i] not in _BLANCOS_C:
+                i += 1
+        else:
+            # %[^,]: lee hasta la siguiente coma (al menos un carácter)
+            inicio = i
+            fin = texto.find(",", i)
+            i = longitud if fin < 0 else fin
+        if i == inicio:
+            break
+        campos.append(texto[inicio:i])
+    return campos
+
+
+# ---------------------------------------------------------------------------
+# Codificación (GenerarBinarioParams y funciones auxiliares de ensamblador.l)
+# ---------------------------------------------------------------------------
+
+def _codigo_comando(comando, es_registro):
+    if es_registro and comando in OPCODES_REGISTRO:
+        return OPCODES_REGISTRO[comando]
+    return OPCODES.get(comando, "00000")
+
+
+def _operando(texto):
+    """Codificación de un operando: 2 bits si es registro o "(n)" si es una dirección."""
+    partes = texto.split(maxsplit=1)
+    limpio = partes[0] if partes else ""
+    if limpio[:1] == "R":
+        if len(limpio) == 2 and limpio[1] in "0123":
+            return format(int(limpio[1]), "02b")
+        return ""
+    if len(limpio) < 5 or not (limpio[0] == "[" and limpio[-1] == "]" and limpio[1:3] == "0x"):
+        return "Formato Incorrecto Relative"
+    return f"({_strtol_hexadecimal(limpio[3:-1])})"
+
+
+def codificar_instruccion(comando, operando1="", operando2="", operando3=""):
+    """
+    Texto de una instrucción con el mismo relleno de campos que GenerarBinarioParams:
+    opcode, registros de 2 bits, ceros de relleno y las direcciones como "(n)".
+
+    @return: Texto de la palabra (32 caracteres una vez resuelta la dirección)
+    """
+    es_registro1 = operando1[:1] == "R"
+    es_registro2 = operando2[:1] == "R"
+    numero = _codigo_comando(comando, es_registro2)
+    if not es_registro1:
+        numero += "000000"
+    if operando1:
+        numero += _operando(operando1)
+    if not es_registro2 and es_registro1:
+        numero += "0000"
+    if operando2:
+        numero += _operando(operando2)
+    if operando3[:1] != "R" and es_registro1 and es_registro2:
+        numero += "00"
+    if operando3:
+        numero += _operando(operando3)
+    if len(numero) < 32 and "(" not in numero:
+        numero += "0" * (32 - len(numero))
+    return numero
+
+
+def binario_natural(valor):
+    """Los 21 bits menos significativos de un entero (print_binary)."""
+    return format(valor & MASCARA_21, "021b")
+
+
+def binario_flotante(texto):
+    """
+    Representación de 21 bits de un flotante (binary_from_float_21_bits): signo,
+    numerador y denominador de 10 bits, a partir de los 3 primeros dígitos significativos.
+    """
+    valor = _atof(texto)
+    signo = 1 if valor < 0 else 0
+    cifras = f"{abs(valor):.10f}"
+
+    extraidos = ""
+    potencia = 0
+    encontrado = False
+    for caracter in cifras:
+        if len(extraidos) >= 3:
+            break
+        if caracter == ".":
+            potencia = 0
+        if "1" <= caracter <= "9":
+            encontrado = True
+        if encontrado and caracter != ".":
+            extraidos += caracter
+            potencia += 1
+    truncado = _atof(extraidos) / 10.0 ** potencia
+
+    numerador, denominador = 0, 1023
+    for i in range(1023, 0, -1):
+        temporal = truncado * i
+        if 0 <= temporal <= 1023 and temporal.is_integer():
+            numerador, denominador = int(temporal), i
+            break
+    return f"{signo}{numerador:010b}{denominador:010b}"
+
+
+def _entero(texto):
+    """Salida de la regla de enteros con signo (puede incluir la línea de error de rango)."""
+    valor = atoi(texto)
+    bits = binario_natural(valor)
+    if valor < -1048576 or valor > 1048575:
+        return [PREFIJO_ENTERO + "Error: Número fuera del rango de 21 bits (-1048576 a 1048575)", bits]
+    return [PREFIJO_ENTERO + bits]
+
+
+def _arreglo(texto):
+    elementos = [elemento for elemento in texto[1:-1].split(",") if elemento]
+    lineas = [PREFIJO_ARREGLO + binario_natural(len(elementos))]
+    for elemento in elementos:
+        if "." in elemento:
+            lineas.append(PREFIJO_FLOTANTE + binario_flotante(elemento))
+        elif elemento.upper() == "TRUE":
+            lineas.append(PREFIJO_BOOLEANO + "0" * 20 + "1")
+        elif elemento.upper() == "FALSE":
+            lineas.append(PREFIJO_BOOLEANO + "0" * 21)
+        elif len(elemento) == 3 and elemento[0] == "'" and elemento[2] == "'":
+            lineas.append(PREFIJO_CARACTER + binario_natural(ord(elemento[1])))
+        elif elemento[0] in "+-":
+            lineas.extend(_entero(elemento))
+        else:
+            lineas.append(PREFIJO_NATURAL + binario_natural(atoi(elemento)))
+    return lineas
+
+
+def _dato(regla, texto):
+    if regla == "flotante":
+        return [PREFIJO_FLOTANTE + binario_flotante(texto)]
+    if regla == "entero":
+        return _entero(texto)
+    if regla == "natural":
+        return [PREFIJO_NATURAL + binario_natural(atoi(texto))]
+    if regla == "booleano":
+        # Solo TRUE y FALSE en mayúsculas producen una palabra
+        if texto == "TRUE":
+            return [PREFIJO_BOOLEANO + "0" * 20 + "1"]
+        if texto == "FALSE":
+            return [PREFIJO_BOOLEANO + "0" * 21]
+        return []
+    if regla == "caracter":
+        # binary_from_char termina la línea y la regla agrega otro salto: queda una línea vacía
+        return [PREFIJO_CARACTER + "00000" + format(ord(texto) & 0xFFFF, "016b"), ""]
+    return _arreglo(texto)
+
+
+def _palabra(linea):
+    """
+    Valor entero de una línea de salida.
+
+    @return: Tupla (valor, desplazamiento); desplazamiento es la posición en bits del
+             campo de dirección relativa, o None si la palabra no se reubica.
+             valor es None si la línea no es una palabra binaria (p. ej. un error).
+    """
+    if linea and linea.strip("01") == "":
+        return int(linea, 2), None
+    reubicable = _PALABRA_REUBICABLE.fullmatch(linea)
+    if reubicable is None:
+        return None, None
+    prefijo, direccion, sufijo = reubicable.groups()
+    desplazamiento = len(sufijo)
+    valor = (int(prefijo or "0", 2) << (BITS_DIRECCION + desplazamiento)
+             | (int(direccion) & MASCARA_21) << desplazamiento
+             | int(sufijo or "0", 2))
+    return valor, desplazamiento
+
+
+@lru_cache(maxsize=65536)
+def ensamblar_linea(linea):
+    """
+    Ensambla una línea ya sin los espacios iniciales que consume flex.
+
+    @param linea: Texto de la línea (sin salto de línea)
+    @return: Tupla de (texto, valor, desplazamiento) por cada línea de salida
+    """
+    salida = _reconocer(linea)
+    return tuple((texto, *_palabra(texto)) for texto in salida)
+
+
+def _reconocer(linea):
+    if tamano_reserva(linea) is not None:
+        return [linea]
+    por_registro = _POR_REGISTRO.fullmatch(linea)
+    if por_registro:
+        return [codificar_instruccion(*por_registro.groups())]
+    mnemonico = _MNEMONICO.match(linea)
+    if mnemonico:
+        operandos_inicio = mnemonico.end()
+        for opcode, expresion, conversiones in TABLA.get(mnemonico.group(), ()):
+            if expresion.fullmatch(linea, operandos_inicio):
+                campos = _escanear(linea, conversiones)
+                if len(campos) != conversiones:
+                    if conversiones == 3:
+                        return [f"Error al analizar la instrucción: {linea}"]
+                    return []
+                return [codificar_instruccion(*campos)]
+    for regla, expresion in _DATOS:
+        if expresion.fullmatch(linea):
+            return _dato(regla, linea)
+    return [f"[Error ensamblador ]{linea}"]
+
+
+def linea_reserva(tamano):
+    """Línea ".reservar N" para una reserva de `tamano` celdas."""
+    return f"{DIRECTIVA_RESERVA} {tamano}"
+
+
+def tamano_reserva(linea):
+    """
+    Celdas que ocupa una línea de reserva.
+
+    @param linea: Línea de ensamblador o de código binario
+    @return: N si la línea es ".reservar N"; None si no es una reserva
+    """
+    if DIRECTIVA_RESERVA not in linea:
+        return None
+    reserva = _RESERVA.fullmatch(linea.strip())
+    return int(reserva.group(1)) if reserva else None
+
+
+class ProgramaEnsamblado:
+    """
+    Resultado del ensamblado.
+
+    - lineas: texto de cada línea de salida (el mismo que escribe la herramienta flex)
+    - palabras: valor entero de cada línea (None si la línea no es una palabra binaria);
+      las direcciones relativas valen n, sin dirección base
+    - reubicaciones: lista de (índice, desplazamiento) de las palabras con un campo de
+      dirección relativa de 21 bits en el bit `desplazamiento`
+    - etiquetas: etiqueta -> dirección relativa
+    - externas: lista de (índice, nombre) de las palabras que referencian un símbolo
+      que no está definido en el programa (su campo de dirección vale 0)
+    - reservas: índice de línea -> celdas de cada línea ".reservar N"
+
+    Los índices son posiciones en `lineas`; coinciden con las direcciones relativas
+    hasta la primera reserva.
+    """
+    def __init__(self, lineas, palabras, reubicaciones, etiquetas, externas=(), reservas=None):
+        self.lineas = lineas
+        self.palabras = palabras
+        self.reubicaciones = reubicaciones
+        self.etiquetas = etiquetas
+        self.externas = list(externas)
+        self.reservas = dict(reservas or {})
+
+    def __len__(self):
+        """Celdas que ocupa el programa en memoria (las reservas incluidas)."""
+        return len(self.lineas) + sum(tamano - 1 for tamano in self.reservas.values())
+
+    def texto(self):
+        """Salida en el formato de `compilados/ensamblador` (entrada del enlazador)."""
+        return "".join(f"{linea}\n" for linea in self.lineas)
+
+    def palabras_absolutas(self, base=0):
+        """
+        Palabras con las direcciones relativas resueltas a partir de `base`.
+
+        @param base: Dirección de carga del programa
+        @return: Lista de enteros (None en las líneas que no son palabras)
+        """
+        palabras = list(self.palabras)
+        for indice, desplazamiento in self.reubicaciones:
+            campo = MASCARA_21 << desplazamiento
+            relativa = (palabras[indice] & campo) >> desplazamiento
+            palabras[indice] = (palabras[indice] & ~campo) | (((base + relativa) & MASCARA_21) << desplazamiento)
+        return palabras
+
+
+def _lineas_fuente(texto):
+    """
+    Líneas que reconoce flex: la primera tal cual y el resto sin los espacios iniciales,
+    que se consumen junto con el salto de línea anterior. Las líneas en blanco se omiten.
+    """
+    for numero, linea in enumerate(texto.split("\n")):
+        if numero:
+            linea = linea.lstrip(" \t")
+        if linea.strip(" \t"):
+            yield linea
+
+
+def _etiquetas(lineas):
+    """Primera pasada: dirección relativa de cada etiqueta."""
+    etiquetas = {}
+    direccion = 0
+    for linea in lineas:
+        etiqueta = _ETIQUETA.fullmatch(linea)
+        if etiqueta:
+            etiquetas[etiqueta.group(1)] = direccion
+        elif tamano_reserva(linea) is not None:
+            direccion += tamano_reserva(linea)
+        else:
+            direccion += len(ensamblar_linea(_resolver(linea, etiquetas) if "[" in linea else linea))
+    return etiquetas
+
+
+def _resolver(linea, etiquetas):
+    """Reemplaza "[etiqueta]" por su dirección en las instrucciones."""
+    mnemonico = _MNEMONICO.match(linea)
+    if not etiquetas or not mnemonico or mnemonico.group() not in TABLA:
+        return linea
+    return _REFERENCIA.sub(
+        lambda m: f"[0x{etiquetas[m.group(1)]:X}]" if m.group(1) in etiquetas else m.group(),
+        linea)
+
+
+def _externa(linea, externos):
+    """
+    Reemplaza la primera referencia "[nombre]" de una instrucción por "[0x0]" si
+    `nombre` es externo.
+
+    @return: Tupla (línea, nombre referenciado o None)
+    """
+    mnemonico = _MNEMONICO.match(linea)
+    referencia = _REFERENCIA.search(linea)
+    if (not mnemonico or mnemonico.group() not in TABLA or referencia is None
+            or referencia.group(1) not in externos):
+        return linea, None
+    return linea[:referencia.start()] + "[0x0]" + linea[referencia.end():], referencia.group(1)
+
+
+def ensamblar(fuente, externos=()):
+    """
+    Ensambla un programa.
+
+    @param fuente: Texto ensamblador o flujo de lectura (archivo abierto)
+    @param externos: Símbolos definidos en otros módulos; sus referencias se registran
+                     como externas en lugar de producir una línea de error
+    @return: ProgramaEnsamblado
+    """
+    texto = fuente if isinstance(fuente, str) else fuente.read()
+    lineas = list(_lineas_fuente(texto))
+    etiquetas = _etiquetas(lineas) if ":" in texto else {}
+
+    salida, palabras, reubicaciones, externas, reservas = [], [], [], [], {}
+    for linea in lineas:
+        if etiquetas:
+            if _ETIQUETA.fullmatch(linea):
+                continue
+            if "[" in linea:
+                linea = _resolver(linea, etiquetas)
+        externa = None
+        if externos and "[" in linea:
+            linea, externa = _externa(linea, externos)
+        for texto_palabra, valor, desplazamiento in ensamblar_linea(linea):
+            if desplazamiento is not None:
+                if externa is not None:
+                    externas.append((len(salida), externa))
+                reubicaciones.append((len(salida), desplazamiento))
+            if valor is None and tamano_reserva(texto_palabra) is not None:
+                reservas[len(salida)] = tamano_reserva(texto_palabra)
+            salida.append(texto_palabra)
+            palabras.append(valor)
+    return ProgramaEnsamblado(salida, palabras, reubicaciones, etiquetas, externas, reservas)
+
+
+def ensamblar_texto(fuente):
+    """
+    Ensambla un programa y devuelve el texto que produciría `compilados/ensamblador`.
+
+    @param fuente: Texto ensamblador o flujo de lectura
+    @return: Texto binario con una palabra (o una reserva) por línea
+    """
+    return ensamblar(fuente).texto()
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) < 2:
+        print("Uso: python ensamblador.py <entrada.asm> [salida.txt]")
+        sys.exit(1)
+    with open(sys.argv[1], "r", encoding="utf-8", newline="") as entrada:
+        resultado = ensamblar_texto(entrada)
+    if len(sys.argv) > 2:
+        with open(sys.argv[2], "w", encoding="utf-8", newline="") as archivo:
+            archivo.write(resultado)
+    else:
+        sys.stdout.write(resultado)
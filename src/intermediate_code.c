@@ -62,6 +62,7 @@ static TempManager *init_temp_manager() {
     mgr->next_label = 1;
     mgr->capacity = 100;
     mgr->temp_names = malloc(sizeof(char*) * mgr->capacity);
+    mgr->temp_names[0] = NULL;  // Los temporales empiezan en t1
     return mgr;
 }
 
@@ -78,7 +79,9 @@ static char *new_temp() {
     }
     
     char *temp = malloc(20);
-    sprintf(temp, "t%d", temp_mgr->next_temp++);
+    sprintf(temp, "t%d", temp_mgr->next_temp);
+    // Registrar el nombre para liberarlo al terminar la generación
+    temp_mgr->temp_names[temp_mgr->next_temp++] = temp;
     return temp;
 }
 
@@ -531,10 +534,33 @@ static char *generate_code(Node *node, FILE *output) {
     return result;
 }
 
+/**
+ * Genera el código intermedio del AST en un flujo ya abierto.
+ * Inicializa el administrador de temporales (los contadores de temporales y
+ * etiquetas vuelven a empezar en cada llamada), procesa el AST completo y
+ * libera los recursos utilizados.
+ * 
+ * @param ast Raíz del AST que representa el programa
+ * @param output Flujo de salida (no se cierra)
+ */
+void generate_intermediate_code_stream(Node *ast, FILE *output) {
+    if (!ast) return;
+    
+    temp_mgr = init_temp_manager();
+    generate_code(ast, output);
+    fflush(output);
+    
+    for (int i = 0; i < temp_mgr->next_temp; i++) {
+        free(temp_mgr->temp_names[i]);
+    }
+    free(temp_mgr->temp_names);
+    free(temp_mgr);
+    temp_mgr = NULL;
+}
+
 /**
  * Punto de entrada principal para generar código intermedio a partir del AST.
- * Inicializa el administrador de temporales, procesa el AST completo y libera
- * los recursos utilizados.
+ * Abre el archivo de salida y delega en generate_intermediate_code_stream.
  * 
  * @param ast Raíz del AST que representa el programa
  * @param output_file Nombre del archivo de salida
@@ -549,14 +575,7 @@ void generate_intermediate_code(Node *ast, const char *output_file) {
         return;
     }
     
-    temp_mgr = init_temp_manager();
-    generate_code(ast, output);
+    generate_intermediate_code_stream(ast, output);
     
     fclose(output);
-    
-    for (int i = 0; i < temp_mgr->next_temp; i++) {
-        free(temp_mgr->temp_names[i]);
-    }
-    free(temp_mgr->temp_names);
-    free(temp_mgr);
 }
\ No newline at end of file
@@ -1,8 +1,10 @@
 #ifndef INTERMEDIATE_CODE_H
 #define INTERMEDIATE_CODE_H
 
+#include <stdio.h>
 #include "ast.h"
 
 void generate_intermediate_code(Node *ast, const char *output_file);
+void generate_intermediate_code_stream(Node *ast, FILE *output);
 
 #endif /* INTERMEDIATE_CODE_H */
\ No newline at end of file
@@ -0,0 +1,358 @@
+"""
+Optimización de mirilla (peephole) sobre el código ensamblador.
+
+Se aplica entre la traducción del TAC (src/TAC.py) y el ensamblador: recorre la
+sección de código con las reglas de la tabla REGLAS hasta que ninguna cambia nada y
+cuenta cuántas instrucciones cambió cada una:
+
+    python -m src.mirilla [-O1|-O2] [--reglas r1,r2,...] <entrada.asm> [salida.asm]
+
+Los saltos ya tienen su dirección: un salto a "[0xA]" continúa en la instrucción de
+la dirección A + 1 (la máquina incrementa el CP después de saltar). Al quitar
+instrucciones se recalculan todas las direcciones de salto. Una instrucción a la
+que llega un salto no se quita salvo que equivalga a seguir con la siguiente, y lo
+que se sabe de los registros se olvida en ella.
+"""
+import re
+from collections import Counter
+
+from src.optimizador import NIVEL_POR_DEFECTO
+
+# Reglas: nombre -> (patrón, reescritura, nivel mínimo). "..." son instrucciones que
+# no escriben Rx ni [a] y a las que no llega ningún salto; L: es el destino de un salto.
+# Si la carga es en otro registro (Ry), sus lecturas hasta que Ry se vuelve a escribir
+# pasan a Rx; solo si eso ocurre antes de cualquier salto (la máquina no tiene una
+# copia entre registros: MOVE lee la memoria).
+REGLAS = {
+    "carga-repetida": ("LOAD Rx, [a] ... LOAD Ry, [a]", "LOAD Rx, [a] ...", 1),
+    # Solo si Rx tenía un valor leído de la memoria: el resultado de una operación
+    # puede cambiar al guardarse (los flotantes se redondean, los enteros se recortan)
+    "carga-tras-guardar": ("STORE Rx, [a] ... LOAD Ry, [a]", "STORE Rx, [a] ...", 2),
+    "salto-al-siguiente": ("JUMP [L] L:  (o un salto condicional)", "L:", 1),
+    "salto-a-salto": ("JUMP [L] ... L: JUMP [M]", "JUMP [M] ... L: JUMP [M]", 1),
+    "inalcanzable": ("JUMP [L] x ... L:", "JUMP [L] L:", 1),
+}
+
+_SALTO = re.compile(r"(JUMP|CALL|BEQ|BNE|BLT|JLE)\b(.*)\[0x([0-9A-F]+)\]")
+_MEMORIA = re.compile(r"(LOAD|STORE) R([0-3]), \[0x([0-9A-F]+)\]")
+_OPERACION = re.compile(r"(ADD|SUB|MUL|DIV|AND|OR|NOR) R([0-3]), R([0-3]), R([0-3])")
+_LECTURA = re.compile(r"(?:OUT|PUSH) R([0-3])")
+_INSTRUCCION = re.compile(r"[A-Z]+\b")
+# Instrucciones que no escriben registros ni memoria ni cambian el flujo
+_SIN_EFECTO = ("OUT", "PUSH", "NOP", "BEQ", "BNE", "BLT", "JLE")
+
+
+def reglas_de_nivel(nivel):
+    """Reglas que se aplican con un nivel de optimización (ver src/optimizador.py)."""
+    return [nombre for nombre, (_, _, minimo) in REGLAS.items() if nivel >= minimo]
+
+
+class _Codigo:
+    """
+    Sección de código en edición.
+
+    - lineas: texto de cada instrucción (None si se quitó)
+    - destinos: índice de la instrucción donde continúa cada salto (None si no salta
+      a una dirección del código)
+    - entradas: índices a los que se llega desde fuera del código analizado
+    """
+    def __init__(self, code_section, inicio, entradas):
+        self.inicio = inicio
+        self.lineas = list(code_section)
+        self.destinos = [self.indice(linea) for linea in self.lineas]
+        self.entradas = {direccion + 1 - inicio for direccion in entradas} | {0}
+
+    def indice(self, linea):
+        salto = _SALTO.match(linea)
+        if salto is None:
+            return None
+        indice = int(salto.group(3), 16) + 1 - self.inicio
+        return indice if 0 <= indice <= len(self.lineas) else None
+
+    def siguiente(self, indice):
+        """Primera instrucción que queda a partir de `indice` (len si no hay ninguna)."""
+        while indice < len(self.lineas) and self.lineas[indice] is None:
+            indice += 1
+        return indice
+
+    def vivas(self):
+        return [indice for indice, linea in enumerate(self.lineas) if linea is not None]
+
+    def llegadas(self):
+        """Índices de las instrucciones a las que llega un salto o una entrada."""
+        return {self.siguiente(destino) for indice, destino in enumerate(self.destinos)
+                if destino is not None and self.lineas[indice] is not None} | {
+                    self.siguiente(entrada) for entrada in self.entradas}
+
+    def quitar(self, indice):
+        self.lineas[indice] = None
+        self.destinos[indice] = None
+
+    def reubicar(self, direccion):
+        """Dirección de salto equivalente a `direccion` en el código resultante."""
+        indice = direccion + 1 - self.inicio
+        if not 0 <= indice <= len(self.lineas):
+            return direccion
+        return self.posiciones[self.siguiente(indice)] - 1 + self.inicio
+
+    def resultado(self):
+        """Código final; a partir de aquí `reubicar` usa la nueva distribución."""
+        self.posiciones = [0]  # índice original -> índice en el código final
+        for linea in self.lineas:
+            self.posiciones.append(self.posiciones[-1] + (linea is not None))
+        nuevos = []
+        for linea, destino in zip(self.lineas, self.destinos):
+            if linea is None:
+                continue
+            if destino is not None:
+                direccion = self.reubicar(destino - 1 + self.inicio)
+                linea = re.sub(r"\[0x[0-9A-F]+\]$", f"[0x{direccion:X}]", linea)
+            nuevos.append(linea)
+        return nuevos
+
+
+def _uso_registros(linea):
+    """
+    Registros que lee y que escribe una instrucción que no cambia el flujo.
+
+    @return: Tupla (registros leídos, registro escrito o None), o None si la
+             instrucción salta, llama, se detiene o no se reconoce
+    """
+    memoria = _MEMORIA.fullmatch(linea)
+    if memoria:
+        if memoria.group(1) == "STORE":
+            return (memoria.group(2),), None
+        return (), memoria.group(2)
+    operacion = _OPERACION.fullmatch(linea)
+    if operacion:
+        return operacion.group(2, 3), operacion.group(4)
+    lectura = _LECTURA.fullmatch(linea)
+    if lectura:
+        return (lectura.group(1),), None
+    if linea == "NOP":
+        return (), None
+    return None
+
+
+def _renombrar_lecturas(linea, viejo, nuevo):
+    operacion = _OPERACION.fullmatch(linea)
+    if operacion:
+        nombre, izquierdo, derecho, destino = operacion.groups()
+        izquierdo, derecho = (nuevo if registro == viejo else registro for registro in (izquierdo, derecho))
+        return f"{nombre} R{izquierdo}, R{derecho}, R{destino}"
+    # STORE, OUT y PUSH solo tienen el registro que leen
+    return linea.replace(f"R{viejo}", f"R{nuevo}", 1)
+
+
+def _usar_otro_registro(codigo, indice, destino, fuente, llegadas):
+    """
+    Quita `LOAD R<destino>, [a]` (en `indice`) si R<fuente> ya tiene el valor de [a]:
+    las lecturas de R<destino> hasta que se vuelve a escribir pasan a R<fuente>.
+
+    @return: Si se pudo (R<destino> se escribe antes de un salto o una llegada y
+             R<fuente> no cambia mientras se lee en su lugar)
+    """
+    lecturas = []
+    fuente_escrita = False
+    for siguiente in range(indice + 1, len(codigo.lineas)):
+        linea = codigo.lineas[siguiente]
+        if linea is None:
+            continue
+        uso = None if siguiente in llegadas else _uso_registros(linea)
+        if uso is None:
+            return False
+        leidos, escrito = uso
+        if destino in leidos:
+            if fuente_escrita:
+                return False
+            lecturas.append(siguiente)
+        if escrito == destino:
+            break
+        if escrito == fuente:
+            fuente_escrita = True
+    else:
+        return False
+    codigo.quitar(indice)
+    for siguiente in lecturas:
+        codigo.lineas[siguiente] = _renombrar_lecturas(codigo.lineas[siguiente], destino, fuente)
+    return True
+
+
+def _cargas(codigo, reglas, cambios):
+    """carga-repetida y carga-tras-guardar: registros que ya tienen el valor de [a]."""
+    llegadas = codigo.llegadas()
+    # registro -> (dirección cuyo valor tiene, "LOAD" o "STORE"); solo registros con
+    # una palabra de memoria, que no cambia al guardarse en otra dirección
+    espejo = {}
+    for indice in codigo.vivas():
+        linea = codigo.lineas[indice]
+        if indice in llegadas:
+            espejo.clear()
+        memoria = _MEMORIA.fullmatch(linea)
+        if memoria:
+            instruccion, registro, direccion = memoria.groups()
+            if instruccion == "LOAD":
+                # Primero el mismo registro, luego cualquier otro con el valor de [a]
+                fuentes = sorted((otro for otro, (guardada, _) in espejo.items()
+                                  if guardada == direccion), key=lambda otro: otro != registro)
+                for fuente in fuentes:
+                    regla = "carga-repetida" if espejo[fuente][1] == "LOAD" else "carga-tras-guardar"
+                    if regla in reglas and (fuente == registro or _usar_otro_registro(
+                            codigo, indice, registro, fuente, llegadas)):
+                        if fuente == registro:
+                            codigo.quitar(indice)
+                        cambios[regla] += 1
+                        break
+                else:
+                    espejo[registro] = (direccion, "LOAD")
+            else:
+                for otro, (guardada, _) in list(espejo.items()):
+                    if guardada == direccion and otro != registro:
+                        del espejo[otro]
+                if registro in espejo:
+                    espejo[registro] = (direccion, "STORE")
+            continue
+        operacion = _OPERACION.fullmatch(linea)
+        mnemonico = _INSTRUCCION.match(linea)
+        if operacion:
+            espejo.pop(operacion.group(4), None)
+        elif mnemonico is None or mnemonico.group() not in _SIN_EFECTO:
+            espejo.clear()
+
+
+def _salto_al_siguiente(codigo, reglas, cambios):
+    for indice in codigo.vivas():
+        destino = codigo.destinos[indice]
+        if (destino is not None and not codigo.lineas[indice].startswith("CALL")
+                and codigo.siguiente(destino) == codigo.siguiente(indice + 1)):
+            codigo.quitar(indice)
+            cambios["salto-al-siguiente"] += 1
+
+
+def _salto_a_salto(codigo, reglas, cambios):
+    for indice in codigo.vivas():
+        destino = codigo.destinos[indice]
+        if destino is None:
+            continue
+        vistos = {indice}
+        final = codigo.siguiente(destino)
+        while (final < len(codigo.lineas) and final not in vistos
+               and codigo.lineas[final].startswith("JUMP") and codigo.destinos[final] is not None):
+            vistos.add(final)
+            final = codigo.siguiente(codigo.destinos[final])
+        if final != codigo.siguiente(destino) and final not in vistos:
+            codigo.destinos[indice] = final
+            cambios["salto-a-salto"] += 1
+
+
+def _inalcanzable(codigo, reglas, cambios):
+    llegadas = codigo.llegadas()
+    alcanzable = True
+    for indice in codigo.vivas():
+        if indice in llegadas:
+            alcanzable = True
+        elif not alcanzable:
+            codigo.quitar(indice)
+            cambios["inalcanzable"] += 1
+            continue
+        if codigo.lineas[indice].startswith("JUMP"):
+            alcanzable = False
+
+
+_APLICAR = [
+    (("carga-repetida", "carga-tras-guardar"), _cargas),
+    (("salto-al-siguiente",), _salto_al_siguiente),
+    (("salto-a-salto",), _salto_a_salto),
+    (("inalcanzable",), _inalcanzable),
+]
+
+
+def optimizar_codigo(code_section, inicio, reglas, entradas=(), estadisticas=None):
+    """
+    Aplica las reglas de mirilla a una sección de código hasta que no cambie.
+
+    @param code_section: Lista de instrucciones ensamblador
+    @param inicio: Dirección de la primera instrucción (tamaño de la sección de datos)
+    @param reglas: Nombres de las reglas a aplicar (ver REGLAS y `reglas_de_nivel`)
+    @param entradas: Direcciones de salto a las que se llega desde fuera (p. ej. las
+                     funciones exportadas de un módulo)
+    @param estadisticas: Counter opcional donde se suman los cambios por regla
+    @return: Tupla (nueva sección de código, función que convierte una dirección de
+             salto del código original a la del nuevo)
+    @raises ValueError: Si alguna regla no existe
+    """
+    desconocidas = [regla for regla in reglas if regla not in REGLAS]
+    if desconocidas:
+        raise ValueError("Reglas de mirilla desconocidas: " + ", ".join(desconocidas))
+    if not reglas:
+        return list(code_section), lambda direccion: direccion
+    codigo = _Codigo(code_section, inicio, entradas)
+    reglas = set(reglas)
+    cambios = Counter()
+    while True:
+        antes = sum(cambios.values())
+        for nombres, aplicar in _APLICAR:
+            if reglas.intersection(nombres):
+                aplicar(codigo, reglas, cambios)
+        if sum(cambios.values()) == antes:
+            break
+    if estadisticas is not None:
+        estadisticas.update(cambios)
+    return codigo.resultado(), codigo.reubicar
+
+
+def dividir_asm(texto):
+    """
+    Separa un archivo .asm generado por src/TAC.py en sección de datos y de código
+    (el código empieza en la primera instrucción).
+
+    @return: Tupla (líneas de datos, líneas de código)
+    """
+    lineas = [linea.strip() for linea in texto.splitlines() if linea.strip()]
+    for numero, linea in enumerate(lineas):
+        if _INSTRUCCION.match(linea) or linea.startswith("#"):
+            return lineas[:numero], lineas[numero:]
+    return lineas, []
+
+
+if __name__ == "__main__":
+    import sys
+
+    from src.TAC import formatear_asm, tamano_datos
+
+    argumentos = sys.argv[1:]
+    nivel = NIVEL_POR_DEFECTO
+    reglas = None
+    while argumentos and argumentos[0].startswith("-"):
+        opcion = argumentos.pop(0)
+        if opcion in ("-O0", "-O1", "-O2"):
+            nivel = int(opcion[2:])
+        elif opcion == "--reglas" and argumentos:
+            reglas = [regla for regla in argumentos.pop(0).split(",") if regla]
+        else:
+            argumentos = []
+            break
+    if len(argumentos) not in (1, 2):
+        print("Uso: python -m src.mirilla [-O1|-O2] [--reglas r1,r2,...] <entrada.asm> [salida.asm]")
+        print("Reglas:")
+        for nombre, (patron, reescritura, minimo) in REGLAS.items():
+            print(f"  {nombre:<20} {patron}  ->  {reescritura}  (desde -O{minimo})")
+        sys.exit(1)
+    with open(argumentos[0], "r", encoding="utf-8") as entrada:
+        data_section, code_section = dividir_asm(entrada.read())
+    estadisticas = Counter()
+    try:
+        code_section, _ = optimizar_codigo(code_section, tamano_datos(data_section),
+                                           reglas_de_nivel(nivel) if reglas is None else reglas,
+                                           estadisticas=estadisticas)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    texto = formatear_asm(data_section, code_section)
+    if len(argumentos) == 2:
+        with open(argumentos[1], "w", encoding="utf-8") as salida:
+            salida.write(texto)
+    else:
+        sys.stdout.write(texto)
+    for regla, cambios in sorted(estadisticas.items()):
+        print(f"{regla}: {cambios}", file=sys.stderr)
@@ -0,0 +1,224 @@
+"""
+Formato de objeto reubicable y enlazador de módulos.
+
+El enlazador de texto (linkerLoader.l, src/enlazador.py) solo sabe sumar la dirección
+base a cada "(n)" y no puede expresar referencias entre módulos. Un objeto guarda un
+módulo ya ensamblado con la información necesaria para enlazarlo con otros:
+
+    - sección de datos y sección de código: palabras con el campo de dirección en 0
+      donde hay una reubicación (las líneas que no son palabras se guardan como texto;
+      la reserva de variables es una sola línea ".reservar N" que ocupa N celdas)
+    - exporta: símbolos definidos, nombre -> (sección, desplazamiento)
+    - importa: símbolos que debe definir otro módulo
+    - reubicaciones: (sección, índice, bit, tipo, sumando, símbolo); el campo de 21
+      bits que empieza en `bit` de la palabra `índice` de `sección` recibe la
+      dirección indicada por `tipo` más `sumando`
+
+Tipos de reubicación:
+    "datos"    inicio de la sección de datos del módulo
+    "codigo"   inicio de la sección de código del módulo
+    "simbolo"  dirección del símbolo, definido en cualquier módulo
+
+El enlazador coloca los módulos en orden (datos y luego código de cada uno, la misma
+distribución que un programa de un solo módulo), arma la tabla de símbolos en un
+diccionario y aplica todas las reubicaciones en una sola pasada.
+"""
+import json
+
+from src.ensamblador import MASCARA_21, ensamblar, tamano_reserva
+from src.optimizador import NIVEL_POR_DEFECTO
+from src.TAC import formatear_asm, leer_tac, traducir_modulo
+from src.tiempos import RegistroTiempos, tamano
+
+EXTENSION = ".obj"
+
+SECCION_DATOS = "datos"
+SECCION_CODIGO = "codigo"
+REUBICACION_SIMBOLO = "simbolo"
+
+
+def celdas(palabras):
+    """Celdas de memoria que ocupa una sección (una reserva ocupa varias)."""
+    return sum(tamano_reserva(palabra) or 1 if isinstance(palabra, str) else 1
+               for palabra in palabras)
+
+
+class ErrorEnlace(Exception):
+    """Símbolo importado que ningún módulo define o definido en más de un módulo."""
+
+
+class ObjetoModulo:
+    """
+    Módulo ensamblado y reubicable (ver el formato al inicio del archivo).
+    """
+    def __init__(self, nombre, datos, codigo, exporta, importa, reubicaciones):
+        self.nombre = nombre
+        self.datos = list(datos)
+        self.codigo = list(codigo)
+        self.exporta = {simbolo: tuple(ubicacion) for simbolo, ubicacion in exporta.items()}
+        self.importa = list(importa)
+        self.reubicaciones = [tuple(reubicacion) for reubicacion in reubicaciones]
+
+    def __len__(self):
+        return celdas(self.datos) + celdas(self.codigo)
+
+    def serializar(self):
+        return json.dumps({"nombre": self.nombre, "datos": self.datos, "codigo": self.codigo,
+                           "exporta": self.exporta, "importa": self.importa,
+                           "reubicaciones": self.reubicaciones})
+
+    @classmethod
+    def deserializar(cls, texto):
+        datos = json.loads(texto)
+        return cls(datos["nombre"], datos["datos"], datos["codigo"], datos["exporta"],
+                   datos["importa"], datos["reubicaciones"])
+
+    def guardar(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(self.serializar())
+
+    @classmethod
+    def cargar(cls, ruta):
+        with open(ruta, "r", encoding="utf-8") as archivo:
+            return cls.deserializar(archivo.read())
+
+
+def crear_objeto(nombre, programa, tamano_datos, exporta=None, importa=()):
+    """
+    Construye un objeto a partir de un programa ensamblado cuyas primeras
+    `tamano_datos` palabras son la sección de datos.
+
+    @param nombre: Nombre del módulo
+    @param programa: ProgramaEnsamblado (con `externos` si importa símbolos)
+    @param tamano_datos: Celdas de la sección de datos
+    @param exporta: Símbolos exportados como nombre -> dirección relativa al programa
+    @param importa: Símbolos importados
+    @return: ObjetoModulo
+    """
+    def ubicacion(direccion):
+        if direccion < tamano_datos:
+            return SECCION_DATOS, direccion
+        return SECCION_CODIGO, direccion - tamano_datos
+
+    # Líneas de la sección de datos (la reserva es una línea de varias celdas)
+    lineas_datos = ocupadas = 0
+    while ocupadas < tamano_datos:
+        ocupadas += programa.reservas.get(lineas_datos, 1)
+        lineas_datos += 1
+
+    def posicion(indice):
+        if indice < lineas_datos:
+            return SECCION_DATOS, indice
+        return SECCION_CODIGO, indice - lineas_datos
+
+    palabras = [linea if valor is None else valor
+                for linea, valor in zip(programa.lineas, programa.palabras)]
+    externas = dict(programa.externas)
+    reubicaciones = []
+    for indice, bit in programa.reubicaciones:
+        campo = MASCARA_21 << bit
+        relativa = (palabras[indice] & campo) >> bit
+        palabras[indice] &= ~campo
+        if indice in externas:
+            reubicaciones.append((*posicion(indice), bit, REUBICACION_SIMBOLO, relativa, externas[indice]))
+        else:
+            reubicaciones.append((*posicion(indice), bit, *ubicacion(relativa), None))
+
+    exporta = {simbolo: ubicacion(direccion) for simbolo, direccion in (exporta or {}).items()}
+    importa = list(dict.fromkeys([*importa, *externas.values()]))
+    return ObjetoModulo(nombre, palabras[:lineas_datos], palabras[lineas_datos:],
+                        exporta, importa, reubicaciones)
+
+
+def objeto_de_tac(nombre, tac, entrada=True, nivel=NIVEL_POR_DEFECTO, tiempos=None):
+    """
+    Traduce y ensambla el TAC de un módulo como objeto. Exporta las funciones que
+    define e importa las que llama sin definirlas.
+
+    @param nombre: Nombre del módulo
+    @param tac: Texto TAC, lista de líneas o ruta a un archivo TAC
+    @param entrada: Si es el módulo principal (su primera línea es CALL main)
+    @param nivel: Nivel de optimización del TAC (ver src/optimizador.py)
+    @param tiempos: RegistroTiempos opcional donde se miden la traducción y el ensamblado
+    @return: ObjetoModulo
+    """
+    tiempos = tiempos if tiempos is not None else RegistroTiempos()
+    tac_lines = leer_tac(tac)
+    with tiempos.medir("traduccion", tac_lines) as medicion:
+        data_section, code_section, exporta, importa = traducir_modulo(tac_lines, entrada, nivel)
+        asm = formatear_asm(data_section, code_section)
+        medicion.salida = tamano(asm)
+    with tiempos.medir("ensamblado", asm) as medicion:
+        programa = ensamblar(asm, externos=set(importa))
+        tamano_datos = len(ensamblar(formatear_asm(data_section, [])))
+        objeto = crear_objeto(nombre, programa, tamano_datos, exporta, importa)
+        medicion.salida = len(objeto)
+    return objeto
+
+
+def enlazar(objetos, base=0):
+    """
+    Enlaza los módulos a partir de la dirección `base`, en el orden dado.
+
+    @param objetos: Lista de ObjetoModulo (el módulo principal primero)
+    @param base: Dirección de carga
+    @return: Tupla (palabras de la imagen de memoria, con las reservas como líneas
+             ".reservar N", y tabla de símbolos nombre -> dirección)
+    @raises ErrorEnlace: Si falta un símbolo importado o uno se define dos veces
+    """
+    # Distribución de los módulos y tabla de símbolos
+    simbolos = {}
+    inicios = []
+    direccion = base
+    for objeto in objetos:
+        inicio = {SECCION_DATOS: direccion, SECCION_CODIGO: direccion + celdas(objeto.datos)}
+        inicios.append(inicio)
+        for simbolo, (seccion, desplazamiento) in objeto.exporta.items():
+            if simbolo in simbolos:
+                raise ErrorEnlace(f"Símbolo definido más de una vez: {simbolo} ({objeto.nombre})")
+            simbolos[simbolo] = inicio[seccion] + desplazamiento
+        direccion += len(objeto)
+
+    faltantes = [simbolo for objeto in objetos for simbolo in objeto.importa
+                 if simbolo not in simbolos]
+    if faltantes:
+        raise ErrorEnlace("Símbolos no definidos: " + ", ".join(dict.fromkeys(faltantes)))
+
+    # Una sola pasada sobre las reubicaciones de cada módulo
+    palabras = []
+    for objeto, inicio in zip(objetos, inicios):
+        secciones = {SECCION_DATOS: list(objeto.datos), SECCION_CODIGO: list(objeto.codigo)}
+        for seccion, indice, bit, tipo, sumando, simbolo in objeto.reubicaciones:
+            destino = simbolos[simbolo] if tipo == REUBICACION_SIMBOLO else inicio[tipo]
+            secciones[seccion][indice] |= ((destino + sumando) & MASCARA_21) << bit
+        palabras += secciones[SECCION_DATOS]
+        palabras += secciones[SECCION_CODIGO]
+    return palabras, simbolos
+
+
+def texto_enlazado(palabras):
+    """Imagen enlazada en el formato de `compilados/linkerloader` (una palabra o reserva por línea)."""
+    return "".join(f"{palabra:032b}\n" if isinstance(palabra, int) else f"{palabra}\n"
+                   for palabra in palabras)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    if len(sys.argv) >= 3 and sys.argv[1] == "objeto":
+        # python objeto.py objeto <entrada.tac> [--biblioteca] [-O0|-O1|-O2]
+        nombre = os.path.splitext(sys.argv[2])[0]
+        niveles = [int(opcion[2:]) for opcion in sys.argv[3:] if opcion in ("-O0", "-O1", "-O2")]
+        nivel = niveles[-1] if niveles else NIVEL_POR_DEFECTO
+        objeto_de_tac(nombre, sys.argv[2], "--biblioteca" not in sys.argv, nivel).guardar(nombre + EXTENSION)
+    elif len(sys.argv) >= 5 and sys.argv[1] == "enlazar":
+        # python objeto.py enlazar <salida.txt> <dirección base> <módulo.obj>...
+        modulos = [ObjetoModulo.cargar(ruta) for ruta in sys.argv[4:]]
+        palabras, _ = enlazar(modulos, int(sys.argv[3]))
+        with open(sys.argv[2], "w", encoding="utf-8", newline="") as salida:
+            salida.write(texto_enlazado(palabras))
+    else:
+        print("Uso: python objeto.py objeto <entrada.tac> [--biblioteca] [-O0|-O1|-O2]")
+        print("     python objeto.py enlazar <salida.txt> <dirección base> <módulo.obj>...")
+        sys.exit(1)
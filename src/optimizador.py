@@ -0,0 +1,871 @@
+"""
+Optimizaciones sobre el TAC antes de traducirlo a ensamblador.
+
+Cada unidad (función) se optimiza por separado sobre su IR (src/tac_ir.py) y el
+resultado vuelve a ser TAC, de modo que se puede inspeccionar y se traduce igual
+que el original. Las pasadas se eligen con el nivel de optimización (-O):
+
+    0  sin cambios
+    1  plegado de constantes, propagación de constantes y de copias dentro de cada
+       bloque básico, plegado de las comparaciones constantes con su `ifz` y salto
+       en lugar de las llamadas de una función a sí misma
+    2  además, expansión en línea de las llamadas a funciones pequeñas, limpieza de
+       los saltos (etiquetas unidas, saltos encadenados, condiciones invertidas),
+       eliminación de los bloques inalcanzables, de asignaciones muertas y de
+       temporales que nunca se leen, y movimiento de los cálculos invariantes
+       fuera de los bucles; al traducir, los valores se mantienen en registros dentro
+       de cada bloque (ver src/TAC.py)
+
+Las pasadas conservan el comportamiento del código que genera src/TAC.py, no solo
+el del TAC:
+    - Los valores son los de la máquina virtual: una constante vale lo que produce
+      al ensamblarse y un resultado solo se pliega si la constante que lo escribe
+      ensambla exactamente al mismo valor y tipo.
+    - Todas las variables son globales: una llamada puede leer o escribir cualquiera.
+    - Una llamada salta al cuerpo de la función sin pasarle los parámetros y su
+      `return` muestra el valor y detiene la máquina: expandir la llamada copia el
+      cuerpo tal cual (con temporales y etiquetas renombrados), sin asignar
+      parámetros ni devolver el valor.
+    - Una comparación se acopla al `ifz` siguiente; solo se tocan si en la unidad
+      cada comparación va seguida de su `ifz`.
+    - Los nombres que existen como variables no cambian, salvo temporales (`t<n>`,
+      locales a su unidad) que ya no se usan; si una pasada lo haría, no se aplica.
+    - Solo se optimizan programas cuya traducción ocupa exactamente lo que cuentan
+      las etiquetas (sin expresiones ni instrucciones que el traductor no reconoce,
+      ni etiquetas definidas dos veces): en los demás los saltos no caen en su
+      etiqueta y mover código los cambiaría.
+
+No hay reducción de fuerza (multiplicar o dividir por una potencia de 2 con SHL
+o SHR, o variables de inducción con sumas): en la máquina virtual cada
+instrucción ocupa un paso, así que cambiar un MUL por otra instrucción no ahorra
+nada; DIV es la división real, que SHR no reproduce, y SHL solo vale para
+enteros, algo que el TAC sin tipos no permite demostrar.
+"""
+import operator
+import re
+from collections import Counter
+from functools import lru_cache
+
+from assets.codec_palabra import codificar_dato, decodificar_dato
+from src.ensamblador import ensamblar_linea
+from src.tac_ir import (ASIGNACION, ASIGNACIONES, COMPARACION, DESCONOCIDA, ETIQUETA, EXPRESION,
+                        FIN_FUNCION, GOTO, IFZ, INICIO_FUNCION, LLAMADA, OPERACION,
+                        PARAM, RETORNO, analizar, crear, es_literal, formatear)
+
+NIVELES = (0, 1, 2)
+# Nivel de la interfaz, las herramientas de línea de comandos y las funciones de
+# traducción; pruebas/test_niveles.py comprueba que -O1 da el mismo resultado que -O0
+NIVEL_POR_DEFECTO = 1
+
+# Temporales del compilador, también con el sufijo de una biblioteca (t3__math)
+_TEMPORAL = re.compile(r"t[0-9]+(?:__\w+)?")
+_INDICE = re.compile(r"\[(\w+)\]")
+
+# Instrucciones TAC que puede tener el cuerpo de una función para expandirse en línea;
+# con un perfil, las funciones con al menos LLAMADAS_FRECUENTES llamadas admiten el doble
+LIMITE_EXPANSION = 20
+LLAMADAS_FRECUENTES = 8
+
+_OPERACIONES = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv}
+_COMPARACIONES = {"==": operator.eq, "!=": operator.ne, "<": operator.lt,
+                  "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+_CONTRARIAS = {"==": "!=", "!=": "==", "<": ">=", ">=": "<", ">": "<=", "<=": ">"}
+
+
+@lru_cache(maxsize=4096)
+def valor_literal(texto):
+    """Valor que tiene una constante TAC en la máquina virtual (None si no ensambla)."""
+    _, palabra, _ = ensamblar_linea(texto)[0]
+    return None if palabra is None else decodificar_dato(palabra)
+
+
+def _mismo_valor(a, b):
+    return type(a) is type(b) and a == b
+
+
+def literal_de(valor):
+    """
+    Constante TAC que ensambla exactamente a `valor`.
+
+    @param valor: Entero o flotante
+    @return: Texto de la constante, o None si ninguna lo representa
+    """
+    if isinstance(valor, bool) or not isinstance(valor, (int, float)) or valor < 0:
+        return None
+    texto = str(valor)
+    if not es_literal(texto) or not _mismo_valor(valor_literal(texto), valor):
+        return None
+    return texto
+
+
+@lru_cache(maxsize=4096)
+def _propagable(texto):
+    # La constante se puede usar en lugar de la variable donde se guardó
+    valor = valor_literal(texto)
+    return valor is not None and _mismo_valor(decodificar_dato(codificar_dato(valor)), valor)
+
+
+def es_temporal(nombre):
+    return _TEMPORAL.fullmatch(nombre) is not None
+
+
+def _registrados(instr):
+    """Ids que la instrucción hace existir como variables (ver _variables_de en TAC.py)."""
+    tipo = instr.tipo
+    if tipo == PARAM or tipo == RETORNO:
+        return instr.operandos
+    if tipo in (ASIGNACION, OPERACION, LLAMADA, EXPRESION):
+        return (instr.destino,)
+    if tipo == COMPARACION:
+        return (instr.destino, *instr.operandos)
+    return ()
+
+
+def _leidos(instr):
+    """Ids que lee la instrucción (los parámetros y la condición de `ifz` cuentan)."""
+    if instr.tipo in (ASIGNACION, OPERACION, COMPARACION, RETORNO, PARAM, IFZ):
+        return instr.operandos
+    return ()
+
+
+def indices_de(tabla):
+    """Ids usados como subíndice en los nombres de la unidad (nums[t2]); cuentan como lecturas."""
+    return {tabla.ids[indice] for nombre in tabla.nombres if "[" in nombre
+            for indice in _INDICE.findall(nombre) if indice in tabla.ids}
+
+
+def _puede_fallar(instr, tabla):
+    # Una división entre algo que no es una constante distinta de 0 se conserva
+    if instr.tipo != OPERACION or instr.operador != "/":
+        return False
+    divisor = instr.operandos[1]
+    return not tabla.literales[divisor] or valor_literal(tabla.nombres[divisor]) in (0, None)
+
+
+@lru_cache(maxsize=1024)
+def _resumen(lineas):
+    """
+    Si la unidad se traduce exactamente, nombres que registra como variables, fuentes
+    de sus copias y etiquetas que define.
+    """
+    instrucciones, tabla = analizar(lineas)
+    nombres = tabla.nombres
+    literales = tabla.literales
+    exacta = all(instr.tipo not in (EXPRESION, DESCONOCIDA) for instr in instrucciones)
+    variables = frozenset(nombres[simbolo] for instr in instrucciones
+                          for simbolo in _registrados(instr) if not literales[simbolo])
+    fuentes = frozenset(nombres[instr.operandos[0]] for instr in instrucciones
+                        if instr.tipo == ASIGNACION and not literales[instr.operandos[0]])
+    etiquetas = tuple(instr.etiqueta for instr in instrucciones if instr.tipo == ETIQUETA)
+    return exacta, variables, fuentes, etiquetas
+
+
+def traduccion_exacta(unidades):
+    """
+    Si cada instrucción del programa ocupa en ensamblador lo que cuentan las etiquetas:
+    no hay expresiones ni instrucciones no reconocidas, toda copia es de una variable
+    y cada etiqueta se define una sola vez (si no, todos los saltos van a la última).
+
+    @param unidades: Unidades TAC del programa (tuplas de líneas)
+    @return: bool
+    """
+    variables = set()
+    fuentes = set()
+    etiquetas = []
+    for unidad in unidades:
+        exacta, registradas, copiadas, definidas = _resumen(unidad)
+        if not exacta:
+            return False
+        variables |= registradas
+        fuentes |= copiadas
+        etiquetas += definidas
+    return fuentes <= variables and len(set(etiquetas)) == len(etiquetas)
+
+
+def comparaciones_emparejadas(instrucciones):
+    """Si cada comparación va seguida del `ifz` sobre su resultado y cada `ifz` la sigue."""
+    anterior = None
+    for numero, instr in enumerate(instrucciones):
+        if instr.tipo == COMPARACION:
+            siguiente = instrucciones[numero + 1] if numero + 1 < len(instrucciones) else None
+            if (siguiente is None or siguiente.tipo != IFZ
+                    or siguiente.operandos[0] != instr.destino):
+                return False
+        elif instr.tipo == IFZ:
+            if anterior is None or anterior.tipo != COMPARACION:
+                return False
+        anterior = instr
+    return True
+
+
+def propagar_y_plegar(instrucciones, tabla, emparejadas, estadisticas):
+    """
+    Propagación de constantes y copias y plegado de constantes dentro de cada bloque
+    básico (los hechos se olvidan en cada etiqueta y en cada llamada).
+
+    @param instrucciones: IR de la unidad
+    @param tabla: TablaSimbolos de la unidad
+    @param emparejadas: Si las comparaciones se pueden plegar con su `ifz`
+    @param estadisticas: Counter donde se suman los cambios
+    @return: Nueva lista de instrucciones
+    """
+    literales = tabla.literales
+    nombres = tabla.nombres
+    valores = {}  # id -> id (constante o variable) con el mismo valor
+    resultado = []
+
+    def olvidar(simbolo):
+        valores.pop(simbolo, None)
+        for copia in [copia for copia, fuente in valores.items() if fuente == simbolo]:
+            del valores[copia]
+
+    def sustituir(simbolo, constante=True):
+        nuevo = valores.get(simbolo, simbolo)
+        if nuevo == simbolo or (literales[nuevo] and not constante):
+            return simbolo
+        estadisticas["propagadas"] += 1
+        return nuevo
+
+    numero = 0
+    while numero < len(instrucciones):
+        instr = instrucciones[numero]
+        numero += 1
+        tipo = instr.tipo
+        if tipo in (ETIQUETA, INICIO_FUNCION, LLAMADA):
+            valores.clear()
+        elif tipo == OPERACION or tipo == COMPARACION:
+            operandos = tuple(sustituir(simbolo) for simbolo in instr.operandos)
+            constantes = all(literales[simbolo] for simbolo in operandos)
+            if tipo == COMPARACION and constantes and emparejadas:
+                # La comparación y su ifz se reemplazan por un goto o desaparecen
+                izquierdo, derecho = (valor_literal(nombres[simbolo]) for simbolo in operandos)
+                salto = instrucciones[numero]
+                numero += 1
+                estadisticas["comparaciones"] += 1
+                if _COMPARACIONES[instr.operador](izquierdo, derecho):
+                    resultado.append(crear(tabla, GOTO, etiqueta=salto.etiqueta))
+                continue
+            plegado = _plegar(instr.operador, operandos, tabla) if tipo == OPERACION and constantes else None
+            if plegado is not None:
+                instr = crear(tabla, ASIGNACION, instr.destino, (plegado,))
+                estadisticas["plegadas"] += 1
+            elif operandos != instr.operandos:
+                instr = crear(tabla, tipo, instr.destino, operandos, instr.operador)
+            olvidar(instr.destino)
+            if plegado is not None and _propagable(nombres[plegado]):
+                valores[instr.destino] = plegado
+        elif tipo == ASIGNACION:
+            fuente = sustituir(instr.operandos[0])
+            if fuente != instr.operandos[0]:
+                instr = crear(tabla, ASIGNACION, instr.destino, (fuente,))
+            olvidar(instr.destino)
+            if fuente != instr.destino and (not literales[fuente] or _propagable(nombres[fuente])):
+                valores[instr.destino] = fuente
+        elif tipo == RETORNO:
+            # Un return solo lee variables: se propagan copias, no constantes
+            operando = sustituir(instr.operandos[0], constante=False)
+            if operando != instr.operandos[0]:
+                instr = crear(tabla, RETORNO, operandos=(operando,))
+        elif tipo == EXPRESION:
+            olvidar(instr.destino)
+        resultado.append(instr)
+    return resultado
+
+
+def saltar_en_recursion(instrucciones, tabla, estadisticas):
+    """
+    Cada llamada de la función a sí misma se precede de un `goto` a su inicio. La
+    llamada nunca vuelve (el `return` detiene la máquina), así que lo que la sigue
+    no se ejecuta y saltar equivale a llamar, pero sin guardar la dirección de
+    retorno en la pila: la profundidad de la recursión ya no está limitada por ella.
+    La llamada queda inalcanzable y se conserva para que sus variables sigan existiendo.
+
+    @return: Nueva lista de instrucciones
+    """
+    funcion = instrucciones[0].etiqueta
+    resultado = []
+    for instr in instrucciones:
+        if instr.tipo == LLAMADA and instr.funcion == funcion:
+            resultado.append(crear(tabla, GOTO, etiqueta=funcion))
+            estadisticas["llamadas recursivas"] += 1
+        resultado.append(instr)
+    return resultado
+
+
+def _plegar(operador, operandos, tabla):
+    izquierdo, derecho = (valor_literal(tabla.nombres[simbolo]) for simbolo in operandos)
+    if izquierdo is None or derecho is None:
+        return None
+    try:
+        texto = literal_de(_OPERACIONES[operador](izquierdo, derecho))
+    except (ZeroDivisionError, OverflowError):
+        return None  # El error se conserva para la ejecución
+    return None if texto is None else tabla.id(texto)
+
+
+def bloques_basicos(instrucciones):
+    """Rangos [inicio, fin) de los bloques básicos de la unidad."""
+    inicio = 0
+    for numero, instr in enumerate(instrucciones):
+        if instr.tipo in (ETIQUETA, INICIO_FUNCION) and numero > inicio:
+            yield inicio, numero
+            inicio = numero
+        elif instr.tipo in (GOTO, IFZ, RETORNO, LLAMADA, FIN_FUNCION):
+            yield inicio, numero + 1
+            inicio = numero + 1
+    if inicio < len(instrucciones):
+        yield inicio, len(instrucciones)
+
+
+def eliminar_asignaciones_muertas(instrucciones, tabla, estadisticas):
+    """
+    Elimina asignaciones cuyo valor se sobrescribe más adelante en el mismo bloque
+    sin leerse antes.
+
+    @return: Nueva lista de instrucciones
+    """
+    eliminar = set()
+    for inicio, fin in bloques_basicos(instrucciones):
+        sobrescritos = set()
+        for numero in range(fin - 1, inicio - 1, -1):
+            instr = instrucciones[numero]
+            if instr.tipo in (LLAMADA, GOTO, IFZ, RETORNO, FIN_FUNCION):
+                sobrescritos.clear()  # El resto del programa puede leer cualquier variable
+            elif instr.tipo == OPERACION or instr.tipo == ASIGNACION:
+                if instr.destino in sobrescritos and not _puede_fallar(instr, tabla):
+                    eliminar.add(numero)
+                    continue
+                sobrescritos.add(instr.destino)
+            sobrescritos.difference_update(_leidos(instr))
+    estadisticas["asignaciones muertas"] += len(eliminar)
+    return [instr for numero, instr in enumerate(instrucciones) if numero not in eliminar]
+
+
+def eliminar_temporales_muertos(instrucciones, tabla, estadisticas):
+    """
+    Elimina las definiciones de temporales que no se leen en la unidad, hasta que
+    no quede ninguna.
+
+    @return: Nueva lista de instrucciones
+    """
+    nombres = tabla.nombres
+    indices = indices_de(tabla)
+    while True:
+        leidos = indices.union(simbolo for instr in instrucciones for simbolo in _leidos(instr))
+        restantes = [instr for instr in instrucciones
+                     if instr.tipo not in (ASIGNACION, OPERACION) or instr.destino in leidos
+                     or not es_temporal(nombres[instr.destino]) or _puede_fallar(instr, tabla)]
+        if len(restantes) == len(instrucciones):
+            return instrucciones
+        estadisticas["temporales muertos"] += len(instrucciones) - len(restantes)
+        instrucciones = restantes
+
+
+def eliminar_inalcanzable(instrucciones, tabla, emparejadas, externas, estadisticas):
+    """
+    Elimina los bloques a los que no se llega desde el inicio de la unidad ni desde
+    una etiqueta a la que saltan otras unidades (si las comparaciones no están
+    emparejadas, las comparaciones y los `ifz` se conservan). Lo que sigue a
+    `end_func` se alcanza cayendo desde la función.
+
+    @return: Nueva lista de instrucciones
+    """
+    bloques, bloque_de_etiqueta, sucesores = _grafo(instrucciones)
+    alcanzados = set()
+    pendientes = [0] + [bloque_de_etiqueta[etiqueta] for etiqueta in externas
+                        if etiqueta in bloque_de_etiqueta]
+    while pendientes:
+        bloque = pendientes.pop()
+        if bloque in alcanzados:
+            continue
+        alcanzados.add(bloque)
+        pendientes += sucesores[bloque]
+        inicio, fin = bloques[bloque]
+        if instrucciones[fin - 1].tipo == FIN_FUNCION and bloque + 1 < len(bloques):
+            pendientes.append(bloque + 1)
+
+    conservadas = [numero in alcanzados or instr.tipo in (INICIO_FUNCION, FIN_FUNCION)
+                   or not emparejadas and instr.tipo in (COMPARACION, IFZ)
+                   for numero, (inicio, fin) in enumerate(bloques)
+                   for instr in instrucciones[inicio:fin]]
+    # Las etiquetas de un bloque inalcanzable siguen si un `ifz` conservado salta a ellas
+    usadas = {instr.etiqueta for instr, conservar in zip(instrucciones, conservadas)
+              if conservar and instr.tipo in (GOTO, IFZ)}
+    resultado = []
+    for instr, conservar in zip(instrucciones, conservadas):
+        if conservar or instr.tipo == ETIQUETA and instr.etiqueta in usadas:
+            resultado.append(instr)
+        else:
+            estadisticas["inalcanzables"] += 1
+    return resultado
+
+
+def limpiar_saltos(instrucciones, tabla, emparejadas, externas, estadisticas):
+    """
+    Limpieza de los saltos de la unidad, repetida hasta que no hay cambios (quitar
+    bloques junta etiquetas y saltos, y los saltos limpios dejan bloques sin entrada):
+        - los bloques inalcanzables desaparecen (ver `eliminar_inalcanzable`), salvo
+          que con ellos se pierda una variable
+        - las etiquetas seguidas se unen en una y las que ningún salto usa desaparecen
+          (las etiquetas a las que saltan otras unidades se conservan)
+        - un salto a un bloque que solo tiene un `goto` va directo al destino final
+        - un `goto` a la etiqueta que lo sigue desaparece
+        - `ifz t goto L1`, `goto L2`, `L1:` queda `ifz t goto L2`, `L1:` con la
+          comparación contraria en `t` (solo si las comparaciones están emparejadas:
+          el traductor emite para ella exactamente el salto contrario)
+
+    @return: Nueva lista de instrucciones
+    """
+    cambio = True
+    while cambio:
+        cambio = False
+        inalcanzables = Counter()
+        alcanzables = eliminar_inalcanzable(instrucciones, tabla, emparejadas, externas,
+                                            inalcanzables)
+        if inalcanzables and _variables_conservadas(instrucciones, alcanzables, tabla):
+            instrucciones = alcanzables
+            estadisticas.update(inalcanzables)
+            cambio = True
+
+        # Etiquetas: cada grupo seguido se reemplaza por la primera conservada
+        usadas = {instr.etiqueta for instr in instrucciones if instr.tipo in (GOTO, IFZ)}
+        destino_de = {}
+        unidas = []
+        grupo = []
+        for instr in instrucciones + [None]:
+            if instr is not None and instr.tipo == ETIQUETA:
+                grupo.append(instr)
+                continue
+            if grupo:
+                conservadas = [etiqueta for etiqueta in grupo if etiqueta.etiqueta in externas]
+                if not conservadas and usadas & {etiqueta.etiqueta for etiqueta in grupo}:
+                    conservadas = [grupo[0]]
+                nombres = {etiqueta.etiqueta for etiqueta in conservadas}
+                for etiqueta in grupo:
+                    if etiqueta.etiqueta not in nombres:
+                        if conservadas:
+                            destino_de[etiqueta.etiqueta] = conservadas[0].etiqueta
+                            estadisticas["etiquetas unidas"] += 1
+                        else:
+                            estadisticas["etiquetas sin uso"] += 1
+                        cambio = True
+                unidas += conservadas
+                grupo = []
+            if instr is not None:
+                unidas.append(instr)
+
+        # Saltos encadenados: etiqueta cuyo bloque solo tiene un goto -> su destino
+        salto_de = {}
+        siguiente = None
+        for instr in reversed(unidas):
+            if instr.tipo != ETIQUETA:
+                siguiente = instr
+            elif siguiente is not None and siguiente.tipo == GOTO:
+                salto_de[instr.etiqueta] = destino_de.get(siguiente.etiqueta, siguiente.etiqueta)
+
+        def destino_final(etiqueta):
+            vistas = {etiqueta}
+            while etiqueta in salto_de and salto_de[etiqueta] not in vistas:
+                etiqueta = salto_de[etiqueta]
+                vistas.add(etiqueta)
+            return etiqueta
+
+        resultado = []
+        for numero, instr in enumerate(unidas):
+            if instr.tipo in (GOTO, IFZ):
+                unida = destino_de.get(instr.etiqueta, instr.etiqueta)
+                final = destino_final(unida)
+                if final != unida:
+                    estadisticas["saltos encadenados"] += 1
+                    cambio = True
+                if final != instr.etiqueta:
+                    instr = crear(tabla, instr.tipo, operandos=instr.operandos, etiqueta=final)
+
+            if instr.tipo == GOTO:
+                etiquetas_siguientes = set()
+                for posterior in unidas[numero + 1:]:
+                    if posterior.tipo != ETIQUETA:
+                        break
+                    etiquetas_siguientes.add(destino_de.get(posterior.etiqueta, posterior.etiqueta))
+                if instr.etiqueta in etiquetas_siguientes:
+                    estadisticas["saltos al siguiente"] += 1
+                    cambio = True
+                    continue
+                if (emparejadas and len(resultado) >= 2 and resultado[-1].tipo == IFZ
+                        and resultado[-1].etiqueta in etiquetas_siguientes):
+                    comparacion, condicional = resultado[-2], resultado[-1]
+                    resultado[-2:] = [
+                        crear(tabla, COMPARACION, comparacion.destino, comparacion.operandos,
+                              _CONTRARIAS[comparacion.operador]),
+                        crear(tabla, IFZ, operandos=condicional.operandos, etiqueta=instr.etiqueta)]
+                    estadisticas["condiciones invertidas"] += 1
+                    cambio = True
+                    continue
+            resultado.append(instr)
+        instrucciones = resultado
+    return instrucciones
+
+
+def _sucesores(instrucciones, bloques, bloque_de_etiqueta):
+    """Bloques a los que puede pasar cada bloque (los saltos fuera de la unidad no cuentan)."""
+    sucesores = []
+    for numero, (_, fin) in enumerate(bloques):
+        ultima = instrucciones[fin - 1]
+        destinos = []
+        if ultima.tipo in (GOTO, IFZ) and ultima.etiqueta in bloque_de_etiqueta:
+            destinos.append(bloque_de_etiqueta[ultima.etiqueta])
+        if ultima.tipo not in (GOTO, RETORNO, FIN_FUNCION) and numero + 1 < len(bloques):
+            destinos.append(numero + 1)
+        sucesores.append(destinos)
+    return sucesores
+
+
+def _grafo(instrucciones):
+    """Bloques básicos de la unidad, bloque de cada etiqueta y sucesores de cada bloque."""
+    bloques = list(bloques_basicos(instrucciones))
+    bloque_de_etiqueta = {instrucciones[inicio].etiqueta: numero
+                          for numero, (inicio, _) in enumerate(bloques)
+                          if instrucciones[inicio].tipo == ETIQUETA}
+    return bloques, bloque_de_etiqueta, _sucesores(instrucciones, bloques, bloque_de_etiqueta)
+
+
+def bucles(instrucciones, externas=frozenset()):
+    """
+    Bucles naturales de la unidad: una arista de retorno va de un bloque a otro que
+    lo domina (su cabecera) y el bucle son los bloques que llegan a ella sin pasar
+    por la cabecera. Los bucles con la misma cabecera se unen.
+
+    @param instrucciones: IR de la unidad
+    @param externas: Etiquetas a las que saltan otras unidades (también son entradas)
+    @return: Tupla (bloques como rangos [inicio, fin), sucesores de cada bloque,
+             lista de (cabecera, conjunto de bloques del bucle))
+    """
+    bloques, bloque_de_etiqueta, sucesores = _grafo(instrucciones)
+    predecesores = [[] for _ in bloques]
+    for origen, destinos in enumerate(sucesores):
+        for destino in destinos:
+            predecesores[destino].append(origen)
+    entradas = {0} | {bloque_de_etiqueta[etiqueta] for etiqueta in externas
+                      if etiqueta in bloque_de_etiqueta}
+
+    # Dominadores por iteración hasta el punto fijo
+    todos = set(range(len(bloques)))
+    dominadores = [{numero} if numero in entradas else set(todos) for numero in todos]
+    cambio = True
+    while cambio:
+        cambio = False
+        for numero in todos - entradas:
+            comunes = set.intersection(*(dominadores[p] for p in predecesores[numero])) \
+                if predecesores[numero] else set()
+            nuevos = comunes | {numero}
+            if nuevos != dominadores[numero]:
+                dominadores[numero] = nuevos
+                cambio = True
+
+    por_cabecera = {}
+    for origen, destinos in enumerate(sucesores):
+        for cabecera in destinos:
+            if cabecera in dominadores[origen]:
+                cuerpo = por_cabecera.setdefault(cabecera, {cabecera})
+                pendientes = [origen]
+                while pendientes:
+                    bloque = pendientes.pop()
+                    if bloque not in cuerpo:
+                        cuerpo.add(bloque)
+                        pendientes += predecesores[bloque]
+    return bloques, sucesores, sorted(por_cabecera.items(), key=lambda bucle: len(bucle[1]))
+
+
+def _invariantes(instrucciones, tabla, bloques, cuerpo):
+    """
+    Posiciones de las instrucciones del bucle que se pueden calcular una sola vez
+    antes de él, en orden: asignaciones y operaciones que no pueden fallar, sobre
+    constantes o variables que el bucle no escribe (o que escribe otra invariante),
+    y cuyo destino es un temporal que solo se define ahí y solo se lee después, en
+    el mismo bloque.
+    """
+    nombres = tabla.nombres
+    literales = tabla.literales
+    posiciones = sorted(numero for bloque in cuerpo for numero in range(*bloques[bloque]))
+    dentro = set(posiciones)
+    definiciones = Counter(instrucciones[numero].destino for numero in posiciones
+                           if instrucciones[numero].tipo in ASIGNACIONES)
+    lecturas_fuera = indices_de(tabla).union(
+        simbolo for numero, instr in enumerate(instrucciones) if numero not in dentro
+        for simbolo in _leidos(instr))
+    bloque_de = {numero: bloque for bloque in cuerpo for numero in range(*bloques[bloque])}
+
+    invariantes = []
+    calculados = set()
+    for numero in posiciones:
+        instr = instrucciones[numero]
+        if instr.tipo not in (ASIGNACION, OPERACION) or _puede_fallar(instr, tabla):
+            continue
+        destino = instr.destino
+        if (not es_temporal(nombres[destino]) or definiciones[destino] != 1
+                or destino in lecturas_fuera):
+            continue
+        if not all(literales[simbolo] or simbolo not in definiciones or simbolo in calculados
+                   for simbolo in instr.operandos):
+            continue
+        _, fin = bloques[bloque_de[numero]]
+        if any(destino in _leidos(instrucciones[otra]) for otra in posiciones
+               if not numero < otra < fin):
+            continue
+        invariantes.append(numero)
+        calculados.add(destino)
+    return invariantes
+
+
+def mover_invariantes(instrucciones, tabla, externas, estadisticas):
+    """
+    Movimiento de código invariante: las instrucciones de un bucle cuyo resultado
+    no cambia entre iteraciones (ver `_invariantes`) se mueven justo antes de la
+    etiqueta de la cabecera. Solo en bucles sin llamadas cuya cabecera se alcanza
+    desde fuera únicamente al caer del bloque anterior.
+
+    @param externas: Etiquetas a las que saltan otras unidades
+    @return: Nueva lista de instrucciones
+    """
+    while True:
+        bloques, sucesores, encontrados = bucles(instrucciones, externas)
+        for cabecera, cuerpo in encontrados:
+            inicio = bloques[cabecera][0]
+            anterior = cabecera - 1
+            etiqueta = instrucciones[inicio].etiqueta
+            salto = instrucciones[bloques[anterior][1] - 1] if anterior >= 0 else None
+            if (anterior < 0 or anterior in cuerpo or cabecera not in sucesores[anterior]
+                    or etiqueta in externas
+                    or (salto.tipo in (GOTO, IFZ) and salto.etiqueta == etiqueta)
+                    or any(cabecera in sucesores[bloque] for bloque in range(len(bloques))
+                           if bloque not in cuerpo and bloque != anterior)
+                    or any(instrucciones[numero].tipo in (LLAMADA, EXPRESION, DESCONOCIDA)
+                           for bloque in cuerpo for numero in range(*bloques[bloque]))):
+                continue
+            invariantes = _invariantes(instrucciones, tabla, bloques, cuerpo)
+            if invariantes:
+                break
+        else:
+            return instrucciones
+        # Se mueven antes de la cabecera en su orden original (cada vez a un bucle más
+        # externo o fuera de todos, así que el proceso termina)
+        estadisticas["invariantes"] += len(invariantes)
+        elegidas = set(invariantes)
+        instrucciones = (instrucciones[:inicio] + [instrucciones[numero] for numero in invariantes]
+                         + [instr for numero, instr in enumerate(instrucciones[inicio:], inicio)
+                            if numero not in elegidas])
+
+
+def _cuerpo_expandible(unidad, perfil):
+    """
+    Cuerpo de una función que se puede copiar en lugar de sus llamadas: pequeño,
+    sin llamarse a sí misma, con cada comparación seguida de su `ifz` y terminado en
+    `return` o `goto` (si la ejecución llegara a `end_func` seguiría en la función
+    siguiente, no después de la llamada).
+
+    @param unidad: Tupla de líneas TAC de la función
+    @param perfil: Diccionario opcional función -> llamadas ejecutadas
+    @return: Tupla (nombre de la función, líneas del cuerpo), o None
+    """
+    instrucciones, _ = analizar(unidad)
+    if (len(instrucciones) < 3 or instrucciones[0].tipo != INICIO_FUNCION
+            or instrucciones[-1].tipo != FIN_FUNCION):
+        return None
+    funcion = instrucciones[0].etiqueta
+    cuerpo = instrucciones[1:-1]
+    limite = LIMITE_EXPANSION
+    if perfil is not None:
+        llamadas = perfil.get(funcion, 0)
+        if not llamadas:
+            return None
+        if llamadas >= LLAMADAS_FRECUENTES:
+            limite *= 2
+    tamano = sum(1 for instr in cuerpo if instr.tipo not in (PARAM, ETIQUETA))
+    if (tamano > limite or cuerpo[-1].tipo not in (RETORNO, GOTO)
+            or any(instr.tipo == LLAMADA and instr.funcion == funcion for instr in cuerpo)
+            or not comparaciones_emparejadas(cuerpo)):
+        return None
+    return funcion, unidad[1:-1]
+
+
+def _renombrar_cuerpo(cuerpo, sufijo):
+    """
+    Copia del cuerpo con `sufijo` agregado a sus temporales y etiquetas. Un nombre
+    con subíndice (nums[t2]) es una variable en sí mismo: ni él ni los temporales
+    que se usan como subíndice cambian.
+    """
+    etiquetas = {linea.split(":")[0] for linea in cuerpo if linea.startswith("L") and ":" in linea}
+    indices = {indice for linea in cuerpo for indice in _INDICE.findall(linea)}
+
+    def renombrar(palabra):
+        nombre = palabra.rstrip(":,")
+        if nombre in etiquetas or (es_temporal(nombre) and nombre not in indices):
+            return nombre + sufijo + palabra[len(nombre):]
+        return palabra
+
+    return [" ".join(map(renombrar, linea.split())) for linea in cuerpo]
+
+
+def expandir_llamadas(unidades, estadisticas=None, perfil=None):
+    """
+    Expansión en línea: cada llamada a una función pequeña del programa se precede
+    de una copia de su cuerpo, con los temporales y las etiquetas renombrados con el
+    sufijo `__i<n>` de la llamada. El cuerpo termina en `return` o `goto`, así que la
+    llamada original queda inalcanzable y se conserva solo para que sus variables
+    sigan existiendo (la pasada de código inalcanzable la elimina).
+
+    @param unidades: Unidades TAC del programa (tuplas de líneas)
+    @param estadisticas: Counter opcional donde se suman las llamadas expandidas
+    @param perfil: Diccionario opcional función -> llamadas ejecutadas; las funciones
+                   sin llamadas no se expanden y las frecuentes admiten un cuerpo mayor
+    @return: Lista de unidades
+    """
+    cuerpos = dict(filter(None, (_cuerpo_expandible(unidad, perfil) for unidad in unidades)))
+    if not cuerpos:
+        return unidades
+    expandidas = []
+    sitio = 0
+    for unidad in unidades:
+        instrucciones, _ = analizar(unidad)
+        if not instrucciones or instrucciones[0].tipo != INICIO_FUNCION:
+            expandidas.append(unidad)
+            continue
+        propia = instrucciones[0].etiqueta
+        lineas = []
+        for linea, instr in zip(unidad, instrucciones):
+            if instr.tipo == LLAMADA and instr.funcion in cuerpos and instr.funcion != propia:
+                sitio += 1
+                lineas += _renombrar_cuerpo(cuerpos[instr.funcion], f"__i{sitio}")
+            lineas.append(linea)
+        expandidas.append(tuple(lineas))
+    if estadisticas is not None and sitio:
+        estadisticas["llamadas expandidas"] += sitio
+    return expandidas
+
+
+def _variables_conservadas(antes, despues, tabla):
+    """Si las variables que ya no se registran son temporales que tampoco se usan."""
+    literales = tabla.literales
+    nombres = tabla.nombres
+
+    def registradas(instrucciones):
+        return {simbolo for instr in instrucciones for simbolo in _registrados(instr)
+                if not literales[simbolo]}
+
+    perdidas = registradas(antes) - registradas(despues)
+    if not perdidas:
+        return True
+    usadas = {simbolo for instr in despues for simbolo in _leidos(instr)}
+    return all(es_temporal(nombres[simbolo]) and simbolo not in usadas for simbolo in perdidas)
+
+
+@lru_cache(maxsize=1024)
+def optimizar_unidad(lineas, nivel=NIVEL_POR_DEFECTO, externas=frozenset()):
+    """
+    Optimiza una unidad (función) de un programa cuya traducción es exacta (ver
+    `traduccion_exacta`). El resultado se guarda en memoria como la traducción de
+    cada unidad (ver traducir_unidad en src/TAC.py).
+
+    @param lineas: Tupla de líneas TAC de la unidad
+    @param nivel: Nivel de optimización (ver NIVELES)
+    @param externas: Etiquetas a las que saltan otras unidades del programa
+    @return: Tupla (tupla de líneas TAC optimizadas, estadísticas como tupla de
+             (pasada, cambios))
+    """
+    # Las líneas previas a la primera función (y la primera línea del programa) no se tocan
+    if nivel <= 0 or not lineas[0].startswith("begin_func"):
+        return lineas, ()
+    instrucciones, tabla = analizar(lineas)
+    emparejadas = comparaciones_emparejadas(instrucciones)
+    pasadas = [lambda instrs, cambios: propagar_y_plegar(instrs, tabla, emparejadas, cambios),
+               lambda instrs, cambios: saltar_en_recursion(instrs, tabla, cambios)]
+    if nivel >= 2:
+        pasadas += [lambda instrs, cambios: limpiar_saltos(instrs, tabla, emparejadas, externas,
+                                                           cambios),
+                    lambda instrs, cambios: eliminar_asignaciones_muertas(instrs, tabla, cambios),
+                    lambda instrs, cambios: eliminar_temporales_muertos(instrs, tabla, cambios),
+                    lambda instrs, cambios: mover_invariantes(instrs, tabla, externas, cambios)]
+
+    estadisticas = Counter()
+    for pasada in pasadas:
+        cambios = Counter()
+        resultado = pasada(instrucciones, cambios)
+        if _variables_conservadas(instrucciones, resultado, tabla):
+            instrucciones = resultado
+            estadisticas.update(cambios)
+    return (tuple(formatear(instr, tabla) for instr in instrucciones),
+            tuple(sorted((pasada, cambios) for pasada, cambios in estadisticas.items() if cambios)))
+
+
+def _saltos_entre_unidades(unidades):
+    """Etiquetas a las que salta alguna unidad que no las define."""
+    externas = set()
+    for unidad in unidades:
+        instrucciones, _ = analizar(unidad)
+        propias = {instr.etiqueta for instr in instrucciones if instr.tipo == ETIQUETA}
+        externas.update(instr.etiqueta for instr in instrucciones
+                        if instr.tipo in (GOTO, IFZ) and instr.etiqueta not in propias)
+    return frozenset(externas)
+
+
+def optimizar_unidades(unidades, nivel=NIVEL_POR_DEFECTO, estadisticas=None, perfil=None):
+    """
+    Optimiza las unidades de un programa (incluidas las de sus bibliotecas). Si la
+    traducción del programa no es exacta se devuelven sin cambios.
+
+    @param unidades: Lista de unidades TAC (tuplas de líneas), en el orden del programa
+    @param nivel: Nivel de optimización (ver NIVELES)
+    @param estadisticas: Counter opcional donde se suman los cambios por pasada
+    @param perfil: Diccionario opcional función -> llamadas ejecutadas (ver `expandir_llamadas`)
+    @return: Lista de unidades optimizadas
+    """
+    if nivel <= 0 or not traduccion_exacta(unidades):
+        return unidades
+    if nivel >= 2:
+        unidades = expandir_llamadas(unidades, estadisticas, perfil)
+    externas = _saltos_entre_unidades(unidades)
+    optimizadas = []
+    for unidad in unidades:
+        lineas, cambios = optimizar_unidad(unidad, nivel, externas)
+        optimizadas.append(lineas)
+        if estadisticas is not None:
+            estadisticas.update(dict(cambios))
+    return optimizadas
+
+
+if __name__ == "__main__":
+    import json
+    import sys
+
+    from src.TAC import dividir_unidades, leer_tac
+
+    # python -m src.optimizador [-O0|-O1|-O2] [--perfil perfil.json] <entrada.tac> [salida.tac]
+    # (el perfil es un objeto JSON función -> llamadas ejecutadas)
+    argumentos = sys.argv[1:]
+    nivel = NIVEL_POR_DEFECTO
+    perfil = None
+    while argumentos and argumentos[0].startswith("-"):
+        opcion = argumentos.pop(0)
+        if opcion in ("-O0", "-O1", "-O2"):
+            nivel = int(opcion[2:])
+        elif opcion == "--perfil" and argumentos:
+            with open(argumentos.pop(0), "r", encoding="utf-8") as archivo:
+                perfil = json.load(archivo)
+        else:
+            argumentos = []
+            break
+    if len(argumentos) not in (1, 2):
+        print("Uso: python -m src.optimizador [-O0|-O1|-O2] [--perfil perfil.json] "
+              "<entrada.tac> [salida.tac]")
+        sys.exit(1)
+    estadisticas = Counter()
+    unidades = optimizar_unidades(dividir_unidades(leer_tac(argumentos[0])), nivel, estadisticas,
+                                  perfil)
+    texto = "".join(f"{linea}\n" for unidad in unidades for linea in unidad)
+    if len(argumentos) == 2:
+        with open(argumentos[1], "w", encoding="utf-8") as salida:
+            salida.write(texto)
+    else:
+        sys.stdout.write(texto)
+    for pasada, cambios in sorted(estadisticas.items()):
+        print(f"{pasada}: {cambios}", file=sys.stderr)
@@ -0,0 +1,179 @@
+/**
+ * @archivo: servidor.h
+ * @descripción: Modo servidor compartido por las herramientas de la cadena
+ *               (preprocesador y compilador).
+ *
+ * Con la opción --servidor la herramienta no termina tras un archivo: atiende
+ * solicitudes por la entrada estándar hasta recibir EOF.
+ *
+ * @protocolo:
+ *   - Solicitud: "<longitud> [argumentos]\n" seguido de <longitud> bytes de datos
+ *   - Respuesta: "<estado> <longitud>\n" seguido de <longitud> bytes de resultado
+ *   - estado 0 indica éxito; cualquier otro valor, error (el resultado es el mensaje)
+ *
+ * @observaciones:
+ *   - El descriptor original de stdout queda reservado para las respuestas y
+ *     stdout se redirige a stderr, de modo que un printf de depuración no
+ *     corrompe el protocolo.
+ *   - Cada herramienta es responsable de reiniciar su estado global entre
+ *     solicitudes.
+ */
+#ifndef SERVIDOR_H
+#define SERVIDOR_H
+
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#ifdef _WIN32
+    #include <io.h>
+    #include <fcntl.h>
+    #define servidor_dup _dup
+    #define servidor_dup2 _dup2
+    #define servidor_fdopen _fdopen
+#else
+    #include <unistd.h>
+    #define servidor_dup dup
+    #define servidor_dup2 dup2
+    #define servidor_fdopen fdopen
+    // open_memstream evita archivos temporales para capturar la salida
+    #define SERVIDOR_MEMSTREAM 1
+#endif
+
+#define SERVIDOR_OPCION "--servidor"
+#define SERVIDOR_MAX_ARGUMENTOS 256
+
+/**
+ * @variable: servidor_canal
+ * @descripción: Flujo (stdout original) por el que se envían las respuestas
+ */
+static FILE *servidor_canal = NULL;
+
+#ifdef SERVIDOR_MEMSTREAM
+static char *servidor_buffer = NULL;
+static size_t servidor_tamano = 0;
+#endif
+
+/**
+ * @función: servidor_iniciar
+ * @descripción: Reserva el stdout original para el protocolo y redirige stdout a stderr
+ * @retorno: 0 si se pudo iniciar, 1 en caso de error
+ */
+static int servidor_iniciar(void) {
+    fflush(stdout);
+#ifdef _WIN32
+    _setmode(_fileno(stdin), _O_BINARY);
+    _setmode(_fileno(stdout), _O_BINARY);
+#endif
+    int descriptor = servidor_dup(fileno(stdout));
+    if (descriptor < 0) {
+        return 1;
+    }
+    servidor_canal = servidor_fdopen(descriptor, "wb");
+    if (!servidor_canal) {
+        return 1;
+    }
+    servidor_dup2(fileno(stderr), fileno(stdout));
+    return 0;
+}
+
+/**
+ * @función: servidor_leer_solicitud
+ * @descripción: Lee la siguiente solicitud de la entrada estándar
+ * @parámetros:
+ *   - longitud: Recibe el número de bytes de datos
+ *   - argumentos: Recibe el resto de la línea de cabecera (sin el salto de línea)
+ * @retorno: Datos de la solicitud terminados en '\0' (liberar con free),
+ *           o NULL al llegar a EOF o ante una cabecera inválida
+ */
+static char *servidor_leer_solicitud(size_t *longitud, char argumentos[SERVIDOR_MAX_ARGUMENTOS]) {
+    char cabecera[SERVIDOR_MAX_ARGUMENTOS + 32];
+    if (!fgets(cabecera, sizeof(cabecera), stdin)) {
+        return NULL;
+    }
+    cabecera[strcspn(cabecera, "\r\n")] = '\0';
+
+    char *resto = NULL;
+    unsigned long tamano = strtoul(cabecera, &resto, 10);
+    if (resto == cabecera) {
+        return NULL;
+    }
+    while (*resto == ' ') {
+        resto++;
+    }
+    strncpy(argumentos, resto, SERVIDOR_MAX_ARGUMENTOS - 1);
+    argumentos[SERVIDOR_MAX_ARGUMENTOS - 1] = '\0';
+
+    char *datos = malloc(tamano + 1);
+    if (!datos) {
+        return NULL;
+    }
+    if (fread(datos, 1, tamano, stdin) != tamano) {
+        free(datos);
+        return NULL;
+    }
+    datos[tamano] = '\0';
+    *longitud = tamano;
+    return datos;
+}
+
+/**
+ * @función: servidor_abrir_salida
+ * @descripción: Abre un flujo en memoria (o un temporal anónimo) para el resultado
+ * @retorno: Flujo de escritura que se entrega a servidor_responder
+ */
+static FILE *servidor_abrir_salida(void) {
+#ifdef SERVIDOR_MEMSTREAM
+    return open_memstream(&servidor_buffer, &servidor_tamano);
+#else
+    return tmpfile();
+#endif
+}
+
+/**
+ * @función: servidor_responder_bytes
+ * @descripción: Envía una respuesta con su cabecera
+ */
+static void servidor_responder_bytes(int estado, const char *datos, size_t longitud) {
+    fprintf(servidor_canal, "%d %lu\n", estado, (unsigned long)longitud);
+    if (longitud > 0) {
+        fwrite(datos, 1, longitud, servidor_canal);
+    }
+    fflush(servidor_canal);
+}
+
+/**
+ * @función: servidor_responder_texto
+ * @descripción: Envía una respuesta cuyo resultado es una cadena (p. ej. un error)
+ */
+static void servidor_responder_texto(int estado, const char *texto) {
+    servidor_responder_bytes(estado, texto, strlen(texto));
+}
+
+/**
+ * @función: servidor_responder
+ * @descripción: Envía como respuesta todo lo escrito en `salida` y cierra el flujo
+ * @parámetros:
+ *   - estado: Código de estado de la respuesta
+ *   - salida: Flujo obtenido con servidor_abrir_salida
+ */
+static void servidor_responder(int estado, FILE *salida) {
+#ifdef SERVIDOR_MEMSTREAM
+    fclose(salida);
+    servidor_responder_bytes(estado, servidor_buffer, servidor_tamano);
+    free(servidor_buffer);
+    servidor_buffer = NULL;
+    servidor_tamano = 0;
+#else
+    fflush(salida);
+    long tamano = ftell(salida);
+    rewind(salida);
+    char *datos = malloc(tamano > 0 ? tamano : 1);
+    size_t leidos = fread(datos, 1, tamano, salida);
+    servidor_responder_bytes(estado, datos, leidos);
+    free(datos);
+    fclose(salida);
+#endif
+}
+
+#endif /* SERVIDOR_H */
@@ -0,0 +1,197 @@
+"""
+Procesos persistentes para las herramientas de la cadena de compilación.
+
+En lugar de lanzar `compilados/preprocesador` y `compilados/compiler` en cada
+clic y pasar los datos por archivos temporales, cada herramienta se inicia una
+sola vez con `--servidor` y atiende solicitudes por sus tuberías estándar (ver
+`src/servidor.h`):
+
+    solicitud: b"<longitud> [argumentos]\\n" + datos
+    respuesta: b"<estado> <longitud>\\n" + resultado
+
+El supervisor reinicia el proceso si termina inesperadamente y repite la
+solicitud una vez (todas las solicitudes son idempotentes). Si se le da una
+`CacheCompilacion`, las respuestas exitosas se guardan por contenido y una
+solicitud repetida no llega a la herramienta.
+"""
+import os
+import subprocess
+import threading
+
+from src.cache import version_archivo
+
+# Nombre lógico -> ejecutable dentro del directorio de compilados
+HERRAMIENTAS = {
+    "preprocesador": "preprocesador",
+    "compilador": "compiler",
+}
+
+OPCION_SERVIDOR = "--servidor"
+
+
+class ErrorHerramienta(Exception):
+    """Error reportado por una herramienta o fallo de comunicación con ella."""
+    def __init__(self, herramienta, mensaje, estado=None):
+        super().__init__(f"{herramienta}: {mensaje}")
+        self.herramienta = herramienta
+        self.estado = estado
+
+
+class ServidorHerramienta:
+    """
+    Proceso de larga duración de una herramienta en modo servidor.
+    El proceso se inicia en la primera solicitud.
+    """
+    def __init__(self, nombre, ejecutable, reintentos=1):
+        self.nombre = nombre
+        self.ejecutable = ejecutable
+        self.reintentos = reintentos
+        self.proceso = None
+        self.reinicios = 0
+        self.lock = threading.Lock()
+
+    @property
+    def vivo(self):
+        return self.proceso is not None and self.proceso.poll() is None
+
+    def iniciar(self):
+        """Inicia el proceso (si no está vivo)."""
+        if self.vivo:
+            return
+        if self.proceso is not None:
+            self.reinicios += 1
+            self._liberar()
+        self.proceso = subprocess.Popen(
+            [self.ejecutable, OPCION_SERVIDOR],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            bufsize=0,
+        )
+
+    def detener(self):
+        """Cierra la entrada del proceso para que termine y espera su salida."""
+        if self.proceso is None:
+            return
+        try:
+            self.proceso.stdin.close()
+            self.proceso.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proceso.kill()
+            self.proceso.wait()
+        self._liberar()
+        self.proceso = None
+
+    def _liberar(self):
+        for flujo in (self.proceso.stdin, self.proceso.stdout):
+            try:
+                flujo.close()
+            except OSError:
+                pass
+
+    def _leer_exacto(self, cantidad):
+        partes = []
+        restante = cantidad
+        while restante > 0:
+            parte = self.proceso.stdout.read(restante)
+            if not parte:
+                raise EOFError("el proceso terminó durante la respuesta")
+            partes.append(parte)
+            restante -= len(parte)
+        return b"".join(partes)
+
+    def _intercambiar(self, datos, argumentos):
+        cabecera = str(len(datos))
+        if argumentos:
+            cabecera += " " + " ".join(str(argumento) for argumento in argumentos)
+        self.proceso.stdin.write(cabecera.encode("ascii") + b"\n" + datos)
+        self.proceso.stdin.flush()
+
+        linea = self.proceso.stdout.readline()
+        if not linea:
+            raise EOFError("el proceso terminó sin responder")
+        estado, longitud = (int(campo) for campo in linea.split())
+        return estado, self._leer_exacto(longitud)
+
+    def solicitar(self, texto, *argumentos):
+        """
+        Envía una solicitud y espera su respuesta.
+
+        @param texto: Datos de entrada (código fuente o código preprocesado)
+        @param argumentos: Argumentos de la cabecera
+        @return: Resultado de la herramienta como texto
+        @raises ErrorHerramienta: Si la herramienta responde con error o no se
+                                  pudo obtener respuesta tras los reintentos
+        """
+        datos = texto.encode("utf-8")
+        with self.lock:
+            for intento in range(self.reintentos + 1):
+                try:
+                    self.iniciar()
+                    estado, resultado = self._intercambiar(datos, argumentos)
+                    break
+                except (OSError, EOFError, ValueError) as e:
+                    # El proceso cayó (o respondió basura): se reinicia en el siguiente intento
+                    if self.proceso is not None and self.proceso.poll() is None:
+                        self.proceso.kill()
+                        self.proceso.wait()
+                    if intento == self.reintentos:
+                        raise ErrorHerramienta(self.nombre, f"sin respuesta ({e})") from e
+        resultado = resultado.decode("utf-8", errors="replace")
+        if estado != 0:
+            raise ErrorHerramienta(self.nombre, resultado, estado)
+        return resultado
+
+
+class SupervisorHerramientas:
+    """
+    Mantiene un servidor por herramienta y los reinicia cuando caen.
+    """
+    def __init__(self, directorio="./compilados", cache=None):
+        self.directorio = directorio
+        self.cache = cache
+        self.servidores = {}
+        self.ultimo_acierto = False  # Si la última solicitud se resolvió con la caché
+
+    def ruta(self, nombre):
+        ejecutable = os.path.join(self.directorio, HERRAMIENTAS[nombre])
+        if os.name != 'posix':
+            ejecutable += ".exe"
+        return ejecutable
+
+    def servidor(self, nombre):
+        servidor = self.servidores.get(nombre)
+        if servidor is None:
+            servidor = ServidorHerramienta(nombre, self.ruta(nombre))
+            self.servidores[nombre] = servidor
+        return servidor
+
+    def version(self, nombre):
+        """Versión del ejecutable de la herramienta (cambia al recompilarla)."""
+        return version_archivo(self.ruta(nombre))
+
+    def solicitar(self, nombre, texto, *argumentos, dependencias=""):
+        """
+        Envía una solicitud a la herramienta, consultando antes la caché.
+
+        @param nombre: Herramienta (clave de HERRAMIENTAS)
+        @param texto: Datos de entrada
+        @param argumentos: Argumentos de la cabecera
+        @param dependencias: Texto adicional que afecta el resultado sin ser parte de
+                             la entrada (p. ej. las bibliotecas importadas)
+        @return: Resultado de la herramienta como texto
+        """
+        servidor = self.servidor(nombre)
+        if self.cache is None:
+            self.ultimo_acierto = False
+            return servidor.solicitar(texto, *argumentos)
+        resultado, self.ultimo_acierto = self.cache.obtener_o_calcular(
+            nombre, self.version(nombre), texto,
+            lambda: servidor.solicitar(texto, *argumentos),
+            opciones=(*argumentos, dependencias))
+        return resultado
+
+    def detener(self):
+        """Detiene todos los servidores iniciados."""
+        for servidor in self.servidores.values():
+            servidor.detener()
+        self.servidores.clear()
@@ -0,0 +1,204 @@
+"""
+Representación intermedia (IR) tipada del TAC.
+
+El TAC se lee una sola vez como flujo de líneas: cada línea se divide en tokens y
+se convierte en una `Instruccion` con sus operandos resueltos a ids de una tabla de
+símbolos. Las pasadas del traductor (constantes, variables, etiquetas y código)
+recorren la IR sin volver a clasificar el texto.
+
+Forma de cada tipo de instrucción (d, a, b son ids de símbolos):
+
+    INICIO_FUNCION  begin_func f          etiqueta=f
+    FIN_FUNCION     end_func
+    PARAM           param a               operandos=(a,)
+    ETIQUETA        L1:                   etiqueta=L1
+    ASIGNACION      d = a                 destino=d, operandos=(a,)
+    OPERACION       d = a op b            destino=d, operandos=(a, b), operador=op (+ - * /)
+    COMPARACION     d = a op b            destino=d, operandos=(a, b), operador=op (== != < <= > >=)
+    LLAMADA         d = call f, n         destino=d, funcion=f, argumentos=n (texto)
+    EXPRESION       d = <otra expresión>  destino=d (la expresión no se traduce)
+    IFZ             ifz a goto L1         operandos=(a,), etiqueta=L1
+    GOTO            goto L1               etiqueta=L1
+    RETORNO         return a              operandos=(a,)
+    DESCONOCIDA     cualquier otra línea
+"""
+INICIO_FUNCION = "begin_func"
+FIN_FUNCION = "end_func"
+PARAM = "param"
+ETIQUETA = "etiqueta"
+ASIGNACION = "asignacion"
+OPERACION = "operacion"
+COMPARACION = "comparacion"
+LLAMADA = "llamada"
+EXPRESION = "expresion"
+IFZ = "ifz"
+GOTO = "goto"
+RETORNO = "return"
+DESCONOCIDA = "desconocida"
+
+# Operador aritmético -> mnemónico de la máquina virtual
+OPERADORES = {"+": "ADD", "-": "SUB", "*": "MUL", "/": "DIV"}
+COMPARADORES = {"==", "!=", "<", "<=", ">", ">="}
+
+# Tipos que asignan un valor a `destino`
+ASIGNACIONES = {ASIGNACION, OPERACION, COMPARACION, LLAMADA, EXPRESION}
+
+
+def es_literal(operando):
+    """Indica si un operando TAC es una constante numérica (entera o decimal)."""
+    return operando.replace('.', '', 1).isdigit()
+
+
+class TablaSimbolos:
+    """
+    Nombres (variables, temporales y constantes) de un fragmento de TAC. Cada nombre
+    distinto recibe un id consecutivo en el orden en que aparece.
+    """
+    def __init__(self):
+        self.nombres = []
+        self.literales = []  # id -> si el nombre es una constante numérica
+        self.ids = {}
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def id(self, nombre):
+        simbolo = self.ids.get(nombre)
+        if simbolo is None:
+            simbolo = self.ids[nombre] = len(self.nombres)
+            self.nombres.append(nombre)
+            self.literales.append(es_literal(nombre))
+        return simbolo
+
+
+class Instruccion:
+    """
+    Instrucción TAC tipada (ver la forma de cada tipo al inicio del archivo).
+    `texto` conserva la línea original para los mensajes y las instrucciones que no
+    se traducen.
+    """
+    __slots__ = ("tipo", "destino", "operandos", "operador", "etiqueta", "funcion",
+                 "argumentos", "texto")
+
+    def __init__(self, tipo, texto, destino=None, operandos=(), operador=None,
+                 etiqueta=None, funcion=None, argumentos=None):
+        self.tipo = tipo
+        self.texto = texto
+        self.destino = destino
+        self.operandos = operandos
+        self.operador = operador
+        self.etiqueta = etiqueta
+        self.funcion = funcion
+        self.argumentos = argumentos
+
+    def __repr__(self):
+        return f"Instruccion({self.tipo!r}, {self.texto!r})"
+
+
+def analizar_linea(linea, tabla):
+    """
+    Convierte una línea TAC (sin espacios al inicio ni al final) en una Instruccion.
+
+    @param linea: Línea TAC
+    @param tabla: TablaSimbolos donde se registran los operandos
+    @return: Instruccion
+    """
+    partes = linea.split()
+    cabeza = partes[0]
+    if cabeza == "begin_func":
+        return Instruccion(INICIO_FUNCION, linea, etiqueta=partes[1])
+    if cabeza == "end_func":
+        return Instruccion(FIN_FUNCION, linea)
+    if cabeza == "param":
+        return Instruccion(PARAM, linea, operandos=(tabla.id(partes[1]),))
+    if linea.startswith("L") and ":" in linea:
+        return Instruccion(ETIQUETA, linea, etiqueta=linea.split(":")[0])
+    if len(partes) >= 3 and partes[1] == "=":
+        destino = tabla.id(partes[0])
+        if len(partes) == 3:
+            return Instruccion(ASIGNACION, linea, destino, (tabla.id(partes[2]),))
+        if len(partes) == 5 and partes[3] in OPERADORES:
+            return Instruccion(OPERACION, linea, destino,
+                               (tabla.id(partes[2]), tabla.id(partes[4])), partes[3])
+        if len(partes) == 5 and partes[3] in COMPARADORES:
+            return Instruccion(COMPARACION, linea, destino,
+                               (tabla.id(partes[2]), tabla.id(partes[4])), partes[3])
+        if partes[2] == "call" and len(partes) == 5:
+            return Instruccion(LLAMADA, linea, destino, funcion=partes[3].rstrip(","),
+                               argumentos=partes[4])
+        return Instruccion(EXPRESION, linea, destino)
+    if cabeza == "ifz" and len(partes) == 4:
+        return Instruccion(IFZ, linea, operandos=(tabla.id(partes[1]),), etiqueta=partes[3])
+    if cabeza == "goto" and len(partes) == 2:
+        return Instruccion(GOTO, linea, etiqueta=partes[1])
+    if cabeza == "return" and len(partes) == 2:
+        return Instruccion(RETORNO, linea, operandos=(tabla.id(partes[1]),))
+    return Instruccion(DESCONOCIDA, linea)
+
+
+def analizar(lineas, tabla=None):
+    """
+    Lee un flujo de líneas TAC una sola vez y produce su IR.
+
+    @param lineas: Iterable de líneas TAC (se ignoran los espacios y las líneas vacías)
+    @param tabla: TablaSimbolos a completar (por defecto una nueva)
+    @return: Tupla (lista de Instruccion, TablaSimbolos)
+    """
+    if tabla is None:
+        tabla = TablaSimbolos()
+    instrucciones = []
+    for linea in lineas:
+        linea = linea.strip()
+        if linea:
+            instrucciones.append(analizar_linea(linea, tabla))
+    return instrucciones, tabla
+
+
+def formatear(instr, tabla):
+    """
+    Texto TAC de una instrucción (lo inverso de `analizar_linea`). Las instrucciones
+    leídas del TAC conservan su línea original.
+
+    @param instr: Instruccion
+    @param tabla: TablaSimbolos de sus operandos
+    @return: Línea TAC
+    """
+    if instr.texto is not None:
+        return instr.texto
+    nombres = tabla.nombres
+    tipo = instr.tipo
+    if tipo == ASIGNACION:
+        return f"{nombres[instr.destino]} = {nombres[instr.operandos[0]]}"
+    if tipo == OPERACION or tipo == COMPARACION:
+        izquierdo, derecho = instr.operandos
+        return f"{nombres[instr.destino]} = {nombres[izquierdo]} {instr.operador} {nombres[derecho]}"
+    if tipo == LLAMADA:
+        return f"{nombres[instr.destino]} = call {instr.funcion}, {instr.argumentos}"
+    if tipo == IFZ:
+        return f"ifz {nombres[instr.operandos[0]]} goto {instr.etiqueta}"
+    if tipo == GOTO:
+        return f"goto {instr.etiqueta}"
+    if tipo == RETORNO:
+        return f"return {nombres[instr.operandos[0]]}"
+    if tipo == PARAM:
+        return f"param {nombres[instr.operandos[0]]}"
+    if tipo == ETIQUETA:
+        return f"{instr.etiqueta}:"
+    if tipo == INICIO_FUNCION:
+        return f"begin_func {instr.etiqueta}"
+    if tipo == FIN_FUNCION:
+        return "end_func"
+    raise ValueError(f"La instrucción {tipo} no se puede escribir sin su texto original")
+
+
+def crear(tabla, tipo, destino=None, operandos=(), operador=None, etiqueta=None, funcion=None,
+          argumentos=None):
+    """
+    Crea una instrucción nueva (p. ej. en una optimización) con su texto TAC.
+
+    @return: Instruccion
+    """
+    instr = Instruccion(tipo, None, destino, tuple(operandos), operador, etiqueta, funcion,
+                        argumentos)
+    instr.texto = formatear(instr, tabla)
+    return instr
@@ -0,0 +1,154 @@
+"""
+Registro de tiempos de las etapas de la cadena de herramientas.
+
+Cada etapa (preprocesado, compilación, traducción, ensamblado, enlace, carga) se
+mide con `RegistroTiempos.medir` y deja un RegistroEtapa. Los registros se muestran
+como tabla (`reporte`), en una línea (`resumen`, para la barra de estado de la
+interfaz) o se exportan como JSON:
+
+    {"etapas": [{"etapa": "compilacion", "pared": 0.0123, "cpu": 0.0004,
+                 "entrada": 812, "salida": 1290, "aciertos": 0, "fallos": 1}, ...],
+     "total": {"pared": ..., "cpu": ...}}
+
+El tiempo de CPU es el del proceso que mide: el del preprocesador y el compilador,
+que corren como servidores en otros procesos (src/servidores.py), solo aparece en
+el tiempo real.
+"""
+import json
+import time
+from contextlib import contextmanager
+
+
+def tamano(valor):
+    """
+    Tamaño de una entrada o salida: caracteres de un texto o de una lista de líneas,
+    o cantidad de elementos de otra lista (palabras de memoria, módulos).
+    """
+    if valor is None:
+        return None
+    if isinstance(valor, str):
+        return len(valor)
+    if all(isinstance(elemento, str) for elemento in valor):
+        return sum(len(linea) + 1 for linea in valor)
+    return len(valor)
+
+
+class RegistroEtapa:
+    """
+    Medición de una ejecución de una etapa.
+
+    - etapa: nombre de la etapa
+    - pared: tiempo real transcurrido en segundos
+    - cpu: tiempo de CPU del proceso en segundos
+    - entrada / salida: tamaño de lo que recibe y produce (ver `tamano`), o None
+    - aciertos / fallos: consultas a la caché de compilación durante la etapa
+    """
+    __slots__ = ("etapa", "pared", "cpu", "entrada", "salida", "aciertos", "fallos")
+
+    def __init__(self, etapa, pared=0.0, cpu=0.0, entrada=None, salida=None, aciertos=0, fallos=0):
+        self.etapa = etapa
+        self.pared = pared
+        self.cpu = cpu
+        self.entrada = entrada
+        self.salida = salida
+        self.aciertos = aciertos
+        self.fallos = fallos
+
+    @property
+    def cache(self):
+        """"acierto" si todo vino de la caché, "fallo" si algo se calculó, None si no se consultó."""
+        if self.fallos:
+            return "fallo"
+        return "acierto" if self.aciertos else None
+
+    def como_dict(self):
+        return {campo: getattr(self, campo) for campo in self.__slots__}
+
+
+class RegistroTiempos:
+    """
+    Mediciones de las etapas en el orden en que terminaron.
+    """
+    def __init__(self, etapas=()):
+        self.etapas = list(etapas)
+
+    @contextmanager
+    def medir(self, etapa, entrada=None, cache=None):
+        """
+        Mide el bloque `with` como una ejecución de `etapa`; el registro se agrega
+        aunque el bloque lance una excepción. El bloque puede asignar `salida`.
+
+            with tiempos.medir("ensamblado", texto) as medicion:
+                binario = ensamblar_texto(texto)
+                medicion.salida = tamano(binario)
+
+        @param etapa: Nombre de la etapa
+        @param entrada: Lo que recibe la etapa (se guarda su tamaño)
+        @param cache: CacheCompilacion cuyas consultas se cuentan, o None
+        @return: Administrador de contexto que entrega el RegistroEtapa
+        """
+        medicion = RegistroEtapa(etapa, entrada=tamano(entrada))
+        aciertos, fallos = (cache.aciertos, cache.fallos) if cache is not None else (0, 0)
+        inicio_pared = time.perf_counter()
+        inicio_cpu = time.process_time()
+        try:
+            yield medicion
+        finally:
+            medicion.pared = time.perf_counter() - inicio_pared
+            medicion.cpu = time.process_time() - inicio_cpu
+            if cache is not None:
+                medicion.aciertos = cache.aciertos - aciertos
+                medicion.fallos = cache.fallos - fallos
+            self.etapas.append(medicion)
+
+    def olvidar(self, *etapas):
+        """Descarta las mediciones de las etapas indicadas (p. ej. antes de repetirlas)."""
+        self.etapas = [medicion for medicion in self.etapas if medicion.etapa not in etapas]
+
+    def por_etapa(self):
+        """Tiempo real por etapa en segundos (las ejecuciones repetidas se suman), en orden."""
+        tiempos = {}
+        for medicion in self.etapas:
+            tiempos[medicion.etapa] = tiempos.get(medicion.etapa, 0.0) + medicion.pared
+        return tiempos
+
+    @property
+    def pared(self):
+        return sum(medicion.pared for medicion in self.etapas)
+
+    @property
+    def cpu(self):
+        return sum(medicion.cpu for medicion in self.etapas)
+
+    def resumen(self):
+        """Una línea con el tiempo real de cada etapa en milisegundos y el total."""
+        partes = []
+        for medicion in self.etapas:
+            marca = f" ({medicion.cache})" if medicion.cache else ""
+            partes.append(f"{medicion.etapa} {medicion.pared * 1000:.1f} ms{marca}")
+        partes.append(f"total {self.pared * 1000:.1f} ms")
+        return " · ".join(partes)
+
+    def reporte(self):
+        """Tabla con todos los campos de cada medición (tiempos en milisegundos)."""
+        ancho = max([len("etapa")] + [len(medicion.etapa) for medicion in self.etapas])
+        lineas = [f"{'etapa':<{ancho}} {'real':>10} {'cpu':>10} {'entrada':>9} {'salida':>9} cache"]
+        for medicion in self.etapas:
+            entrada = "-" if medicion.entrada is None else medicion.entrada
+            salida = "-" if medicion.salida is None else medicion.salida
+            lineas.append(f"{medicion.etapa:<{ancho}} {medicion.pared * 1000:10.2f} "
+                          f"{medicion.cpu * 1000:10.2f} {entrada:>9} {salida:>9} "
+                          f"{medicion.cache or '-'}")
+        lineas.append(f"{'total':<{ancho}} {self.pared * 1000:10.2f} {self.cpu * 1000:10.2f}")
+        return "\n".join(lineas)
+
+    def como_dict(self):
+        return {"etapas": [medicion.como_dict() for medicion in self.etapas],
+                "total": {"pared": self.pared, "cpu": self.cpu}}
+
+    def a_json(self):
+        return json.dumps(self.como_dict(), indent=2)
+
+    def guardar(self, ruta):
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write(self.a_json())
@@ -435,8 +435,14 @@ class Ui_MainWindow(object):
         self.label_25.setAlignment(QtCore.Qt.AlignCenter)
         self.label_25.setObjectName("label_25")
         self.Compilar_button = QtWidgets.QPushButton(self.centralwidget)
-        self.Compilar_button.setGeometry(QtCore.QRect(20, 330, 241, 28))
+        self.Compilar_button.setGeometry(QtCore.QRect(20, 330, 171, 28))
         self.Compilar_button.setObjectName("Compilar_button")
+        self.nivel_optimizacion_box = QtWidgets.QComboBox(self.centralwidget)
+        self.nivel_optimizacion_box.setGeometry(QtCore.QRect(196, 330, 65, 28))
+        self.nivel_optimizacion_box.setObjectName("nivel_optimizacion_box")
+        self.nivel_optimizacion_box.addItem("")
+        self.nivel_optimizacion_box.addItem("")
+        self.nivel_optimizacion_box.addItem("")
         self.ensamblador_button = QtWidgets.QPushButton(self.centralwidget)
         self.ensamblador_button.setGeometry(QtCore.QRect(270, 170, 251, 28))
         self.ensamblador_button.setObjectName("ensamblador_button")
@@ -578,6 +584,10 @@ class Ui_MainWindow(object):
         self.preprocesar_button.setText(_translate("MainWindow", "Preprocesar"))
         self.label_25.setText(_translate("MainWindow", "Código Preprocesado"))
         self.Compilar_button.setText(_translate("MainWindow", "Siguiente paso"))
+        self.nivel_optimizacion_box.setToolTip(_translate("MainWindow", "Nivel de optimización del TAC"))
+        self.nivel_optimizacion_box.setItemText(0, _translate("MainWindow", "-O0"))
+        self.nivel_optimizacion_box.setItemText(1, _translate("MainWindow", "-O1"))
+        self.nivel_optimizacion_box.setItemText(2, _translate("MainWindow", "-O2"))
         self.ensamblador_button.setText(_translate("MainWindow", "Ensamblador"))
         self.label_26.setText(_translate("MainWindow", "Código Assembler"))
         self.Linker_button.setText(_translate("MainWindow", "Enlazador-Cargador"))
@@ -1,3 +1,5 @@
+from src.ensamblador import ensamblar
+
 #unidad de control
 ir = 0
 cp = 0
@@ -45,221 +47,12 @@ def actualizar_banderas(resultado):
         carry = 0
 
 def assembler_to_binary(instruction):
-    parts = instruction.split()
-    zero = 0
-
-    # Transferencia de Datos
-    if parts[0] == "LOAD":
-        # LOAD Rx, [mem]
-        rx = int(parts[1][1])  # Número del registro Rx
-        mem = 0
-        try:
-            mem = int(parts[2][1:-1], 16)  # Dirección de memoria (hexadecimal entre corchetes)
-            # La dirección de memoria debe ser un valor binario de 23 bits
-        except ValueError:
-            ry = 0
-            if parts[2][1:3] == "R0":
-                ry = 0
-            elif parts[2][1:3] == "R1":
-                ry = 1
-            elif parts[2][1:3] == "R2":
-                ry = 2
-            elif parts[2][1:3] == "R3":
-                ry = 3
-            return f"{'11101'}{rx:02b}{ry:02b}{mem:023b}"
-        # La dirección de memoria debe ser un valor binario de 23 bits
-        return f"{'00001'}{rx:02b}{zero:02b}{mem:023b}"
-
-    elif parts[0] == "STORE":
-        # STORE Rx, [mem]
-        rx = int(parts[1][1])  # Número del registro Rx
-        mem = 0
-        try:
-            mem = int(parts[2][1:-1], 16)  # Dirección de memoria (hexadecimal entre corchetes)
-        except ValueError:
-            ry = 0
-            if parts[2][1:3] == "R0":
-                ry = 0
-            elif parts[2][1:3] == "R1":
-                ry = 1
-            elif parts[2][1:3] == "R2":
-                ry = 2
-            elif parts[2][1:3] == "R3":
-                ry = 3
-            return f"{'11110'}{rx:02b}{ry:02b}{mem:023b}"
-        return f"{'00010'}{rx:02b}{zero:02b}{mem:023b}"
-
-    elif parts[0] == "MOVE":
-        # MOVE Rx, Ry
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        return f"{'00011'}{rx:02b}{ry:02b}{zero:023b}"
-
-    # Aritméticas
-    elif parts[0] == "ADD":
-        # ADD Rx, Ry, Rz
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        rz = int(parts[3][1])  # Número del registro Rz
-        return f"{'00100'}{rx:02b}{ry:02b}{rz:02b}{zero:021b}"
-
-    elif parts[0] == "SUB":
-        # SUB Rx, Ry, Rz
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        rz = int(parts[3][1])  # Número del registro Rz
-        return f"{'00101'}{rx:02b}{ry:02b}{rz:02b}{zero:021b}"
-
-    elif parts[0] == "MUL":
-        # MUL Rx, Ry, Rz
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        rz = int(parts[3][1])  # Número del registro Rz
-        return f"{'00110'}{rx:02b}{ry:02b}{rz:02b}{zero:021b}"
-
-    elif parts[0] == "DIV":
-        # DIV Rx, Ry, Rz
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        rz = int(parts[3][1])  # Número del registro Rz
-        return f"{'00111'}{rx:02b}{ry:02b}{rz:02b}{zero:021b}"
-
-    # Lógicas
-    elif parts[0] == "AND":
-        # AND Rx, Ry, Rz
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        rz = int(parts[3][1])  # Número del registro Rz
-        return f"{'01000'}{rx:02b}{ry:02b}{rz:02b}{zero:021b}"
-
-    elif parts[0] == "OR":
-        # OR Rx, Ry, Rz
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        rz = int(parts[3][1])  # Número del registro Rz
-        return f"{'01001'}{rx:02b}{ry:02b}{rz:02b}{zero:021b}"
-
-    elif parts[0] == "NOR":
-        # NOR Rx, Ry
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        return f"{'01010'}{rx:02b}{ry:02b}{zero:023b}"
-
-    elif parts[0] == "NOT":
-        # NOT Rx
-        rx = int(parts[1][1])  # Número del registro Rx
-        return f"{'01011'}{rx:02b}{zero:025b}"
-
-    # Desplazamientos y Rotaciones
-    elif parts[0] == "SHL":
-        # SHL Rx, Ry
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        return f"{'01100'}{rx:02b}{ry:02b}{zero:023b}"
-
-    elif parts[0] == "SHR":
-        # SHR Rx, Ry
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        return f"{'01101'}{rx:02b}{ry:02b}{zero:023b}"
-
-    elif parts[0] == "ROL":
-        # ROL Rx, Ry
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        return f"{'01110'}{rx:02b}{ry:02b}{zero:023b}"
-
-    elif parts[0] == "ROR":
-        # ROR Rx, Ry
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        return f"{'01111'}{rx:02b}{ry:02b}{zero:023b}"
-
-    # Control de Flujo
-    elif parts[0] == "JUMP":
-        # JUMP [mem]
-        mem = int(parts[1][1:-1], 16)  # Dirección de memoria (hexadecimal entre corchetes)
-        return f"{'10000'}{zero:04b}{mem:023b}"
-
-    elif parts[0] == "BEQ":
-        # BEQ Rx, Ry, [mem]
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        mem = int(parts[3][1:-1], 16)  # Dirección de memoria
-        return f"{'10001'}{rx:02b}{ry:02b}{mem:023b}"
-
-    elif parts[0] == "BNE":
-        # BNE Rx, Ry, [mem]
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        mem = int(parts[3][1:-1], 16)  # Dirección de memoria
-        return f"{'10010'}{rx:02b}{ry:02b}{mem:023b}"
-
-    elif parts[0] == "BLT":
-        # BLT Rx, Ry, [mem]
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        mem = int(parts[3][1:-1], 16)  # Dirección de memoria
-        return f"{'10011'}{rx:02b}{ry:02b}{mem:023b}"
-
-    elif parts[0] == "JLE":
-        # BGT Rx, Ry, [mem]
-        rx = int(parts[1][1])  # Número del registro Rx
-        ry = int(parts[2][1])  # Número del registro Ry
-        mem = int(parts[3][1:-1], 16)  # Dirección de memoria
-        return f"{'10100'}{rx:02b}{ry:02b}{mem:023b}"
-
-    # Instrucciones Especiales
-    elif parts[0] == "NOP":
-        # NOP
-        return "00000000000000000000000000000000"
-
-    elif parts[0] == "HALT":
-        # HALT
-        return "11111000000000000000000000000000"
-
-    elif parts[0] == "PUSH":
-        # PUSH Rx
-        rx = int(parts[1][1])  # Número del registro Rx
-        return f"{'10101'}{rx:02b}{zero:025b}"
-
-    elif parts[0] == "POP":
-        # POP Rx
-        rx = int(parts[1][1])  # Número del registro Rx
-        return f"{'10110'}{rx:02b}{zero:025b}"
-
-    elif parts[0] == "CALL":
-        # CALL [mem]
-        mem = int(parts[1][1:-1], 16)  # Dirección de memoria
-        return f"{'10111'}{zero:04b}{mem:023b}"
-
-    elif parts[0] == "RET":
-        # RET
-        return f"{'11000'}{zero:027b}"
-
-    # Entrada y salida
-    elif parts[0] == "IN":
-        # IN Rx
-        rx = int(parts[1][1])  # Número del registro Rx
-        return f"{'11001'}{rx:02b}{zero:025b}"
-
-    elif parts[0] == "OUT":
-        # OUT Rx
-        rx = int(parts[1][1])  # Número del registro Rx
-        return f"{'11010'}{rx:02b}{zero:025b}"
-
-    elif parts[0] == "CMP":
-      # CMP Rx, Ry
-      rx = int(parts[1][1])  # Número del registro Rx
-      ry = int(parts[2][1])  # Número del registro Ry
-      return f"{'11011'}{rx:02b}{ry:02b}{zero:023b}"
-
-    elif parts[0] == "CLR":
-      # CLR Rx
-      rx = int(parts[1][1])  # Número del registro Rx
-      return f"{'11100'}{rx:02b}{zero:025b}"
-
-    return parts[0]
+    # Misma codificación que el ensamblador de la cadena (src/ensamblador.py), con
+    # las direcciones resueltas desde 0: opcode, Rx, Ry, Rz y la dirección en ir[11:]
+    palabras = ensamblar(instruction).palabras_absolutas()
+    if not palabras or palabras[0] is None:
+        return instruction.split()[0]
+    return format(palabras[0], "032b")
 
 instructions = [
     "LOAD R1, [0x3F]",